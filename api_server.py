@@ -0,0 +1,325 @@
+# -*- coding: utf-8 -*-
+"""HTTP API for package predictions and roadmaps, for embedding outside Streamlit.
+
+Reuses the app's model loading (`predictor`), MCQ scoring (`question_store`) and
+cached roadmap generation (`roadmap`, `roadmap_cache`). The parent process binds
+the socket and forks `--workers` processes that accept on it; each loads the
+model once (the memory-mapped artifact is shared between them) and serves
+requests on threads. Dead workers are replaced.
+    python api_server.py --port 8000 --workers 4
+    ROADMAP_CACHE_PATH=roadmaps.sqlite python api_server.py   # share roadmaps across workers
+
+Endpoints (JSON in, JSON out):
+    GET  /healthz                 process is up
+    GET  /readyz                  model loaded (503 until then, or if loading failed)
+    GET  /questions?stream=&seed= the seeded MCQ assessment for `mcq_answers`
+    POST /predict                 {"cgpa", "college_tier", "mcq_score" | "mcq_answers", "skills"}
+    POST /predict/batch           {"students": [<predict body>, ...]}
+    POST /roadmap                 predict body + {"stream", "target_package_lpa", "time_left_months"}
+    GET  /metrics[?format=json]   span latencies of all processes sharing METRICS_DIR (Prometheus text)
+`mcq_answers` is {"stream", "seed", "answers": {category: [option text or null, ...]}}; `skills`
+is a comma-separated string or a list of names. A plain `mcq_score` out of `total_questions`
+(default 20) is rescaled to the 0-20 range the model was trained on.
+"""
+
+import argparse
+import json
+import os
+import signal
+import sys
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from urllib.parse import parse_qs, urlsplit
+
+import metrics
+from predictor import Predictor
+from question_store import MCQS_PER_CATEGORY, QuestionStore, score_answer_texts
+from roadmap import generate_roadmap, roadmap_args_for, roadmap_client_from_env
+from roadmap_cache import RoadmapRequest, cache_from_env
+
+MAX_BODY_BYTES = 8 * 1024 * 1024
+MAX_BATCH = 10_000
+
+
+class RequestError(Exception):
+    """A request the API rejects, with the HTTP status to answer."""
+
+    def __init__(self, status, message):
+        super().__init__(message)
+        self.status = status
+
+
+# --- Per-Worker Services ---
+
+class ApiServices:
+    """Model, question store, LLM client and roadmap cache for one worker process."""
+
+    def __init__(self):
+        self.predictor = None
+        self.question_store = QuestionStore()
+        self.llm_client = None
+        self.roadmap_cache = None
+        self.load_error = None
+        self.ready = threading.Event()
+
+    def load(self):
+        try:
+            self.predictor = Predictor.load()
+            self.llm_client = roadmap_client_from_env()
+            self.roadmap_cache = cache_from_env()
+            self.ready.set()
+        except Exception as e:
+            self.load_error = f"{type(e).__name__}: {e}"
+
+    def require_ready(self):
+        if not self.ready.is_set():
+            raise RequestError(503, self.load_error or "model is still loading")
+
+    # --- Request Parsing ---
+
+    def mcq_score(self, body):
+        """(score, total questions) from `mcq_score` or scored `mcq_answers`."""
+        if 'mcq_answers' in body:
+            attempt = body['mcq_answers']
+            if not isinstance(attempt, dict) or not isinstance(attempt.get('answers'), dict):
+                raise RequestError(400, "mcq_answers must be an object with an 'answers' object")
+            if not all(isinstance(texts, list) for texts in attempt['answers'].values()):
+                raise RequestError(400, "mcq_answers.answers must map each category to a list of answers")
+            banks = self.question_store.assessment(attempt['stream'], MCQS_PER_CATEGORY, int(attempt['seed']))
+            if not banks:
+                raise RequestError(404, f"no questions for stream {attempt['stream']!r}")
+            try:
+                score = score_answer_texts(banks, attempt['answers'])
+            except KeyError as e:
+                raise RequestError(400, f"no {e.args[0]!r} questions for stream {attempt['stream']!r}")
+            return score, sum(len(bank) for bank in banks.values())
+        score = int(body['mcq_score'])
+        total = int(body.get('total_questions', 2 * MCQS_PER_CATEGORY))
+        if total < 1:
+            raise RequestError(400, "total_questions must be at least 1")
+        if not 0 <= score <= total:
+            raise RequestError(400, f"mcq_score must be between 0 and {total}")
+        return score, total
+
+    def student(self, body, mcq=None):
+        """(cgpa, college_tier, mcq_score, skills) for the model, validated; `mcq` is a scored `mcq_score(body)`."""
+        cgpa = float(body['cgpa'])
+        if not 0.0 <= cgpa <= 10.0:
+            raise RequestError(400, "cgpa must be between 0 and 10")
+        college_tier = body['college_tier']
+        if college_tier not in self.predictor.schema.tier_mapping:
+            raise RequestError(400, f"college_tier must be one of {sorted(self.predictor.schema.tier_mapping)}")
+        skills = body.get('skills', '')
+        if not isinstance(skills, str):
+            skills = [str(skill) for skill in skills]
+        return cgpa, college_tier, self.predictor.schema.model_mcq_score(*(mcq or self.mcq_score(body))), skills
+
+    # --- Endpoints ---
+
+    def predict(self, body):
+        self.require_ready()
+        mcq_score, total_questions = self.mcq_score(body)
+        cgpa, college_tier, model_mcq_score, skills = self.student(body, (mcq_score, total_questions))
+        if isinstance(skills, str):
+            _, unknown = self.predictor.schema.parse_skills(skills)
+        else:
+            unknown = [s for s in skills if self.predictor.schema.skill_feature_index(s) is None]
+        return {'expected_package_lpa': self.predictor.predict(cgpa, college_tier, model_mcq_score, skills),
+                'mcq_score': mcq_score, 'unknown_skills': unknown}
+
+    def predict_batch(self, body):
+        self.require_ready()
+        students = body['students']
+        if len(students) > MAX_BATCH:
+            raise RequestError(413, f"at most {MAX_BATCH} students per batch")
+        parsed = []
+        for i, student in enumerate(students):
+            try:
+                parsed.append(self.student(student))
+            except RequestError as e:
+                raise RequestError(e.status, f"students[{i}]: {e}")
+        return {'expected_package_lpa': self.predictor.predict_batch(parsed).tolist()}
+
+    def roadmap(self, body):
+        self.require_ready()
+        mcq_score, total_questions = self.mcq_score(body)
+        skills = body.get('skills', '')
+        if not isinstance(skills, str):
+            skills = ', '.join(map(str, skills))
+        expected = body.get('expected_package_lpa')
+        if expected is None:
+            expected = self.predict(body)['expected_package_lpa']
+        request = RoadmapRequest(body['stream'], mcq_score, skills, float(expected),
+                                 float(body['target_package_lpa']), int(body['time_left_months']), total_questions)
+        roadmap = self.roadmap_cache.get_or_create(
+            request, lambda r: generate_roadmap(self.llm_client, **roadmap_args_for(r)))
+        return {'roadmap': roadmap, 'expected_package_lpa': expected}
+
+    def questions(self, query):
+        stream = query['stream'][0]
+        seed = int(query['seed'][0]) if 'seed' in query else int.from_bytes(os.urandom(4), 'little') >> 1
+        banks = self.question_store.assessment(stream, MCQS_PER_CATEGORY, seed)
+        if not banks:
+            raise RequestError(404, f"no questions for stream {stream!r}")
+        return {'stream': stream, 'seed': seed,
+                'questions': {category: [{'question': q.question, 'options': list(q.options)} for q in bank]
+                              for category, bank in banks.items()}}
+
+
+# --- HTTP ---
+
+class ApiHandler(BaseHTTPRequestHandler):
+    server_version = 'CareerNavigatorAPI/1.0'
+    protocol_version = 'HTTP/1.1' # Keep-alive for portal backends and the load test
+
+    def log_message(self, format, *args):
+        if self.server.access_log:
+            super().log_message(format, *args)
+
+    def _send(self, status, data, content_type):
+        self.send_response(status)
+        self.send_header('Content-Type', content_type)
+        self.send_header('Content-Length', str(len(data)))
+        self.end_headers()
+        self.wfile.write(data)
+
+    def _send_json(self, status, body):
+        self._send(status, json.dumps(body).encode('utf-8'), 'application/json')
+
+    def _read_json(self):
+        length = int(self.headers.get('Content-Length', 0))
+        if length > MAX_BODY_BYTES:
+            raise RequestError(413, f"request body over {MAX_BODY_BYTES} bytes")
+        try:
+            body = json.loads(self.rfile.read(length) or b'{}')
+        except ValueError as e:
+            raise RequestError(400, f"invalid JSON: {e}")
+        if not isinstance(body, dict):
+            raise RequestError(400, "request body must be a JSON object")
+        return body
+
+    def _dispatch(self, name, handle):
+        try:
+            with metrics.span(f'api.{name}'):
+                body = handle()
+            self._send_json(200, body)
+        except RequestError as e:
+            self._send_json(e.status, {'error': str(e)})
+        except KeyError as e:
+            self._send_json(400, {'error': f"missing field {e.args[0]!r}"})
+        except (TypeError, ValueError) as e:
+            self._send_json(400, {'error': str(e)})
+        except Exception as e:
+            self._send_json(500, {'error': f"{type(e).__name__}: {e}"})
+
+    def do_GET(self):
+        services = self.server.services
+        url = urlsplit(self.path)
+        if url.path == '/healthz':
+            self._send_json(200, {'status': 'ok', 'pid': os.getpid()})
+        elif url.path == '/readyz':
+            ready = services.ready.is_set()
+            self._send_json(200 if ready else 503, {'ready': ready, 'pid': os.getpid(), 'error': services.load_error})
+        elif url.path == '/questions':
+            self._dispatch('questions', lambda: services.questions(parse_qs(url.query)))
+        elif url.path == '/metrics':
+            self._send_metrics(parse_qs(url.query).get('format', ['prometheus'])[0])
+        else:
+            self._send_json(404, {'error': 'not found'})
+
+    def do_POST(self):
+        services = self.server.services
+        routes = {'/predict': services.predict, '/predict/batch': services.predict_batch, '/roadmap': services.roadmap}
+        handle = routes.get(urlsplit(self.path).path)
+        if handle is None:
+            self._send_json(404, {'error': 'not found'})
+            return
+        self._dispatch(handle.__name__, lambda: handle(self._read_json()))
+
+    def _send_metrics(self, format):
+        if not metrics.enabled():
+            self._send_json(404, {'error': 'metrics are disabled; set METRICS_DIR'})
+            return
+        metrics.flush() # Include this worker's latest spans; other workers flush every FLUSH_SECONDS
+        if format == 'json':
+            self._send_json(200, metrics.export_json())
+        else:
+            self._send(200, metrics.export_prometheus().encode('utf-8'), 'text/plain; version=0.0.4')
+
+
+def run_worker(server):
+    """Loads the services in the background (see /readyz) and serves until killed."""
+    server.services = ApiServices()
+    threading.Thread(target=server.services.load, daemon=True).start()
+    server.serve_forever()
+
+
+def serve(host='127.0.0.1', port=8000, workers=1, access_log=False):
+    """Binds once, then serves from `workers` forked processes (in-process when 1 or without fork)."""
+    server = ThreadingHTTPServer((host, port), ApiHandler)
+    server.daemon_threads = True
+    server.access_log = access_log
+    print(f"Career Navigator API on http://{host}:{server.server_address[1]} ({workers} worker(s))", flush=True)
+    if workers <= 1 or not hasattr(os, 'fork'):
+        try:
+            run_worker(server)
+        except KeyboardInterrupt:
+            pass
+        return
+
+    children = set()
+    stopping = False
+
+    def spawn():
+        pid = os.fork()
+        if pid == 0:
+            signal.signal(signal.SIGINT, signal.SIG_DFL)
+            signal.signal(signal.SIGTERM, signal.SIG_DFL)
+            try:
+                run_worker(server)
+            finally:
+                os._exit(0)
+        children.add(pid)
+
+    def stop(signum, frame):
+        nonlocal stopping
+        stopping = True
+        for pid in children:
+            try:
+                os.kill(pid, signal.SIGTERM)
+            except ProcessLookupError:
+                pass
+
+    signal.signal(signal.SIGINT, stop)
+    signal.signal(signal.SIGTERM, stop)
+    for _ in range(workers):
+        spawn()
+    while children:
+        try:
+            pid, status = os.wait()
+        except ChildProcessError:
+            break
+        except InterruptedError:
+            continue
+        children.discard(pid)
+        if not stopping:
+            print(f"Worker {pid} exited with status {status}; starting a replacement", file=sys.stderr, flush=True)
+            time.sleep(0.5) # Don't spin if workers die on startup
+            spawn()
+    server.server_close()
+
+
+def main():
+    parser = argparse.ArgumentParser(description="HTTP API for package predictions and roadmaps.")
+    parser.add_argument('--host', default='127.0.0.1')
+    parser.add_argument('--port', type=int, default=8000)
+    parser.add_argument('--workers', type=int, default=os.cpu_count() or 1,
+                        help="Worker processes, each with its own copy of the services.")
+    parser.add_argument('--access-log', action='store_true')
+    args = parser.parse_args()
+    serve(args.host, args.port, args.workers, args.access_log)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,107 @@
+# -*- coding: utf-8 -*-
+"""Streamlit MCQ assessment component.
+
+A session's attempt is one small `AssessmentState` in session state: the sampled
+banks (shared, immutable MCQs) and one int8 answer vector per bank. Each radio
+writes its option index into that vector from an `on_change` callback, so a rerun
+does no per-question bookkeeping, and bank scores are only recomputed for banks
+whose answers changed since the last score. The questions render inside a
+fragment: answering reruns just the assessment, not the whole page. Banks longer
+than `per_page` questions are paginated, and only the current page's widgets
+are built.
+"""
+
+import zlib
+
+import streamlit as st
+
+from question_bank import UNANSWERED
+
+QUESTIONS_PER_PAGE = 10
+STATE_KEY = 'assessment_state'
+
+
+class AssessmentState:
+    """One attempt's sampled banks, int8 answers and cached per-bank scores."""
+
+    __slots__ = ('attempt', 'banks', 'answers', 'scores', 'dirty')
+
+    def __init__(self, attempt, banks):
+        self.attempt = attempt # (stream, seed)
+        self.banks = banks # {category: QuestionBank}
+        self.answers = {category: bank.empty_answers() for category, bank in banks.items()}
+        self.scores = dict.fromkeys(banks, 0) # Nothing answered yet
+        self.dirty = set()
+
+    @property
+    def widget_prefix(self):
+        """Widget key prefix, new for every attempt so old radio values never leak into it."""
+        return f"mcq_{zlib.crc32(repr(self.attempt).encode('utf-8')):08x}"
+
+    @property
+    def total_questions(self):
+        return sum(len(bank) for bank in self.banks.values())
+
+    def set_answer(self, category, i, option_index):
+        answers = self.answers[category]
+        if answers[i] != option_index:
+            answers[i] = option_index
+            self.dirty.add(category)
+
+    def score(self, category=None):
+        """Correct answers in one bank, or in all of them; only changed banks are re-graded."""
+        for changed in self.dirty:
+            self.scores[changed] = self.banks[changed].score(self.answers[changed])
+        self.dirty.clear()
+        return self.scores[category] if category is not None else sum(self.scores.values())
+
+    def answered(self):
+        return sum(int((answers != UNANSWERED).sum()) for answers in self.answers.values())
+
+
+def assessment_state(question_store, stream, k, seed):
+    """This session's AssessmentState, sampling a new attempt when the stream or seed changes."""
+    state = st.session_state.get(STATE_KEY)
+    if state is None or state.attempt != (stream, seed):
+        state = AssessmentState((stream, seed), question_store.assessment(stream, k, seed))
+        st.session_state[STATE_KEY] = state
+    return state
+
+
+def _record_answer(widget_key, category, i):
+    state = st.session_state[STATE_KEY]
+    mcq = state.banks[category][i]
+    state.set_answer(category, i, mcq.option_index(st.session_state[widget_key]))
+
+
+def _render_bank(state, category, per_page):
+    bank = state.banks[category]
+    answers = state.answers[category]
+    prefix = f"{state.widget_prefix}_{category}"
+    start, stop = 0, len(bank)
+    n_pages = -(-len(bank) // per_page)
+    if n_pages > 1:
+        page = st.selectbox("Questions", range(n_pages), key=f"{prefix}_page",
+                            format_func=lambda p: f"{p * per_page + 1}-{min((p + 1) * per_page, len(bank))} "
+                                                  f"of {len(bank)}")
+        start, stop = page * per_page, min((page + 1) * per_page, len(bank))
+    for i in range(start, stop):
+        mcq = bank[i]
+        widget_key = f"{prefix}_{i}"
+        st.radio(
+            f"{i+1}. {mcq.question}",
+            options=mcq.options,
+            key=widget_key,
+            index=None if answers[i] == UNANSWERED else int(answers[i]), # Restores the answer on a revisited page
+            on_change=_record_answer,
+            args=(widget_key, category, i),
+        )
+
+
+@st.fragment
+def render_assessment(state, titles, per_page=QUESTIONS_PER_PAGE):
+    """Renders each bank under `titles[category]`; answering reruns only this fragment."""
+    for category in state.banks:
+        st.subheader(titles.get(category, state.banks[category].name))
+        _render_bank(state, category, per_page)
+    st.caption(f"Answered {state.answered()}/{state.total_questions}")
@@ -0,0 +1,178 @@
+# -*- coding: utf-8 -*-
+"""Batch scoring CLI for bulk candidate files.
+
+Streams a CSV or Parquet file of students in chunks, encodes each chunk through
+the saved feature schema, predicts it and appends the predictions to the output
+file, so memory stays flat regardless of input size:
+    python batch_score.py students.csv scored.csv --n-jobs 4
+    python batch_score.py students.parquet scored.parquet --chunk-size 100000
+
+Expected input columns (names configurable): CGPA, College_Tier ('Tier 1'..'Tier 3'),
+MCQ_Score (total out of 20) and Skills (comma-separated, e.g. "Python, SQL, AWS").
+With METRICS_DIR set, per-chunk read/encode/predict/write times are recorded
+(see metrics.py).
+"""
+
+import argparse
+import os
+import sys
+import time
+
+import numpy as np
+
+import metrics
+from feature_schema import FEATURE_SCHEMA_PATH, FeatureSchema
+
+MODEL_PATH = 'package_predictor_model.pkl'
+DEFAULT_CHUNK_SIZE = 50_000
+PREDICTION_COLUMN = 'Predicted_Package_LPA'
+
+
+# --- Input / Output ---
+
+def file_format(path):
+    ext = os.path.splitext(path)[1].lower()
+    if ext in ('.parquet', '.pq'):
+        return 'parquet'
+    if ext in ('.csv', '.txt', '.gz'):
+        return 'csv'
+    raise ValueError(f"Unsupported file type for {path!r}; use .csv or .parquet")
+
+
+def iter_chunks(path, chunk_size, dtype=None):
+    """Yields the input as pandas DataFrames of at most `chunk_size` rows.
+
+    `dtype` pins CSV column types ({column: type}); otherwise each chunk infers its
+    own, and e.g. an all-empty text column comes back as float64.
+    """
+    import pandas as pd
+
+    if file_format(path) == 'parquet':
+        import pyarrow.parquet as pq
+
+        for batch in pq.ParquetFile(path).iter_batches(batch_size=chunk_size):
+            yield batch.to_pandas()
+    else:
+        yield from pd.read_csv(path, chunksize=chunk_size, dtype=dtype)
+
+
+class ChunkWriter:
+    """Appends scored chunks to a CSV or Parquet file as they are produced."""
+
+    def __init__(self, path):
+        self.path = path
+        self.format = file_format(path)
+        self._parquet_writer = None
+        self._wrote_header = False
+
+    def write(self, df):
+        if self.format == 'parquet':
+            import pyarrow as pa
+            import pyarrow.parquet as pq
+
+            table = pa.Table.from_pandas(df, preserve_index=False)
+            if self._parquet_writer is None:
+                self._parquet_writer = pq.ParquetWriter(self.path, table.schema)
+            else:
+                # The first chunk fixes the file schema; later chunks may have inferred other types
+                table = table.cast(self._parquet_writer.schema)
+            self._parquet_writer.write_table(table)
+        else:
+            df.to_csv(self.path, mode='a' if self._wrote_header else 'w',
+                      header=not self._wrote_header, index=False)
+            self._wrote_header = True
+
+    def close(self):
+        if self._parquet_writer is not None:
+            self._parquet_writer.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+
+# --- Encoding ---
+
+def skill_matrix(schema, skills):
+    """Vectorized one-hot of a Series of comma-separated skill strings, shape (N, n_skills)."""
+    matrix = np.zeros((len(skills), len(schema.skills)), dtype=np.uint8)
+    token_lists = skills.fillna('').astype(str).str.split(',')
+    # Row position of every token (the chunk's own index need not start at 0)
+    rows = np.repeat(np.arange(len(skills)), token_lists.str.len().to_numpy())
+    # Only a chunk's distinct spellings go through the skill parser
+    codes, uniques = token_lists.explode().fillna('').str.strip().factorize()
+    positions = np.array(schema.skill_parser.resolve_many(uniques), dtype=np.intp)[codes]
+    known = positions >= 0
+    matrix[rows[known], positions[known]] = 1
+    return matrix
+
+
+def encode_chunk(schema, df, args):
+    return schema.encode_batch(
+        df[args.cgpa_column].to_numpy(dtype=np.float32),
+        schema.tier_values(df[args.tier_column].astype(str).str.strip().to_numpy()),
+        df[args.mcq_column].to_numpy(dtype=np.float32),
+        skill_matrix(schema, df[args.skills_column]),
+    )
+
+
+# --- Scoring ---
+
+def parse_args(argv=None):
+    parser = argparse.ArgumentParser(description="Score a CSV/Parquet file of students with the package predictor.")
+    parser.add_argument('input', help="Input .csv or .parquet file.")
+    parser.add_argument('output', help="Output .csv or .parquet file (input columns + predictions).")
+    parser.add_argument('--model', default=MODEL_PATH)
+    parser.add_argument('--schema', default=FEATURE_SCHEMA_PATH)
+    parser.add_argument('--chunk-size', type=int, default=DEFAULT_CHUNK_SIZE)
+    parser.add_argument('--n-jobs', type=int, default=1,
+                        help="Cores used for prediction (-1 for all).")
+    parser.add_argument('--cgpa-column', default='CGPA')
+    parser.add_argument('--tier-column', default='College_Tier')
+    parser.add_argument('--mcq-column', default='MCQ_Score')
+    parser.add_argument('--skills-column', default='Skills')
+    return parser.parse_args(argv)
+
+
+def main(argv=None):
+    args = parse_args(argv)
+
+    import joblib
+
+    with metrics.span('batch.load'):
+        model = joblib.load(args.model)
+        schema = FeatureSchema.load(args.schema)
+    if model.n_features_in_ != schema.n_features:
+        sys.exit(f"Error: {args.model} expects {model.n_features_in_} features but {args.schema} "
+                 f"defines {schema.n_features}; re-run 'prepare_model_data.py'.")
+    # RandomForest predicts its trees on a thread pool of this size
+    model.set_params(n_jobs=args.n_jobs)
+
+    total_rows = 0
+    start = time.perf_counter()
+    with ChunkWriter(args.output) as writer:
+        chunks = iter_chunks(args.input, args.chunk_size, dtype={args.tier_column: str, args.skills_column: str})
+        while True:
+            with metrics.span('batch.read'):
+                df = next(chunks, None)
+            if df is None:
+                break
+            with metrics.span('batch.encode'):
+                X = encode_chunk(schema, df, args)
+            with metrics.span('batch.predict'):
+                df[PREDICTION_COLUMN] = model.predict(X).round(2)
+            with metrics.span('batch.write'):
+                writer.write(df)
+            total_rows += len(df)
+            elapsed = time.perf_counter() - start
+            print(f"  scored {total_rows:,} rows ({total_rows / elapsed:,.0f} rows/s)", file=sys.stderr)
+
+    elapsed = time.perf_counter() - start
+    print(f"Scored {total_rows:,} rows in {elapsed:.2f}s ({total_rows / max(elapsed, 1e-9):,.0f} rows/s) "
+          f"-> {args.output}")
+
+
+if __name__ == '__main__':
+    main()
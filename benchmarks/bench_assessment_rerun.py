@@ -0,0 +1,121 @@
+# -*- coding: utf-8 -*-
+"""MCQ assessment: rerun time and per-session answer state, component vs. the old dict loop.
+
+Renders the same sampled banks two ways under Streamlit's AppTest: "dicts" is the
+previous page code (every rerun re-renders every radio, rewrites two answer
+dicts and re-grades both banks), "component" is `assessment_ui` (int8 answers
+written by callbacks, cached scores, paginated banks). Reports the median time of
+a rerun that changes nothing and of answering one question (a fragment rerun for
+the component; AppTest reruns the whole page, so that column overstates its cost),
+plus the pickled size of the session's answer state with every question answered.
+    python benchmarks/bench_assessment_rerun.py --questions 10,200
+"""
+
+import argparse
+import os
+import pickle
+import statistics
+import sys
+import tempfile
+import textwrap
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+STREAM = 'Computer Science Engineering (CSE)'
+
+PAGE_HEADER = f'''
+import sys
+sys.path.insert(0, {os.path.dirname(os.path.dirname(os.path.abspath(__file__)))!r})
+import streamlit as st
+from question_bank import UNANSWERED
+from question_store import QuestionStore
+
+N_QUESTIONS = __N__
+
+@st.cache_resource
+def banks(n):
+    # Questions repeated up to n per bank so large banks can be simulated
+    from question_bank import QuestionBank
+    store = QuestionStore()
+    out = {{}}
+    for category in ('domain', 'coding_dsa'):
+        bank = store.load({STREAM!r}, category)
+        out[category] = QuestionBank(bank.name, category, (bank[i % len(bank)] for i in range(n)))
+    return out
+'''
+
+DICTS_PAGE = '''
+for category, bank in banks(N_QUESTIONS).items():
+    user_answers = st.session_state.setdefault(f"mcq_answers_{category}", {})
+    answers = bank.empty_answers()
+    st.subheader(bank.name)
+    for i, mcq in enumerate(bank):
+        choice = st.radio(f"{i+1}. {mcq.question}", options=mcq.options, key=f"{bank.key}_q_{i}",
+                          index=user_answers.get(f"q_{i}_{bank.key}_idx", None))
+        answers[i] = mcq.option_index(choice)
+        user_answers[f"q_{i}_{bank.key}"] = choice
+        user_answers[f"q_{i}_{bank.key}_idx"] = None if answers[i] == UNANSWERED else int(answers[i])
+    st.session_state[f"score_{category}"] = bank.score(answers)
+'''
+
+COMPONENT_PAGE = '''
+from assessment_ui import STATE_KEY, AssessmentState, render_assessment
+if STATE_KEY not in st.session_state:
+    st.session_state[STATE_KEY] = AssessmentState(('bench', 0), banks(N_QUESTIONS))
+state = st.session_state[STATE_KEY]
+render_assessment(state, {})
+score = state.score()
+'''
+
+
+def median_ms(fn, repeat):
+    times = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        fn()
+        times.append(time.perf_counter() - start)
+    return statistics.median(times) * 1e3
+
+
+def answer_state_bytes(at, variant):
+    if variant == 'component':
+        state = at.session_state['assessment_state']
+        return len(pickle.dumps((state.answers, state.scores)))
+    return len(pickle.dumps({key: at.session_state[key] for key in ('mcq_answers_domain', 'mcq_answers_coding_dsa')}))
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('--questions', default='10,200', help="Questions per bank, comma-separated.")
+    parser.add_argument('--repeat', type=int, default=9)
+    args = parser.parse_args()
+    from streamlit.testing.v1 import AppTest
+
+    print(f"{'questions':>9} {'variant':<10} {'rerun ms':>9} {'answer ms':>10} {'state bytes':>12}")
+    with tempfile.TemporaryDirectory() as tmp:
+        for n in map(int, args.questions.split(',')):
+            for variant, body in (('dicts', DICTS_PAGE), ('component', COMPONENT_PAGE)):
+                path = os.path.join(tmp, f'{variant}_{n}.py')
+                with open(path, 'w', encoding='utf-8') as f:
+                    f.write(textwrap.dedent(PAGE_HEADER).replace('__N__', str(n)) + textwrap.dedent(body))
+                at = AppTest.from_file(path, default_timeout=120)
+                at.run()
+                rerun = median_ms(at.run, args.repeat)
+                options = [radio.options for radio in at.radio]
+                answer_times = []
+                for k in range(args.repeat):
+                    radio = at.radio[k % len(at.radio)]
+                    radio.set_value(options[k % len(options)][k % 2])
+                    start = time.perf_counter()
+                    at.run()
+                    answer_times.append(time.perf_counter() - start)
+                for i, radio in enumerate(at.radio): # Answer everything visible for the state size
+                    radio.set_value(options[i][0])
+                at.run()
+                print(f"{n:>9} {variant:<10} {rerun:9.1f} {statistics.median(answer_times) * 1e3:10.1f} "
+                      f"{answer_state_bytes(at, variant):12,}")
+
+
+if __name__ == '__main__':
+    main()
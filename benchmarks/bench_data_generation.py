@@ -0,0 +1,51 @@
+# -*- coding: utf-8 -*-
+"""Benchmark: row-wise `apply` data generation vs. the vectorized chunked generator.
+
+Run from the repository root:
+    python benchmarks/bench_data_generation.py --rowwise-rows 20000 --vectorized-rows 10000000
+"""
+
+import argparse
+import os
+import sys
+import time
+
+import numpy as np
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from synthetic_data import generate_dataframe_rowwise, iter_synthetic_chunks  # noqa: E402
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('--rowwise-rows', type=int, default=20_000)
+    parser.add_argument('--vectorized-rows', type=int, default=10_000_000)
+    parser.add_argument('--chunk-size', type=int, default=1_000_000)
+    parser.add_argument('--seed', type=int, default=42)
+    args = parser.parse_args()
+
+    np.random.seed(args.seed)
+    start = time.perf_counter()
+    df_rowwise = generate_dataframe_rowwise(args.rowwise_rows)
+    rowwise_secs = time.perf_counter() - start
+    rowwise_rate = args.rowwise_rows / rowwise_secs
+
+    rng = np.random.default_rng(args.seed)
+    package_sum = 0.0
+    start = time.perf_counter()
+    for chunk in iter_synthetic_chunks(rng, args.vectorized_rows, args.chunk_size):
+        package_sum += float(chunk['Package_LPA'].sum())
+    vectorized_secs = time.perf_counter() - start
+    vectorized_rate = args.vectorized_rows / vectorized_secs
+
+    print(f"row-wise apply : {args.rowwise_rows:>12,} rows in {rowwise_secs:8.2f}s -> {rowwise_rate:>14,.0f} rows/s")
+    print(f"vectorized     : {args.vectorized_rows:>12,} rows in {vectorized_secs:8.2f}s -> {vectorized_rate:>14,.0f} rows/s")
+    print(f"speedup        : {vectorized_rate / rowwise_rate:,.0f}x")
+    # Same generating process, so the target distributions should agree closely
+    print(f"mean Package_LPA: row-wise {df_rowwise['Package_LPA'].mean():.3f}, "
+          f"vectorized {package_sum / args.vectorized_rows:.3f}")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,53 @@
+# -*- coding: utf-8 -*-
+"""Memory per row: pandas training frame + float features vs. the columnar dataset store.
+
+Measures a sample and extrapolates to `--target-rows`. Run from the repository root:
+    python benchmarks/bench_dataset_memory.py --rows 1000000 --target-rows 50000000
+"""
+
+import argparse
+import os
+import sys
+import tempfile
+
+import numpy as np
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from dataset_store import ColumnarDataset, generate_dataset  # noqa: E402
+from feature_schema import FeatureSchema  # noqa: E402
+from synthetic_data import COMMON_SKILLS, generate_dataframe  # noqa: E402
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('--rows', type=int, default=1_000_000)
+    parser.add_argument('--target-rows', type=int, default=50_000_000)
+    parser.add_argument('--seed', type=int, default=42)
+    args = parser.parse_args()
+    schema = FeatureSchema(COMMON_SKILLS)
+
+    # Previous pipeline: one DataFrame, plus the float feature matrix sliced out of it
+    df = generate_dataframe(np.random.default_rng(args.seed), args.rows)
+    X = schema.encode_batch(df['CGPA'].to_numpy(), schema.tier_values(df['College_Tier'].to_numpy()),
+                            df['MCQ_Score'].to_numpy(), df[list(schema.skill_columns)].to_numpy())
+    frame_bytes = df.memory_usage(deep=True).sum() + X.nbytes
+
+    with tempfile.TemporaryDirectory() as directory:
+        generate_dataset(np.random.default_rng(args.seed), args.rows, schema, directory)
+        dataset = ColumnarDataset.open(directory)
+        # Same generating stream, so the stored features must match the frame's exactly
+        assert np.array_equal(dataset.features(schema), X)
+        assert np.allclose(dataset.target(), df['Package_LPA'].to_numpy(), atol=1e-5)
+        store_bytes = dataset.nbytes
+        del dataset
+
+    scale = args.target_rows / args.rows
+    print(f"pandas frame + features: {frame_bytes / args.rows:6.1f} B/row -> "
+          f"{frame_bytes * scale / 1e9:6.2f} GB in RAM for {args.target_rows:,} rows")
+    print(f"columnar store         : {store_bytes / args.rows:6.1f} B/row -> "
+          f"{store_bytes * scale / 1e9:6.2f} GB on disk (memory-mapped)")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,85 @@
+# -*- coding: utf-8 -*-
+"""Startup import cost of the serving entry points, measured with `python -X importtime`.
+
+Imports what the Streamlit app imports at the top of its script (read from the
+source, so new imports are picked up) and the HTTP API in fresh interpreters,
+reports the median import time and the most expensive top-level imports, and
+fails if serving pulls in a training-only or launcher module (pandas,
+scikit-learn, joblib, pyngrok, ...) or exceeds --max-ms. Run from anywhere:
+    python benchmarks/bench_import_time.py
+    python benchmarks/bench_import_time.py --repeat 7 --max-ms 1500
+"""
+
+import argparse
+import ast
+import os
+import statistics
+import subprocess
+import sys
+
+REPO = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+APP_PATH = os.path.join(REPO, 'script_to_prepare_dummy_data_and_train_model.py')
+# Never needed to serve: training and batch-only libraries, and the tunnel
+FORBIDDEN = ('pandas', 'sklearn', 'scipy', 'joblib', 'pyarrow', 'pyngrok')
+
+
+def app_imports():
+    """Modules the app script imports at module level."""
+    with open(APP_PATH, 'r', encoding='utf-8') as f:
+        tree = ast.parse(f.read())
+    modules = []
+    for node in tree.body:
+        if isinstance(node, ast.Import):
+            modules += [alias.name for alias in node.names]
+        elif isinstance(node, ast.ImportFrom) and node.level == 0:
+            modules.append(node.module)
+    return modules
+
+
+def import_profile(modules):
+    """(total ms, {module: cumulative ms} for top-level imports, set of all imported modules)."""
+    code = '; '.join(f'import {m}' for m in modules)
+    result = subprocess.run([sys.executable, '-X', 'importtime', '-c', code], cwd=REPO,
+                            capture_output=True, text=True)
+    if result.returncode != 0:
+        raise SystemExit(f"importing {modules} failed:\n{result.stderr[-2000:]}")
+    total_us, top, imported = 0, {}, set()
+    for line in result.stderr.splitlines():
+        if not line.startswith('import time:') or 'cumulative' in line:
+            continue
+        self_us, cumulative_us, name = line[len('import time:'):].split('|')
+        total_us += int(self_us)
+        imported.add(name.strip())
+        if not name.startswith('  '): # Imported directly by this code, not by another module
+            top[name.strip()] = int(cumulative_us) / 1e3
+    return total_us / 1e3, top, imported
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('--repeat', type=int, default=5)
+    parser.add_argument('--top', type=int, default=8)
+    parser.add_argument('--max-ms', type=float, help="Fail if a target's median import time exceeds this.")
+    args = parser.parse_args()
+
+    targets = {'streamlit app': app_imports(), 'api_server': ['api_server']}
+    failures = []
+    for label, modules in targets.items():
+        runs = [import_profile(modules) for _ in range(args.repeat)]
+        median = statistics.median(total for total, _, _ in runs)
+        _, top, imported = runs[-1]
+        print(f"{label}: {median:.0f} ms median over {args.repeat} runs, {len(imported)} modules")
+        for name, ms in sorted(top.items(), key=lambda item: -item[1])[:args.top]:
+            print(f"  {ms:8.1f} ms  {name}")
+        leaked = sorted({name for name in imported if name.split('.')[0] in FORBIDDEN})
+        if leaked:
+            failures.append(f"{label} imports {', '.join(leaked[:10])}")
+        if args.max_ms is not None and median > args.max_ms:
+            failures.append(f"{label} takes {median:.0f} ms to import (budget {args.max_ms:.0f} ms)")
+    if failures:
+        raise SystemExit("FAIL: " + '; '.join(failures))
+    print("OK: no training-only modules imported at startup")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,46 @@
+# -*- coding: utf-8 -*-
+"""Cold start: unpickling the scikit-learn model vs. memory-mapping the serving artifact.
+
+Each load runs in a fresh interpreter, as a new Streamlit server process would,
+and includes the imports it needs. Run from the directory holding the artifacts:
+    python /path/to/benchmarks/bench_model_load.py --runs 5
+"""
+
+import argparse
+import os
+import statistics
+import subprocess
+import sys
+
+REPO = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+LOADERS = {
+    'pickle + export': (
+        "import joblib; from tree_engine import export_forest; "
+        "forest = export_forest(joblib.load({model!r}))"),
+    'mmap artifact': (
+        "from model_artifact import load_artifact; "
+        "forest, schema, meta = load_artifact({artifact!r})"),
+}
+
+TIMED = ("import sys, time; sys.path.insert(0, {repo!r}); start = time.perf_counter(); {body}; "
+         "print(time.perf_counter() - start)")
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('--model', default='package_predictor_model.pkl')
+    parser.add_argument('--artifact', default='package_predictor_model')
+    parser.add_argument('--runs', type=int, default=5)
+    args = parser.parse_args()
+
+    for name, body in LOADERS.items():
+        code = TIMED.format(repo=REPO, body=body.format(model=args.model, artifact=args.artifact))
+        secs = [float(subprocess.check_output([sys.executable, '-c', code], text=True)) for _ in range(args.runs)]
+        print(f"{name:<16}: median {statistics.median(secs) * 1e3:8.1f} ms over {args.runs} fresh processes")
+    print(f"artifact size   : {sum(e.stat().st_size for e in os.scandir(args.artifact)) / 1e6:.1f} MB "
+          f"(pickle {os.path.getsize(args.model) / 1e6:.1f} MB)")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,101 @@
+# -*- coding: utf-8 -*-
+"""Prediction table: hit rate and latency against the flat-forest model.
+
+Builds tables for each --max-skills from the trained model in the current
+directory and replays a sampled input distribution. The "app" distribution is an
+assumption about what students type (CGPA on the 0.1 input grid around 7.6,
+mostly 0-3 skills, popular skills more likely); "training" is the synthetic
+generator's own distribution (each skill a coin flip). Run from the directory
+holding the trained artifacts:
+    python /path/to/benchmarks/bench_prediction_table.py --max-skills 1,2,3
+"""
+
+import argparse
+import os
+import sys
+import time
+
+import numpy as np
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from predictor import MODEL_PATH, Predictor, load_model  # noqa: E402
+from prediction_table import PredictionTable  # noqa: E402
+from synthetic_data import COLLEGE_TIERS, generate_chunk  # noqa: E402
+
+# Assumed app traffic: how many skills students list, and which skills are popular
+SKILL_COUNT_PROBS = [0.15, 0.25, 0.25, 0.15, 0.10, 0.05, 0.05] # 0..6 skills
+POPULAR_SKILLS = {'Python': 6, 'Java': 5, 'SQL': 4, 'DSA': 4, 'Web Development': 3,
+                  'Machine Learning': 3, 'C++': 3, 'Algorithms': 3}
+
+
+def app_inputs(rng, n, schema):
+    cgpa = np.clip(np.round(rng.normal(7.6, 0.9, n), 1), 5.0, 10.0)
+    tiers = rng.choice(COLLEGE_TIERS, size=n, p=[0.2, 0.45, 0.35])
+    mcq = rng.binomial(20, 0.55, n)
+    weights = np.array([POPULAR_SKILLS.get(skill, 1) for skill in schema.skills], dtype=float)
+    skills = np.zeros((n, len(schema.skills)), dtype=np.uint8)
+    for i, k in enumerate(rng.choice(len(SKILL_COUNT_PROBS), size=n, p=SKILL_COUNT_PROBS)):
+        skills[i, rng.choice(len(schema.skills), size=k, replace=False, p=weights / weights.sum())] = 1
+    return schema.encode_batch(cgpa, schema.tier_values(tiers), mcq, skills)
+
+
+def training_inputs(rng, n, schema):
+    chunk = generate_chunk(rng, n)
+    skills = np.column_stack([chunk[column] for column in schema.skill_columns])
+    return schema.encode_batch(chunk['CGPA'], schema.tier_values(chunk['College_Tier']), chunk['MCQ_Score'], skills)
+
+
+def single_row_p50(predictor, X, calls):
+    latencies = np.empty(calls)
+    for i in range(calls):
+        row = X[i % len(X):i % len(X) + 1]
+        start = time.perf_counter()
+        predictor.predict_rows(row)
+        latencies[i] = time.perf_counter() - start
+    return np.percentile(latencies, 50) * 1e6
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('--max-skills', default='1,2')
+    parser.add_argument('--rows', type=int, default=20_000)
+    parser.add_argument('--single-calls', type=int, default=2_000)
+    parser.add_argument('--seed', type=int, default=0)
+    args = parser.parse_args()
+
+    forest, schema = load_model()
+    builder = forest
+    if os.path.exists(MODEL_PATH):
+        import joblib
+
+        builder = joblib.load(MODEL_PATH) # Faster for the large build batches; same predictions
+    rng = np.random.default_rng(args.seed)
+    distributions = {'app': app_inputs(rng, args.rows, schema), 'training': training_inputs(rng, args.rows, schema)}
+
+    baseline = Predictor(forest, schema)
+    expected = {name: baseline.predict_rows(X) for name, X in distributions.items()}
+    p50_model = single_row_p50(baseline, distributions['app'], args.single_calls)
+    print(f"model only      : single-row p50 {p50_model:7.1f} us")
+
+    for max_skills in map(int, args.max_skills.split(',')):
+        start = time.perf_counter()
+        table = PredictionTable.build(builder, schema, max_skills)
+        build_secs = time.perf_counter() - start
+        predictor = Predictor(forest, schema, table)
+        print(f"\nmax_skills={max_skills}: {table}, {table.values.nbytes / 1e6:.1f} MB, built in {build_secs:.1f}s")
+        for name, X in distributions.items():
+            _, hit = table.lookup(X)
+            actual = predictor.predict_rows(X)
+            assert np.allclose(actual, expected[name], atol=1e-5), "table disagrees with the model"
+            start = time.perf_counter()
+            predictor.predict_rows(X)
+            batch_secs = time.perf_counter() - start
+            print(f"  {name:<9}: hit rate {hit.mean():6.1%}, batch of {len(X):,} in {batch_secs * 1e3:7.1f} ms")
+        hits = distributions['app'][table.lookup(distributions['app'])[1]]
+        print(f"  single-row p50 on hits {single_row_p50(predictor, hits, args.single_calls):7.1f} us, "
+              f"app mix {single_row_p50(predictor, distributions['app'], args.single_calls):7.1f} us")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,57 @@
+# -*- coding: utf-8 -*-
+"""Time-to-first-content: blocking roadmap generation vs. streaming.
+
+Uses the local stub server, which waits `--delay` before answering and then
+streams one section every `--chunk-delay` seconds. Run from the repository root:
+    python benchmarks/bench_roadmap_streaming.py --delay 0.3 --chunk-delay 0.4
+"""
+
+import argparse
+import os
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from llm_client import GeminiBackend, LLMClient  # noqa: E402
+from llm_stub_server import start_stub_server  # noqa: E402
+from roadmap import generate_roadmap, stream_roadmap  # noqa: E402
+
+ROADMAP_ARGS = dict(stream="Computer Science Engineering (CSE)", mcq_score=12, total_questions=20,
+                    strengths_input_str="Python, SQL", expected_package_lpa="8-10", target_package_lpa=12.0,
+                    time_left_months=12)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('--delay', type=float, default=0.3)
+    parser.add_argument('--chunk-delay', type=float, default=0.4)
+    args = parser.parse_args()
+
+    server = start_stub_server(delay=args.delay, chunk_delay=args.chunk_delay)
+    client = LLMClient(GeminiBackend(base_url=server.url), timeout=10.0)
+
+    # Blocking: nothing can be shown until the whole response is in.
+    # The non-streaming stub endpoint answers at once after `delay`, so emulate
+    # a real model's generation time by draining the stream before rendering.
+    start = time.perf_counter()
+    full = ''.join(stream_roadmap(client, **ROADMAP_ARGS))
+    blocking_secs = time.perf_counter() - start
+    assert full.strip() == generate_roadmap(client, **ROADMAP_ARGS).strip()
+
+    start = time.perf_counter()
+    first = None
+    pieces = 0
+    for _ in stream_roadmap(client, **ROADMAP_ARGS):
+        pieces += 1
+        if first is None:
+            first = time.perf_counter() - start
+    total = time.perf_counter() - start
+
+    print(f"blocking : first content after {blocking_secs:.2f}s (full roadmap)")
+    print(f"streaming: first content after {first:.2f}s, {pieces} sections, complete after {total:.2f}s")
+    server.shutdown()
+
+
+if __name__ == '__main__':
+    main()
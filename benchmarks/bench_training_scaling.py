@@ -0,0 +1,65 @@
+# -*- coding: utf-8 -*-
+"""Training wall-clock scaling from 1 to N cores (RandomForest `n_jobs`).
+
+Every run uses the same seeded data and forest seed, so the fitted models must be
+identical whatever the core count. Run from the repository root:
+    python benchmarks/bench_training_scaling.py --rows 200000 --n-estimators 50
+"""
+
+import argparse
+import os
+import sys
+import time
+
+import numpy as np
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from dataset_store import generate_dataset  # noqa: E402
+from feature_schema import FeatureSchema  # noqa: E402
+from prepare_model_data import seed_streams  # noqa: E402
+from synthetic_data import COMMON_SKILLS  # noqa: E402
+
+
+def core_counts(max_cores):
+    counts = [1]
+    while counts[-1] * 2 < max_cores:
+        counts.append(counts[-1] * 2)
+    if max_cores > 1:
+        counts.append(max_cores)
+    return counts
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('--rows', type=int, default=200_000)
+    parser.add_argument('--n-estimators', type=int, default=50)
+    parser.add_argument('--max-cores', type=int, default=os.cpu_count() or 1)
+    parser.add_argument('--seed', type=int, default=42)
+    args = parser.parse_args()
+
+    from sklearn.ensemble import RandomForestRegressor
+
+    schema = FeatureSchema(COMMON_SKILLS)
+    data_rng, _, forest_seed = seed_streams(args.seed)
+    dataset = generate_dataset(data_rng, args.rows, schema)
+    X, y = dataset.features(schema), dataset.target()
+    X_check = X[:1000]
+
+    print(f"{args.rows:,} rows, {args.n_estimators} trees, {os.cpu_count()} CPUs visible")
+    baseline = reference = None
+    for n_jobs in core_counts(args.max_cores):
+        model = RandomForestRegressor(n_estimators=args.n_estimators, random_state=forest_seed, n_jobs=n_jobs)
+        start = time.perf_counter()
+        model.fit(X, y)
+        secs = time.perf_counter() - start
+        predictions = model.predict(X_check)
+        if reference is None:
+            baseline, reference = secs, predictions
+        assert np.array_equal(predictions, reference), "model differs across core counts"
+        print(f"n_jobs={n_jobs:<3d}: {secs:7.2f}s  speedup {baseline / secs:5.2f}x  "
+              f"efficiency {baseline / secs / n_jobs:6.1%}")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,82 @@
+# -*- coding: utf-8 -*-
+"""Benchmark: RandomForestRegressor.predict vs. the flattened FlatForest engine.
+
+Checks that both give the same predictions, then times single-row latency
+(what one click in the app pays) and a large batch. Run from the repository root
+after `python prepare_model_data.py`:
+    python benchmarks/bench_tree_engine.py --batch-rows 100000
+The same equivalence is checked without trained artifacts by tests/test_tree_engine.py.
+"""
+
+import argparse
+import os
+import sys
+import time
+
+import numpy as np
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from feature_schema import FEATURE_SCHEMA_PATH, FeatureSchema  # noqa: E402
+from synthetic_data import generate_chunk  # noqa: E402
+from tree_engine import export_forest  # noqa: E402
+
+
+def percentiles_us(samples):
+    p50, p99 = np.percentile(np.asarray(samples) * 1e6, [50, 99])
+    return f"p50 {p50:9.1f}us  p99 {p99:9.1f}us"
+
+
+def time_single_row(predict, rows):
+    samples = []
+    for row in rows:
+        start = time.perf_counter()
+        predict(row)
+        samples.append(time.perf_counter() - start)
+    return samples
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('--model', default='package_predictor_model.pkl')
+    parser.add_argument('--schema', default=FEATURE_SCHEMA_PATH)
+    parser.add_argument('--batch-rows', type=int, default=100_000)
+    parser.add_argument('--single-calls', type=int, default=300)
+    parser.add_argument('--seed', type=int, default=0)
+    args = parser.parse_args()
+
+    import joblib
+
+    model = joblib.load(args.model)
+    schema = FeatureSchema.load(args.schema)
+
+    start = time.perf_counter()
+    forest = export_forest(model)
+    print(f"exported {forest} in {(time.perf_counter() - start) * 1e3:.1f}ms")
+
+    chunk = generate_chunk(np.random.default_rng(args.seed), args.batch_rows)
+    X = schema.encode_batch(chunk['CGPA'], schema.tier_values(chunk['College_Tier']), chunk['MCQ_Score'],
+                            np.column_stack([chunk[c] for c in schema.skill_columns]))
+
+    # --- Equivalence ---
+    expected = model.predict(X)
+    actual = forest.predict(X)
+    max_err = float(np.max(np.abs(expected - actual)))
+    assert np.allclose(expected, actual, rtol=1e-9, atol=1e-9), f"FlatForest diverges from model.predict: {max_err}"
+    print(f"equivalence    : {len(X):,} rows match model.predict (max abs diff {max_err:.2e})")
+
+    # --- Single row ---
+    rows = [X[i:i + 1] for i in range(min(args.single_calls, len(X)))]
+    print(f"single sklearn : {percentiles_us(time_single_row(model.predict, rows))}")
+    print(f"single flat    : {percentiles_us(time_single_row(forest.predict, rows))}")
+
+    # --- Batch ---
+    for name, predict in (('sklearn', model.predict), ('flat', forest.predict)):
+        start = time.perf_counter()
+        predict(X)
+        secs = time.perf_counter() - start
+        print(f"batch {name:<9}: {len(X):,} rows in {secs:6.3f}s -> {len(X) / secs:>12,.0f} rows/s")
+
+
+if __name__ == '__main__':
+    main()
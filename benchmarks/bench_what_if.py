@@ -0,0 +1,61 @@
+# -*- coding: utf-8 -*-
+"""What-if panel: one batched forest pass vs. one prediction per scenario.
+
+Scores a student's scenario grid with `what_if` (one `predict_trees` call over
+every scenario, plus per-tree bands) and with a loop of single-row predictions
+(what one interactive tweak per rerun costs today), checks that both give the
+same estimates, and reports the latency of each. Run from the directory holding
+the trained artifacts:
+    python /path/to/benchmarks/bench_what_if.py --students 200
+"""
+
+import argparse
+import os
+import sys
+import time
+
+import numpy as np
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from predictor import Predictor  # noqa: E402
+from what_if import scenario_grid, what_if  # noqa: E402
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('--students', type=int, default=200)
+    parser.add_argument('--seed', type=int, default=0)
+    args = parser.parse_args()
+
+    predictor = Predictor.load(table_path='') # Model only, so both paths walk the same trees
+    schema = predictor.schema
+    rng = np.random.default_rng(args.seed)
+    tiers = list(schema.tier_mapping)
+    batched, looped, n_scenarios = [], [], 0
+    for _ in range(args.students):
+        skills = list(rng.choice(schema.skills, size=rng.integers(0, 5), replace=False))
+        student = (round(float(rng.uniform(5.0, 10.0)), 1), tiers[rng.integers(len(tiers))],
+                   int(rng.integers(0, 21)), skills)
+
+        start = time.perf_counter()
+        result = what_if(predictor.model, schema, *student)
+        batched.append(time.perf_counter() - start)
+
+        X, _, _ = scenario_grid(schema, *student)
+        start = time.perf_counter()
+        expected = np.array([predictor.predict_rows(X[i:i + 1])[0] for i in range(len(X))])
+        looped.append(time.perf_counter() - start)
+
+        assert np.allclose(result.mean, expected, atol=1e-9), "batched estimates differ from per-row predictions"
+        assert (result.low <= result.mean + 1e-9).all() and (result.mean <= result.high + 1e-9).all()
+        n_scenarios += len(result)
+
+    print(f"{args.students} students, {n_scenarios / args.students:.1f} scenarios each "
+          f"({predictor.model.n_trees} trees); estimates identical")
+    print(f"  one pass (what_if) : median {np.median(batched) * 1e3:7.2f} ms per student, with bands")
+    print(f"  one call/scenario  : median {np.median(looped) * 1e3:7.2f} ms per student")
+
+
+if __name__ == '__main__':
+    main()
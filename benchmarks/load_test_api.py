@@ -0,0 +1,133 @@
+# -*- coding: utf-8 -*-
+"""Load test for api_server.py: throughput and tail latency of /predict and /predict/batch.
+
+Starts a local server (run from the directory holding the trained artifacts), or
+targets a running one with --url. Each client thread keeps one HTTP/1.1
+connection open and sends requests back to back for --duration seconds:
+    python /path/to/benchmarks/load_test_api.py --workers 2 --concurrency 16 --duration 10
+    python benchmarks/load_test_api.py --url http://127.0.0.1:8000
+"""
+
+import argparse
+import http.client
+import json
+import os
+import socket
+import subprocess
+import sys
+import threading
+import time
+from urllib.parse import urlsplit
+
+import numpy as np
+
+REPO = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, REPO)
+
+from synthetic_data import COLLEGE_TIERS, COMMON_SKILLS  # noqa: E402
+
+
+def random_student(rng):
+    skills = rng.choice(COMMON_SKILLS, size=rng.integers(0, 6), replace=False)
+    return {'cgpa': round(float(rng.uniform(6, 10)), 1), 'college_tier': str(rng.choice(COLLEGE_TIERS)),
+            'mcq_score': int(rng.integers(0, 21)), 'skills': ', '.join(skills)}
+
+
+def free_port():
+    with socket.socket() as s:
+        s.bind(('127.0.0.1', 0))
+        return s.getsockname()[1]
+
+
+def wait_ready(url, timeout=60.0):
+    parts = urlsplit(url)
+    deadline = time.monotonic() + timeout
+    while time.monotonic() < deadline:
+        try:
+            conn = http.client.HTTPConnection(parts.hostname, parts.port, timeout=2)
+            conn.request('GET', '/readyz')
+            if conn.getresponse().status == 200:
+                return
+        except OSError:
+            pass
+        time.sleep(0.2)
+    raise RuntimeError(f"{url} did not become ready within {timeout:.0f}s")
+
+
+def client_loop(url, endpoint, make_body, deadline, latencies, errors):
+    parts = urlsplit(url)
+    conn = http.client.HTTPConnection(parts.hostname, parts.port, timeout=30)
+    headers = {'Content-Type': 'application/json'}
+    while time.perf_counter() < deadline:
+        body = json.dumps(make_body())
+        start = time.perf_counter()
+        try:
+            conn.request('POST', endpoint, body, headers)
+            response = conn.getresponse()
+            response.read()
+            ok = response.status == 200
+        except OSError:
+            conn.close()
+            ok = False
+        latencies.append(time.perf_counter() - start)
+        if not ok:
+            errors.append(1)
+
+
+def run(url, endpoint, make_body, concurrency, duration):
+    latencies, errors = [], []
+    deadline = time.perf_counter() + duration
+    threads = [threading.Thread(target=client_loop, args=(url, endpoint, make_body, deadline, latencies, errors))
+               for _ in range(concurrency)]
+    for t in threads:
+        t.start()
+    for t in threads:
+        t.join()
+    return np.array(latencies), len(errors)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('--url', help="Target a running server instead of starting one.")
+    parser.add_argument('--workers', type=int, default=os.cpu_count() or 1)
+    parser.add_argument('--concurrency', type=int, default=16)
+    parser.add_argument('--duration', type=float, default=10.0, help="Seconds per endpoint.")
+    parser.add_argument('--batch-size', type=int, default=100)
+    parser.add_argument('--seed', type=int, default=42)
+    args = parser.parse_args()
+
+    server = None
+    url = args.url
+    if url is None:
+        port = free_port()
+        server = subprocess.Popen([sys.executable, os.path.join(REPO, 'api_server.py'), '--port', str(port),
+                                   '--workers', str(args.workers)], stdout=subprocess.DEVNULL)
+        url = f"http://127.0.0.1:{port}"
+    try:
+        wait_ready(url)
+        rng = np.random.default_rng(args.seed)
+        lock = threading.Lock()
+
+        def one():
+            with lock:
+                return random_student(rng)
+
+        def batch():
+            with lock:
+                return {'students': [random_student(rng) for _ in range(args.batch_size)]}
+
+        print(f"{url}: {args.concurrency} connections, {args.duration:.0f}s per endpoint")
+        for endpoint, make_body, rows in (('/predict', one, 1), ('/predict/batch', batch, args.batch_size)):
+            latencies, n_errors = run(url, endpoint, make_body, args.concurrency, args.duration)
+            p50, p95, p99 = np.percentile(latencies, [50, 95, 99]) * 1e3
+            rps = len(latencies) / args.duration
+            print(f"{endpoint:<15}: {rps:8.1f} req/s ({rps * rows:10,.0f} predictions/s)  "
+                  f"p50 {p50:7.1f} ms  p95 {p95:7.1f} ms  p99 {p99:7.1f} ms  errors {n_errors}")
+    finally:
+        if server is not None:
+            server.terminate()
+            server.wait(timeout=10)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,159 @@
+# -*- coding: utf-8 -*-
+"""Columnar synthetic dataset, in memory or as memory-mapped .npy files.
+
+Each column is stored with a compact dtype: float32 CGPA, int8 encoded tier,
+uint8 MCQ score, a uint8 (rows x skills) flag matrix and a float32 target, about
+29 bytes per row instead of ~140 for the pandas frame plus its feature matrix.
+On disk every column is a `.npy` file written chunk by chunk through
+`np.lib.format.open_memmap` and read back with `mmap_mode='r'`, so a dataset
+larger than RAM can be generated and trained on. `features()` assembles float32
+model input for just the rows asked for, straight from the mapped pages.
+"""
+
+import hashlib
+import json
+import os
+
+import numpy as np
+
+from synthetic_data import COLLEGE_TIERS, DEFAULT_CHUNK_SIZE, iter_synthetic_chunks
+
+DATASET_META = 'dataset.json'
+DATASET_VERSION = 1
+
+COLUMN_DTYPES = {
+    'cgpa': np.float32,
+    'tier': np.int8,
+    'mcq_score': np.uint8,
+    'skills': np.uint8,
+    'package_lpa': np.float32,
+}
+
+
+class ColumnarDataset:
+    """Synthetic training data as compact NumPy columns (optionally memory-mapped)."""
+
+    def __init__(self, columns, skills, directory=None, meta=None):
+        self.columns = columns
+        self.skills = tuple(skills)
+        self.directory = directory
+        self.meta = meta or {}
+
+    def __len__(self):
+        return len(self.columns['cgpa'])
+
+    # --- Creation ---
+
+    @classmethod
+    def create(cls, num_rows, skills, directory=None, meta=None):
+        """Allocates empty columns in memory, or as .npy memmaps under `directory`.
+
+        An existing dataset's metadata is removed before any column is touched, so
+        an interrupted regeneration never opens as a valid dataset; `flush` writes
+        the new metadata once every column is complete.
+        """
+        if directory is not None:
+            os.makedirs(directory, exist_ok=True)
+            meta_path = os.path.join(directory, DATASET_META)
+            if os.path.exists(meta_path):
+                os.remove(meta_path)
+        columns = {}
+        for name, dtype in COLUMN_DTYPES.items():
+            shape = (num_rows, len(skills)) if name == 'skills' else (num_rows,)
+            if directory is None:
+                columns[name] = np.empty(shape, dtype=dtype)
+            else:
+                columns[name] = np.lib.format.open_memmap(
+                    os.path.join(directory, f"{name}.npy"), mode='w+', dtype=dtype, shape=shape)
+        return cls(columns, skills, directory, meta)
+
+    def write_chunk(self, start, chunk, schema):
+        """Stores one `synthetic_data.generate_chunk` dict at rows [start, start + len)."""
+        stop = start + len(chunk['CGPA'])
+        tier_values = np.array([schema.tier_value(t) for t in COLLEGE_TIERS], dtype=np.int8)
+        self.columns['cgpa'][start:stop] = chunk['CGPA']
+        self.columns['tier'][start:stop] = tier_values[chunk['College_Tier_Idx']]
+        self.columns['mcq_score'][start:stop] = chunk['MCQ_Score']
+        for j, column in enumerate(schema.skill_columns):
+            self.columns['skills'][start:stop, j] = chunk[column]
+        self.columns['package_lpa'][start:stop] = chunk['Package_LPA']
+        return stop
+
+    def flush(self):
+        """Flushes memmapped columns and writes the dataset metadata."""
+        if self.directory is None:
+            return
+        for column in self.columns.values():
+            column.flush()
+        meta = dict(self.meta, version=DATASET_VERSION, num_rows=len(self), skills=list(self.skills))
+        meta_path = os.path.join(self.directory, DATASET_META)
+        with open(meta_path + '.tmp', 'w', encoding='utf-8') as f:
+            json.dump(meta, f, indent=2)
+        os.replace(meta_path + '.tmp', meta_path)
+
+    @classmethod
+    def open(cls, directory):
+        """Maps an on-disk dataset read-only; nothing is read until rows are accessed."""
+        with open(os.path.join(directory, DATASET_META), 'r', encoding='utf-8') as f:
+            meta = json.load(f)
+        if meta.get('version') != DATASET_VERSION:
+            raise ValueError(f"Unsupported dataset version in {directory}: {meta.get('version')!r}")
+        columns = {name: np.load(os.path.join(directory, f"{name}.npy"), mmap_mode='r') for name in COLUMN_DTYPES}
+        return cls(columns, meta['skills'], directory, meta)
+
+    # --- Reading ---
+
+    def features(self, schema, rows=slice(None), out=None):
+        """float32 model input for `rows` (a slice or sorted index array), in schema feature order."""
+        c = self.columns
+        return schema.encode_batch(c['cgpa'][rows], c['tier'][rows], c['mcq_score'][rows], c['skills'][rows], out=out)
+
+    def target(self, rows=slice(None)):
+        return np.asarray(self.columns['package_lpa'][rows])
+
+    def content_hash(self, chunk_size=DEFAULT_CHUNK_SIZE):
+        """sha256 over all columns, read sequentially in chunks."""
+        h = hashlib.sha256()
+        for name in COLUMN_DTYPES:
+            column = self.columns[name]
+            for start in range(0, len(self), chunk_size):
+                h.update(np.ascontiguousarray(column[start:start + chunk_size]).tobytes())
+        return h.hexdigest()
+
+    def head_frame(self, schema, n=5):
+        """First rows as a DataFrame, for display."""
+        import pandas as pd
+
+        df = pd.DataFrame(self.features(schema, slice(0, n)), columns=schema.feature_names)
+        df['Package_LPA'] = self.target(slice(0, n)).astype(np.float64).round(2)
+        return df
+
+    @property
+    def nbytes(self):
+        return sum(column.nbytes for column in self.columns.values())
+
+
+def generate_dataset(rng, num_samples, schema, directory=None, chunk_size=DEFAULT_CHUNK_SIZE, meta=None):
+    """Generates the synthetic dataset chunk by chunk into a ColumnarDataset."""
+    dataset = ColumnarDataset.create(num_samples, schema.skills, directory, meta)
+    start = 0
+    for chunk in iter_synthetic_chunks(rng, num_samples, chunk_size):
+        start = dataset.write_chunk(start, chunk, schema)
+    dataset.flush()
+    return dataset
+
+
+def shard_rows(num_rows, rows_per_shard, rng, block_size=65536):
+    """Splits row ids into shards of about `rows_per_shard` rows each.
+
+    Rows are grouped in contiguous blocks (sequential reads from the memmap);
+    blocks are shuffled across shards, and each shard's rows come back sorted.
+    """
+    blocks = np.arange(0, num_rows, block_size)
+    rng.shuffle(blocks)
+    blocks_per_shard = max(1, rows_per_shard // block_size)
+    shards = []
+    for i in range(0, len(blocks), blocks_per_shard):
+        starts = np.sort(blocks[i:i + blocks_per_shard])
+        shards.append(np.concatenate([np.arange(s, min(s + block_size, num_rows)) for s in starts]))
+    return shards
@@ -0,0 +1,140 @@
+# -*- coding: utf-8 -*-
+"""Feature schema shared by training and prediction.
+
+The schema fixes the model's feature order ('CGPA', 'College_Tier_Encoded',
+'MCQ_Score', then one 0/1 column per skill) and encodes user inputs straight into
+a NumPy row, so the serving path never builds a pandas DataFrame. It is saved as
+JSON next to the model by prepare_model_data.py.
+"""
+
+import json
+
+import numpy as np
+
+from skill_parser import SkillParser
+from synthetic_data import COMMON_SKILLS, MAX_MCQ_SCORE, skill_column
+
+FEATURE_SCHEMA_PATH = 'feature_schema.json'
+SCHEMA_VERSION = 1
+
+# Maps for user-friendly display to model input
+COLLEGE_TIER_MAPPING = {"Tier 1": 3, "Tier 2": 2, "Tier 3": 1} # Higher value for better tier
+DEFAULT_TIER_VALUE = 1 # Tier 3 if the tier is unknown
+NUMERIC_FEATURES = ('CGPA', 'College_Tier_Encoded', 'MCQ_Score')
+CGPA_IDX, TIER_IDX, MCQ_IDX = range(len(NUMERIC_FEATURES))
+
+FEATURE_DTYPE = np.float32 # What the tree models compare against internally
+
+
+class FeatureSchema:
+    """Compiled mapping from user inputs to the model's feature vector."""
+
+    def __init__(self, skills=COMMON_SKILLS, tier_mapping=COLLEGE_TIER_MAPPING, skill_parser=None):
+        self.skills = tuple(skills)
+        self.tier_mapping = dict(tier_mapping)
+        self.skill_columns = tuple(skill_column(s) for s in self.skills)
+        self.feature_names = NUMERIC_FEATURES + self.skill_columns
+        self.n_features = len(self.feature_names)
+        self.skill_offset = len(NUMERIC_FEATURES)
+
+        # Free-text skill names (aliases, case, typos) -> position in `skills`
+        self.skill_parser = SkillParser(self.skills) if skill_parser is None else skill_parser
+
+    def __eq__(self, other):
+        return isinstance(other, FeatureSchema) and self.to_dict() == other.to_dict()
+
+    def __repr__(self):
+        return f"FeatureSchema({self.n_features} features, {len(self.skills)} skills)"
+
+    # --- Encoding ---
+
+    def empty_row(self):
+        return np.zeros((1, self.n_features), dtype=FEATURE_DTYPE)
+
+    def tier_value(self, college_tier):
+        return self.tier_mapping.get(college_tier, DEFAULT_TIER_VALUE)
+
+    @staticmethod
+    def model_mcq_score(score, total_questions=MAX_MCQ_SCORE):
+        """An MCQ score out of `total_questions` on the 0..MAX_MCQ_SCORE scale the model was trained on."""
+        if total_questions < 1:
+            raise ValueError("total_questions must be at least 1")
+        return score if total_questions == MAX_MCQ_SCORE else score * MAX_MCQ_SCORE / total_questions
+
+    def skill_feature_index(self, skill):
+        """Feature index for a skill name, or None if the model does not know the skill."""
+        position = self.skill_parser.resolve(skill.strip())
+        return None if position is None else self.skill_offset + position
+
+    def parse_skills(self, strengths_input_str):
+        """Splits a comma-separated skills string into known feature indices and unknown names."""
+        known, unknown = self.skill_parser.parse(strengths_input_str)
+        return [self.skill_offset + position for position in known], unknown
+
+    def encode(self, cgpa, college_tier, mcq_score, skills=(), out=None):
+        """Encodes one student into a (1, n_features) row.
+
+        `skills` is either a comma-separated string or an iterable of skill names.
+        Pass a preallocated `out` row (see `empty_row`) to reuse the buffer.
+        """
+        row = self.empty_row() if out is None else out
+        if out is not None:
+            row.fill(0)
+        row[0, CGPA_IDX] = cgpa
+        row[0, TIER_IDX] = self.tier_value(college_tier)
+        row[0, MCQ_IDX] = mcq_score
+        if isinstance(skills, str):
+            known, _ = self.parse_skills(skills)
+        else:
+            known = [idx for idx in map(self.skill_feature_index, skills) if idx is not None]
+        row[0, known] = 1
+        return row
+
+    def encode_batch(self, cgpa, tier_values, mcq_score, skill_matrix, out=None):
+        """Encodes N students from column arrays; `skill_matrix` is (N, n_skills) of 0/1."""
+        n = len(cgpa)
+        X = np.empty((n, self.n_features), dtype=FEATURE_DTYPE) if out is None else out[:n]
+        X[:, CGPA_IDX] = cgpa
+        X[:, TIER_IDX] = tier_values
+        X[:, MCQ_IDX] = mcq_score
+        X[:, self.skill_offset:] = skill_matrix
+        return X
+
+    def tier_values(self, college_tiers):
+        """Vectorized `tier_value` over an array of tier labels."""
+        college_tiers = np.asarray(college_tiers)
+        values = np.full(college_tiers.shape, DEFAULT_TIER_VALUE, dtype=np.int8)
+        for label, value in self.tier_mapping.items():
+            values[college_tiers == label] = value
+        return values
+
+    # --- Persistence ---
+
+    def to_dict(self):
+        return {
+            'version': SCHEMA_VERSION,
+            'feature_names': list(self.feature_names),
+            'skills': list(self.skills),
+            'tier_mapping': self.tier_mapping,
+            'skill_parser': self.skill_parser.to_dict(),
+        }
+
+    @classmethod
+    def from_dict(cls, data):
+        if data.get('version') != SCHEMA_VERSION:
+            raise ValueError(f"Unsupported feature schema version: {data.get('version')!r}")
+        # Schemas saved before the skill parser existed get the default alias index
+        parser = SkillParser.from_dict(data['skills'], data['skill_parser']) if 'skill_parser' in data else None
+        schema = cls(data['skills'], data['tier_mapping'], parser)
+        if list(schema.feature_names) != data['feature_names']:
+            raise ValueError("Feature schema is inconsistent: feature names do not match its skills.")
+        return schema
+
+    def save(self, path=FEATURE_SCHEMA_PATH):
+        with open(path, 'w', encoding='utf-8') as f:
+            json.dump(self.to_dict(), f, indent=2)
+
+    @classmethod
+    def load(cls, path=FEATURE_SCHEMA_PATH):
+        with open(path, 'r', encoding='utf-8') as f:
+            return cls.from_dict(json.load(f))
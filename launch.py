@@ -0,0 +1,53 @@
+# -*- coding: utf-8 -*-
+"""Starts the Streamlit app, optionally behind an ngrok tunnel.
+
+The tunnel used to be opened when the app module was imported, which blocked
+startup and failed offline; it is now an explicit launcher step:
+    python launch.py                     # streamlit run on --port
+    python launch.py --ngrok             # ... and print a public https URL (needs pyngrok)
+    python launch.py -- --server.headless true   # extra arguments go to streamlit
+"""
+
+import argparse
+import os
+import subprocess
+import sys
+
+APP_PATH = os.path.join(os.path.dirname(os.path.abspath(__file__)),
+                        'script_to_prepare_dummy_data_and_train_model.py')
+
+
+def open_tunnel(port):
+    """Public URL forwarding to `port` (NGROK_AUTHTOKEN is used if set)."""
+    try:
+        from pyngrok import ngrok
+    except ImportError:
+        raise SystemExit("--ngrok needs pyngrok: pip install pyngrok")
+    if os.environ.get('NGROK_AUTHTOKEN'):
+        ngrok.set_auth_token(os.environ['NGROK_AUTHTOKEN'])
+    return ngrok.connect(addr=str(port), bind_tls=True).public_url
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Start the Streamlit app, optionally behind an ngrok tunnel.")
+    parser.add_argument('--port', type=int, default=8501)
+    parser.add_argument('--ngrok', action='store_true', help="Expose the app through an ngrok tunnel.")
+    parser.add_argument('streamlit_args', nargs='*', help="Extra arguments for `streamlit run` (after --).")
+    args = parser.parse_args()
+
+    app = subprocess.Popen([sys.executable, '-m', 'streamlit', 'run', APP_PATH,
+                            '--server.port', str(args.port), *args.streamlit_args])
+    try:
+        if args.ngrok:
+            print(f"Streamlit App URL: {open_tunnel(args.port)}", flush=True)
+        sys.exit(app.wait())
+    except KeyboardInterrupt:
+        app.terminate()
+        sys.exit(app.wait())
+    finally:
+        if app.poll() is None:
+            app.terminate()
+
+
+if __name__ == '__main__':
+    main()
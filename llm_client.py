@@ -0,0 +1,253 @@
+# -*- coding: utf-8 -*-
+"""LLM client layer for roadmap generation.
+
+`LLMClient` dispatches completions on a bounded worker pool, so callers (the
+Streamlit script thread, the API) only block for as long as they choose to:
+    future = client.submit(prompt)          # concurrent dispatch
+    text = client.generate(prompt)          # blocking, bounded by `timeout`
+    text = await client.agenerate(prompt)   # asyncio
+    for chunk in client.stream(prompt):     # incremental text as it arrives
+Every call has a per-request timeout and bounded retries with exponential
+backoff. Identical prompts already in flight are coalesced into one upstream
+request whose result every caller shares.
+
+Backends: `GeminiBackend` (pooled `requests` session against the Gemini REST API
+or a local llm_stub_server.py) and `SimulatedBackend` (offline template).
+"""
+
+import json
+import queue
+import random
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+RETRYABLE_STATUS = {408, 429, 500, 502, 503, 504}
+
+
+class LLMError(Exception):
+    """An LLM call failed; `retryable` marks transient failures (timeouts, 429/5xx)."""
+
+    def __init__(self, message, retryable=False):
+        super().__init__(message)
+        self.retryable = retryable
+
+
+# --- Backends ---
+
+class SimulatedBackend:
+    """Offline backend: renders the response locally from the request context."""
+
+    name = 'simulated'
+
+    def __init__(self, render, render_stream=None):
+        self.render = render
+        self.render_stream = render_stream
+
+    def complete(self, prompt, context, timeout):
+        return self.render(prompt, context)
+
+    def stream(self, prompt, context, timeout):
+        if self.render_stream is None:
+            yield self.render(prompt, context)
+        else:
+            yield from self.render_stream(prompt, context)
+
+
+class GeminiBackend:
+    """Gemini `generateContent` over a pooled, keep-alive HTTP session."""
+
+    name = 'gemini'
+    DEFAULT_MODEL = 'gemini-2.0-flash'
+    DEFAULT_BASE_URL = 'https://generativelanguage.googleapis.com'
+
+    def __init__(self, api_key='', model=DEFAULT_MODEL, base_url=DEFAULT_BASE_URL, pool_size=8):
+        import requests
+        from requests.adapters import HTTPAdapter
+
+        self._requests = requests
+        self.api_key = api_key
+        self.model = model
+        self.base_url = base_url.rstrip('/')
+        self.session = requests.Session()
+        adapter = HTTPAdapter(pool_connections=1, pool_maxsize=pool_size)
+        self.session.mount('http://', adapter)
+        self.session.mount('https://', adapter)
+        self.session.headers.update({'Content-Type': 'application/json'})
+
+    def url(self, method='generateContent'):
+        return f"{self.base_url}/v1beta/models/{self.model}:{method}?key={self.api_key}"
+
+    @staticmethod
+    def payload(prompt):
+        chat_history = [{"role": "user", "parts": [{"text": prompt}]}]
+        return {"contents": chat_history}
+
+    @staticmethod
+    def response_text(result):
+        try:
+            return ''.join(part.get('text', '') for part in result['candidates'][0]['content']['parts'])
+        except (KeyError, IndexError, TypeError):
+            raise LLMError(f"Unexpected LLM response shape: {str(result)[:200]}")
+
+    def _post(self, url, prompt, timeout, stream=False):
+        try:
+            response = self.session.post(url, json=self.payload(prompt), timeout=timeout, stream=stream)
+        except (self._requests.Timeout, self._requests.ConnectionError) as e:
+            raise LLMError(f"LLM request failed: {e}", retryable=True)
+        if response.status_code != 200:
+            raise LLMError(f"LLM returned HTTP {response.status_code}: {response.text[:200]}",
+                           retryable=response.status_code in RETRYABLE_STATUS)
+        return response
+
+    def complete(self, prompt, context, timeout):
+        return self.response_text(self._post(self.url(), prompt, timeout).json())
+
+    def stream(self, prompt, context, timeout):
+        """`streamGenerateContent` as server-sent events; yields text pieces as they arrive."""
+        response = self._post(self.url('streamGenerateContent') + '&alt=sse', prompt, timeout, stream=True)
+        with response:
+            try:
+                # chunk_size=None hands each event over as soon as its transfer chunk arrives
+                for line in response.iter_lines(chunk_size=None, decode_unicode=True):
+                    if line and line.startswith('data:'):
+                        text = self.response_text(json.loads(line[len('data:'):]))
+                        if text:
+                            yield text
+            except self._requests.RequestException as e:
+                raise LLMError(f"LLM stream interrupted: {e}", retryable=True)
+
+    def close(self):
+        self.session.close()
+
+
+# --- Client ---
+
+class LLMClient:
+    """Concurrent, retrying, coalescing front end over an LLM backend."""
+
+    def __init__(self, backend, timeout=30.0, max_retries=3, backoff_base=0.5, backoff_max=8.0,
+                 max_concurrency=8):
+        self.backend = backend
+        self.timeout = timeout
+        self.max_retries = max_retries
+        self.backoff_base = backoff_base
+        self.backoff_max = backoff_max
+        # The pool size is the upstream concurrency limit
+        self._executor = ThreadPoolExecutor(max_workers=max_concurrency, thread_name_prefix='llm')
+        self._inflight = {} # prompt -> Future
+        self._lock = threading.Lock()
+        self.upstream_calls = 0
+        self.coalesced = 0
+
+    def submit(self, prompt, context=None):
+        """Schedules a completion and returns a Future; joins an identical in-flight request if any."""
+        with self._lock:
+            future = self._inflight.get(prompt)
+            if future is not None:
+                self.coalesced += 1
+                return future
+            future = self._executor.submit(self._complete_with_retries, prompt, context or {})
+            self._inflight[prompt] = future
+        future.add_done_callback(lambda f: self._forget(prompt, f))
+        return future
+
+    def _forget(self, prompt, future):
+        with self._lock:
+            if self._inflight.get(prompt) is future:
+                del self._inflight[prompt]
+
+    def _complete_with_retries(self, prompt, context):
+        attempt = 0
+        while True:
+            with self._lock:
+                self.upstream_calls += 1
+            try:
+                return self.backend.complete(prompt, context, self.timeout)
+            except LLMError as e:
+                if not e.retryable or attempt >= self.max_retries:
+                    raise
+            delay = min(self.backoff_max, self.backoff_base * (2 ** attempt))
+            time.sleep(delay * random.uniform(0.5, 1.0)) # Jitter spreads out retries from many sessions
+            attempt += 1
+
+    def generate(self, prompt, context=None, timeout=None):
+        """Blocking completion; waits at most `timeout` (default: one call's budget incl. retries)."""
+        if timeout is None:
+            timeout = self.timeout * (self.max_retries + 1) + self.backoff_max * self.max_retries
+        return self.submit(prompt, context).result(timeout=timeout)
+
+    def stream(self, prompt, context=None, timeout=None):
+        """Yields response text pieces as they arrive.
+
+        Streams are not coalesced, and are retried only until the first piece has
+        been yielded. `timeout` bounds the wait for each piece. Closing the generator
+        early (or abandoning it) stops the upstream request and frees its worker.
+        """
+        pieces = queue.Queue()
+        cancelled = threading.Event()
+        self._executor.submit(self._stream_into, prompt, context or {}, pieces, cancelled)
+        wait = timeout if timeout is not None else self.timeout * (self.max_retries + 1)
+        try:
+            while True:
+                try:
+                    kind, value = pieces.get(timeout=wait)
+                except queue.Empty:
+                    raise LLMError(f"LLM stream produced nothing for {wait:.0f}s")
+                if kind == 'piece':
+                    yield value
+                elif kind == 'error':
+                    raise value
+                else:
+                    return
+        finally:
+            cancelled.set()
+
+    def _stream_into(self, prompt, context, pieces, cancelled):
+        attempt = 0
+        while not cancelled.is_set():
+            with self._lock:
+                self.upstream_calls += 1
+            started = False
+            upstream = self.backend.stream(prompt, context, self.timeout)
+            try:
+                for piece in upstream:
+                    if cancelled.is_set():
+                        return # Nobody is reading; the finally closes the upstream response
+                    started = True
+                    pieces.put(('piece', piece))
+                pieces.put(('done', None))
+                return
+            except LLMError as e:
+                if started or not e.retryable or attempt >= self.max_retries:
+                    pieces.put(('error', e))
+                    return
+            except Exception as e:
+                pieces.put(('error', e))
+                return
+            finally:
+                upstream.close()
+            delay = min(self.backoff_max, self.backoff_base * (2 ** attempt))
+            if cancelled.wait(delay * random.uniform(0.5, 1.0)): # Sleeps, but wakes up if abandoned
+                return
+            attempt += 1
+
+    async def agenerate(self, prompt, context=None):
+        import asyncio # Only async callers pay for importing asyncio
+
+        return await asyncio.wrap_future(self.submit(prompt, context))
+
+    def generate_many(self, prompts, contexts=None):
+        """Dispatches all prompts concurrently and returns results in order."""
+        contexts = contexts or [None] * len(prompts)
+        futures = [self.submit(p, c) for p, c in zip(prompts, contexts)]
+        return [f.result() for f in futures]
+
+    def stats(self):
+        return {'backend': self.backend.name, 'upstream_calls': self.upstream_calls,
+                'coalesced': self.coalesced, 'inflight': len(self._inflight)}
+
+    def close(self):
+        self._executor.shutdown(wait=False)
+        if hasattr(self.backend, 'close'):
+            self.backend.close()
@@ -0,0 +1,123 @@
+# -*- coding: utf-8 -*-
+"""Local stub of the Gemini `generateContent` endpoint for tests and benchmarks.
+
+Answers any POST to /v1beta/models/<model>:generateContent with a Gemini-shaped
+response, after an optional delay, and can fail the first N requests with 503 to
+exercise retries. :streamGenerateContent?alt=sse streams the same response one
+section per server-sent event, `--chunk-delay` apart. GET /stats returns how many
+generate requests it received.
+    python llm_stub_server.py --port 8765 --delay 0.5 --chunk-delay 0.3
+    ROADMAP_BACKEND=gemini LLM_BASE_URL=http://127.0.0.1:8765 streamlit run script_to_prepare_dummy_data_and_train_model.py
+"""
+
+import argparse
+import json
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+
+def stub_roadmap(prompt):
+    """A small six-section Markdown roadmap echoing the prompt's first line."""
+    first_line = next((line.strip() for line in prompt.splitlines() if line.strip()), '')
+    sections = ["Core Technical Skill Development", "Advanced / Niche Skill Acquisition",
+                "Project Work & Portfolio Building", "Soft Skills & Communication",
+                "Interview Preparation Strategy", "Networking & Job Search"]
+    body = '\n\n'.join(f"{i}.  **{title}:**\n    * Stub advice for: {first_line}"
+                       for i, title in enumerate(sections, start=1))
+    return f"**Stub Roadmap**\n\n{body}\n"
+
+
+class StubLLMHandler(BaseHTTPRequestHandler):
+    server_version = 'StubLLM/1.0'
+    protocol_version = 'HTTP/1.1' # Keep-alive, and chunked transfer for streams like the real API
+
+    def log_message(self, format, *args):
+        pass # Keep benchmark output clean
+
+    def _send_json(self, status, body):
+        data = json.dumps(body).encode('utf-8')
+        self.send_response(status)
+        self.send_header('Content-Type', 'application/json')
+        self.send_header('Content-Length', str(len(data)))
+        self.end_headers()
+        self.wfile.write(data)
+
+    def do_GET(self):
+        if self.path == '/stats':
+            self._send_json(200, {'requests': self.server.request_count})
+        else:
+            self._send_json(404, {'error': 'not found'})
+
+    def _send_sse(self, pieces):
+        self.send_response(200)
+        self.send_header('Content-Type', 'text/event-stream')
+        self.send_header('Transfer-Encoding', 'chunked')
+        self.end_headers()
+        try:
+            for i, piece in enumerate(pieces):
+                if i:
+                    time.sleep(self.server.chunk_delay)
+                event = {'candidates': [{'content': {'role': 'model', 'parts': [{'text': piece}]}}]}
+                data = f"data: {json.dumps(event)}\r\n\r\n".encode('utf-8')
+                self.wfile.write(f"{len(data):x}\r\n".encode('ascii') + data + b"\r\n")
+                self.wfile.flush()
+            self.wfile.write(b"0\r\n\r\n")
+        except (BrokenPipeError, ConnectionResetError):
+            self.close_connection = True # The client stopped reading the stream early
+
+    def do_POST(self):
+        length = int(self.headers.get('Content-Length', 0))
+        request = json.loads(self.rfile.read(length) or b'{}')
+        streaming = ':streamGenerateContent' in self.path
+        if not streaming and ':generateContent' not in self.path:
+            self._send_json(404, {'error': 'not found'})
+            return
+        with self.server.lock:
+            self.server.request_count += 1
+            attempt = self.server.request_count
+        time.sleep(self.server.delay)
+        if attempt <= self.server.fail_first:
+            self._send_json(503, {'error': {'code': 503, 'message': 'stub: simulated overload'}})
+            return
+        prompt = request['contents'][-1]['parts'][0]['text']
+        if streaming:
+            self._send_sse([section + '\n\n' for section in stub_roadmap(prompt).split('\n\n')])
+            return
+        self._send_json(200, {'candidates': [{'content': {'role': 'model', 'parts': [{'text': stub_roadmap(prompt)}]}}]})
+
+
+def start_stub_server(host='127.0.0.1', port=0, delay=0.0, fail_first=0, chunk_delay=0.0):
+    """Starts the stub on a background thread; returns the server (see `server.url`)."""
+    server = ThreadingHTTPServer((host, port), StubLLMHandler)
+    server.daemon_threads = True
+    server.delay = delay
+    server.fail_first = fail_first
+    server.chunk_delay = chunk_delay
+    server.request_count = 0
+    server.lock = threading.Lock()
+    server.url = f"http://{host}:{server.server_address[1]}"
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    return server
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Local stub of the Gemini generateContent API.")
+    parser.add_argument('--host', default='127.0.0.1')
+    parser.add_argument('--port', type=int, default=8765)
+    parser.add_argument('--delay', type=float, default=0.0, help="Seconds to wait before answering.")
+    parser.add_argument('--chunk-delay', type=float, default=0.0, help="Seconds between streamed sections.")
+    parser.add_argument('--fail-first', type=int, default=0, help="Answer the first N requests with HTTP 503.")
+    args = parser.parse_args()
+
+    server = start_stub_server(args.host, args.port, args.delay, args.fail_first, args.chunk_delay)
+    print(f"Stub LLM listening on {server.url}")
+    try:
+        while True:
+            time.sleep(3600)
+    except KeyboardInterrupt:
+        server.shutdown()
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,307 @@
+# -*- coding: utf-8 -*-
+"""Per-stage latency spans, aggregated across processes, with optional cProfile capture.
+
+Stages are timed with context managers:
+    with metrics.span('predictor.predict_rows'):
+        ...
+Spans are off unless METRICS_DIR is set; then `span()` returns a shared no-op,
+so instrumented code costs one attribute check. When enabled, every process
+(Streamlit workers, API workers, the batch scorer) keeps latency histograms in
+memory and writes them to its own file in METRICS_DIR (`metrics-<host>-<pid>.json`,
+at most every FLUSH_SECONDS and at exit). Readers sum all files, so no locks are
+shared between processes:
+    METRICS_DIR=/tmp/metrics streamlit run script_to_prepare_dummy_data_and_train_model.py
+    python metrics.py --dir /tmp/metrics            # Prometheus text
+    python metrics.py --dir /tmp/metrics --json     # counts, sums, buckets, estimated quantiles
+The HTTP API serves the same aggregate at GET /metrics.
+
+METRICS_PROFILE=<span>[,<span>...] (or '*') also runs matching spans under
+cProfile, one profiled span at a time per process. Stats are written next to the
+histograms (`profile-<span>-<host>-<pid>.prof`) and merged across processes with:
+    python metrics.py --dir /tmp/metrics --profile predictor.predict_rows
+"""
+
+import atexit
+import bisect
+import json
+import os
+import socket
+import threading
+import time
+
+METRICS_DIR = os.environ.get('METRICS_DIR') or None
+PROFILE_SPANS = frozenset(filter(None, os.environ.get('METRICS_PROFILE', '').split(',')))
+FLUSH_SECONDS = 1.0
+METRIC_NAME = 'career_navigator_span_seconds'
+# Upper bounds in seconds, from sub-millisecond lookups to LLM calls
+BUCKETS = (0.0001, 0.00025, 0.0005, 0.001, 0.0025, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5,
+           1.0, 2.5, 5.0, 10.0, 30.0, 60.0)
+
+
+class Histogram:
+    """Fixed-bucket latency histogram (the last count is the +Inf bucket)."""
+
+    __slots__ = ('counts', 'total', 'count')
+
+    def __init__(self, counts=None, total=0.0, count=0):
+        self.counts = list(counts) if counts is not None else [0] * (len(BUCKETS) + 1)
+        self.total = total
+        self.count = count
+
+    def observe(self, seconds):
+        self.counts[bisect.bisect_left(BUCKETS, seconds)] += 1
+        self.total += seconds
+        self.count += 1
+
+    def merge(self, other):
+        self.counts = [a + b for a, b in zip(self.counts, other.counts)]
+        self.total += other.total
+        self.count += other.count
+
+    def quantile(self, q):
+        """Estimate of the q-quantile, interpolated within its bucket."""
+        if not self.count:
+            return None
+        rank = q * self.count
+        seen = 0
+        for i, n in enumerate(self.counts):
+            if n and seen + n >= rank:
+                low = BUCKETS[i - 1] if i else 0.0
+                high = BUCKETS[i] if i < len(BUCKETS) else BUCKETS[-1]
+                return low + (high - low) * (rank - seen) / n
+            seen += n
+        return BUCKETS[-1]
+
+    def to_dict(self):
+        return {'counts': self.counts, 'sum': self.total, 'count': self.count}
+
+    @classmethod
+    def from_dict(cls, data):
+        return cls(data['counts'], data['sum'], data['count'])
+
+
+# --- Recording (per process) ---
+
+class _NoopSpan:
+    __slots__ = ()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        return False
+
+
+NOOP_SPAN = _NoopSpan()
+
+
+class Span:
+    """Times its block into the process registry; runs it under cProfile if selected."""
+
+    __slots__ = ('registry', 'name', 'start', 'profiler')
+
+    def __init__(self, registry, name):
+        self.registry = registry
+        self.name = name
+        self.profiler = None
+
+    def __enter__(self):
+        if self.registry.profile_spans and self.registry.wants_profile(self.name):
+            self.profiler = self.registry.start_profile(self.name)
+        self.start = time.perf_counter()
+        return self
+
+    def __exit__(self, *exc):
+        elapsed = time.perf_counter() - self.start
+        if self.profiler is not None:
+            self.registry.stop_profile(self.profiler)
+        self.registry.observe(self.name, elapsed)
+        return False
+
+
+class Registry:
+    """This process's histograms and profiles, flushed to its own files in `directory`."""
+
+    def __init__(self, directory, profile_spans=frozenset(), flush_seconds=FLUSH_SECONDS):
+        self.directory = directory
+        self.profile_spans = profile_spans
+        self.flush_seconds = flush_seconds
+        self._lock = threading.Lock()
+        self._reset()
+        os.makedirs(directory, exist_ok=True)
+        os.register_at_fork(after_in_child=self._reset) # Forked workers start from zero, in their own file
+        atexit.register(self.flush)
+
+    def _reset(self):
+        self._lock = threading.Lock()
+        self.histograms = {}
+        self.profiles = {} # span name -> cProfile.Profile
+        self._profiling = False
+        self._last_flush = time.monotonic()
+        self.process_id = f"{socket.gethostname()}-{os.getpid()}"
+
+    def observe(self, name, seconds):
+        with self._lock:
+            histogram = self.histograms.get(name)
+            if histogram is None:
+                histogram = self.histograms[name] = Histogram()
+            histogram.observe(seconds)
+            due = time.monotonic() - self._last_flush >= self.flush_seconds
+        if due:
+            self.flush()
+
+    # --- Profiling ---
+
+    def wants_profile(self, name):
+        return '*' in self.profile_spans or name in self.profile_spans
+
+    def start_profile(self, name):
+        """The span's profiler, enabled; None if another span is already being profiled."""
+        import cProfile
+
+        with self._lock:
+            if self._profiling:
+                return None
+            self._profiling = True
+            profiler = self.profiles.get(name)
+            if profiler is None:
+                profiler = self.profiles[name] = cProfile.Profile()
+        profiler.enable()
+        return profiler
+
+    def stop_profile(self, profiler):
+        profiler.disable()
+        with self._lock:
+            self._profiling = False
+
+    # --- Persistence ---
+
+    def flush(self):
+        """Writes this process's histograms (and profiles) atomically to its files."""
+        with self._lock:
+            self._last_flush = time.monotonic()
+            data = {'pid': os.getpid(), 'updated': time.time(),
+                    'spans': {name: h.to_dict() for name, h in self.histograms.items()}}
+            profiles = list(self.profiles.items()) if not self._profiling else []
+            for name, profiler in profiles:
+                profiler.dump_stats(self._path(f"profile-{name}-{self.process_id}.prof"))
+        path = self._path(f"metrics-{self.process_id}.json")
+        tmp_path = f"{path}.{threading.get_ident()}.tmp"
+        try:
+            with open(tmp_path, 'w', encoding='utf-8') as f:
+                json.dump(data, f)
+            os.replace(tmp_path, path)
+        except OSError:
+            pass # Metrics never break the request that recorded them
+
+    def _path(self, filename):
+        return os.path.join(self.directory, filename)
+
+
+_registry = Registry(METRICS_DIR, PROFILE_SPANS) if METRICS_DIR else None
+
+
+def enabled():
+    return _registry is not None
+
+
+def span(name):
+    """Context manager timing its block as `name` (a shared no-op when metrics are off)."""
+    if _registry is None:
+        return NOOP_SPAN
+    return Span(_registry, name)
+
+
+def observe(name, seconds):
+    """Records an already measured duration (for stages that do not fit in a `with` block)."""
+    if _registry is not None:
+        _registry.observe(name, seconds)
+
+
+def flush():
+    if _registry is not None:
+        _registry.flush()
+
+
+# --- Aggregation (any process) ---
+
+def collect(directory=None):
+    """Span name -> Histogram summed over every process's file in `directory`."""
+    directory = directory or METRICS_DIR
+    totals = {}
+    if not directory or not os.path.isdir(directory):
+        return totals
+    for filename in sorted(os.listdir(directory)):
+        if not (filename.startswith('metrics-') and filename.endswith('.json')):
+            continue
+        try:
+            with open(os.path.join(directory, filename), 'r', encoding='utf-8') as f:
+                spans = json.load(f)['spans']
+        except (OSError, ValueError, KeyError):
+            continue # Being replaced, or not ours
+        for name, data in spans.items():
+            histogram = Histogram.from_dict(data)
+            if name in totals:
+                totals[name].merge(histogram)
+            else:
+                totals[name] = histogram
+    return totals
+
+
+def export_json(directory=None):
+    out = {}
+    for name, h in sorted(collect(directory).items()):
+        out[name] = {'count': h.count, 'sum': round(h.total, 6),
+                     'mean': round(h.total / h.count, 6) if h.count else None,
+                     'p50': h.quantile(0.5), 'p90': h.quantile(0.9), 'p99': h.quantile(0.99),
+                     'buckets': dict(zip([*map(str, BUCKETS), '+Inf'], h.counts))}
+    return out
+
+
+def export_prometheus(directory=None):
+    """Prometheus text exposition of the aggregated histograms."""
+    lines = [f"# HELP {METRIC_NAME} Time spent in instrumented stages.", f"# TYPE {METRIC_NAME} histogram"]
+    for name, h in sorted(collect(directory).items()):
+        cumulative = 0
+        for bound, n in zip([*map(repr, BUCKETS), '+Inf'], h.counts):
+            cumulative += n
+            lines.append(f'{METRIC_NAME}_bucket{{span="{name}",le="{bound}"}} {cumulative}')
+        lines.append(f'{METRIC_NAME}_sum{{span="{name}"}} {h.total!r}')
+        lines.append(f'{METRIC_NAME}_count{{span="{name}"}} {h.count}')
+    return '\n'.join(lines) + '\n'
+
+
+def profile_stats(name, directory=None):
+    """pstats.Stats merged over every process's profile of span `name`, or None if there are none."""
+    import pstats
+
+    directory = directory or METRICS_DIR
+    prefix = f"profile-{name}-"
+    paths = [os.path.join(directory, f) for f in sorted(os.listdir(directory))
+             if f.startswith(prefix) and f.endswith('.prof')]
+    return pstats.Stats(*paths) if paths else None
+
+
+def main():
+    import argparse
+
+    parser = argparse.ArgumentParser(description="Print span latencies aggregated over all processes.")
+    parser.add_argument('--dir', default=METRICS_DIR, required=METRICS_DIR is None,
+                        help="Metrics directory (default: $METRICS_DIR).")
+    parser.add_argument('--json', action='store_true', help="JSON instead of Prometheus text.")
+    parser.add_argument('--profile', metavar='SPAN', help="Print the merged cProfile stats of SPAN.")
+    parser.add_argument('--top', type=int, default=25, help="Functions shown with --profile.")
+    args = parser.parse_args()
+    if args.profile:
+        stats = profile_stats(args.profile, args.dir)
+        if stats is None:
+            raise SystemExit(f"No profiles for span {args.profile!r} in {args.dir} (set METRICS_PROFILE).")
+        stats.sort_stats('cumulative').print_stats(args.top)
+    elif args.json:
+        print(json.dumps(export_json(args.dir), indent=2))
+    else:
+        print(export_prometheus(args.dir), end='')
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,174 @@
+# -*- coding: utf-8 -*-
+"""Serving artifact for the package predictor: flat tree arrays as raw .npy files.
+
+A directory holding one `.npy` file per FlatForest array plus `meta.json`:
+    {"format": "flat-forest", "version": 1, "config_hash": ..., "feature_schema": {...},
+     "max_depth": ..., "arrays": {"feature": {"dtype": ..., "shape": [...], "sha256": ...}, ...}}
+`load_artifact` memory-maps the arrays read-only, so every serving process
+shares the same page-cache pages and startup costs a few `open`s instead of
+unpickling a forest. The format version, array dtypes/shapes, checksums and
+(optionally) the training config hash are checked before the forest is used;
+any mismatch raises `ArtifactError`.
+
+Artifacts are never rewritten in place: serving processes have the arrays
+mapped, and truncating a mapped file can crash them or hand them half-written
+trees. `publish_directory` writes every new version into its own hidden sibling
+directory (`.package_predictor_model.<ns>`) and then atomically re-points the
+`package_predictor_model` symlink at it; readers resolve the link once per load.
+The version it replaced stays on disk until the next publish, so a load that
+resolved the link just before the swap can still finish reading it.
+"""
+
+import hashlib
+import json
+import os
+import shutil
+import time
+
+import numpy as np
+
+from feature_schema import FeatureSchema
+from tree_engine import FlatForest
+
+ARTIFACT_PATH = 'package_predictor_model'
+ARTIFACT_META = 'meta.json'
+ARTIFACT_FORMAT = 'flat-forest'
+ARTIFACT_VERSION = 1
+ARRAY_NAMES = ('feature', 'threshold', 'children', 'value', 'roots')
+
+
+class ArtifactError(ValueError):
+    """The artifact is missing pieces, corrupt, from another format version or stale."""
+
+
+def _sha256(array, chunk_bytes=1 << 24):
+    h = hashlib.sha256()
+    flat = array.reshape(-1).view(np.uint8)
+    for start in range(0, len(flat), chunk_bytes):
+        h.update(flat[start:start + chunk_bytes])
+    return h.hexdigest()
+
+
+def publish_directory(write, directory):
+    """Writes a new version of `directory` with `write(path)` and swaps it in atomically.
+
+    `directory` becomes a symlink to a fresh hidden sibling, replaced with
+    `os.replace`, so a reader sees either the old version or the new one, never a
+    mix. The version being replaced is kept, since a reader may have resolved the
+    link to it a moment ago; versions older than that are deleted (processes that
+    still have their files mapped keep reading them until they reload). Where
+    symlinks are unavailable, the old directory is renamed away just before the new
+    one takes its place.
+    """
+    directory = os.path.abspath(directory)
+    parent, name = os.path.split(directory)
+    os.makedirs(parent, exist_ok=True)
+    version = os.path.join(parent, f".{name}.{time.time_ns()}")
+    try:
+        write(version)
+    except BaseException:
+        shutil.rmtree(version, ignore_errors=True)
+        raise
+
+    previous = os.path.realpath(directory) if os.path.islink(directory) else None
+    if os.path.isdir(directory) and previous is None:
+        # A plain directory (older layout) cannot be replaced atomically; move it aside first
+        previous = f"{version}.old"
+        os.rename(directory, previous)
+    link = f"{version}.link"
+    try:
+        os.symlink(os.path.basename(version), link)
+    except (OSError, NotImplementedError):
+        if os.path.lexists(directory):
+            os.remove(directory)
+        os.rename(version, directory)
+    else:
+        os.replace(link, directory)
+    keep = {os.path.basename(version)} | ({os.path.basename(previous)} if previous else set())
+    _remove_old_versions(parent, name, keep)
+
+
+def _remove_old_versions(parent, name, keep):
+    """Deletes hidden versions of `name` in `parent` except the basenames in `keep`."""
+    prefix = f".{name}."
+    for entry in os.listdir(parent):
+        if not entry.startswith(prefix) or not entry[len(prefix):].split('.')[0].isdigit() or entry in keep:
+            continue
+        path = os.path.join(parent, entry)
+        if os.path.isdir(path) and not os.path.islink(path):
+            shutil.rmtree(path, ignore_errors=True)
+        elif os.path.lexists(path):
+            os.remove(path) # A link left behind by an interrupted publish
+
+
+def save_artifact(forest, schema, directory=ARTIFACT_PATH, config_hash=None):
+    """Publishes `forest` and its feature schema as a new artifact version (see `publish_directory`)."""
+    meta = {}
+    publish_directory(lambda path: meta.update(_write_artifact(forest, schema, path, config_hash)), directory)
+    return meta
+
+
+def _write_artifact(forest, schema, directory, config_hash):
+    os.makedirs(directory)
+    meta_path = os.path.join(directory, ARTIFACT_META)
+    arrays = {}
+    for name in ARRAY_NAMES:
+        array = getattr(forest, name)
+        np.save(os.path.join(directory, f"{name}.npy"), array)
+        arrays[name] = {'dtype': array.dtype.str, 'shape': list(array.shape), 'sha256': _sha256(array)}
+    meta = {
+        'format': ARTIFACT_FORMAT,
+        'version': ARTIFACT_VERSION,
+        'config_hash': config_hash,
+        'feature_schema': schema.to_dict(),
+        'n_trees': forest.n_trees,
+        'n_nodes': forest.n_nodes,
+        'max_depth': forest.max_depth,
+        'arrays': arrays,
+    }
+    with open(meta_path, 'w', encoding='utf-8') as f: # Last, so a version without it never loads
+        json.dump(meta, f, indent=2)
+    return meta
+
+
+def read_meta(directory=ARTIFACT_PATH):
+    try:
+        with open(os.path.join(directory, ARTIFACT_META), 'r', encoding='utf-8') as f:
+            meta = json.load(f)
+    except json.JSONDecodeError as e:
+        raise ArtifactError(f"Unreadable artifact metadata in {directory}: {e}") from e
+    if meta.get('format') != ARTIFACT_FORMAT or meta.get('version') != ARTIFACT_VERSION:
+        raise ArtifactError(f"Unsupported artifact {meta.get('format')!r} v{meta.get('version')!r} in {directory}; "
+                            f"expected {ARTIFACT_FORMAT!r} v{ARTIFACT_VERSION}. Re-run 'prepare_model_data.py'.")
+    return meta
+
+
+def load_artifact(directory=ARTIFACT_PATH, config_hash=None, verify=True):
+    """Memory-maps the artifact; returns (FlatForest, FeatureSchema, meta).
+
+    Pass the training `config_hash` (from the manifest) to reject an artifact left
+    over from an older training run. `verify=False` skips the checksums, which
+    read every page once.
+    """
+    directory = os.path.realpath(directory) # One version for the whole load, even if a new one is published
+    meta = read_meta(directory)
+    if config_hash is not None and meta.get('config_hash') != config_hash:
+        raise ArtifactError(f"Stale artifact in {directory}: trained with config {str(meta.get('config_hash'))[:12]}, "
+                            f"expected {config_hash[:12]}. Re-run 'prepare_model_data.py'.")
+    arrays = {}
+    for name in ARRAY_NAMES:
+        expected = meta['arrays'][name]
+        array = np.load(os.path.join(directory, f"{name}.npy"), mmap_mode='r')
+        if array.dtype.str != expected['dtype'] or list(array.shape) != expected['shape']:
+            raise ArtifactError(f"Array {name!r} in {directory} is {array.dtype.str}{list(array.shape)}, "
+                                f"expected {expected['dtype']}{expected['shape']}")
+        if np.dtype(expected['dtype']) not in (np.dtype(np.intp), np.dtype(np.float64)):
+            raise ArtifactError(f"Array {name!r} in {directory} has dtype {expected['dtype']}, "
+                                f"which this platform would have to copy; re-export the artifact.")
+        if verify and _sha256(array) != expected['sha256']:
+            raise ArtifactError(f"Checksum mismatch for {name!r} in {directory}; the artifact is corrupt.")
+        arrays[name] = array
+    schema = FeatureSchema.from_dict(meta['feature_schema'])
+    forest = FlatForest(arrays['feature'], arrays['threshold'], arrays['children'], arrays['value'],
+                        arrays['roots'], meta['max_depth'])
+    return forest, schema, meta
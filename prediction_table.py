@@ -0,0 +1,159 @@
+# -*- coding: utf-8 -*-
+"""Precomputed predictions for the common, discrete part of the input space.
+
+The app's inputs are nearly discrete: CGPA in 0.1 steps, three tiers, an MCQ
+score of 0-20 and 19 skill flags. The table holds the model's prediction for
+every CGPA grid point x tier x MCQ score x skill bitmask with at most
+`max_skills` skills set (191 masks and ~1.2M float32 values, ~5 MB, for
+max_skills=2), so those students are served by an array lookup instead of a
+forest walk. `lookup` reports which rows hit; callers predict the rest with the
+model. Values are the model's own float64 predictions stored as float32
+(within ~2e-6 LPA), and the table records the training config hash so a table
+from an older model is never used.
+    python prediction_table.py --max-skills 2      # build from the trained model
+"""
+
+import argparse
+import hashlib
+import itertools
+import json
+import os
+import time
+
+import numpy as np
+
+from feature_schema import CGPA_IDX, FEATURE_DTYPE, MCQ_IDX, TIER_IDX, FeatureSchema
+from model_artifact import ArtifactError, publish_directory
+
+TABLE_PATH = 'prediction_table'
+TABLE_VERSION = 1
+CGPA_STEPS = 101 # 0.0 .. 10.0 in 0.1 steps, the app's number_input grid
+MAX_MCQ_SCORE = 20
+
+
+def skill_masks(max_skills, n_skills):
+    """Sorted uint32 bitmasks of every skill set with at most `max_skills` skills."""
+    masks = [sum(1 << j for j in combo)
+             for k in range(max_skills + 1) for combo in itertools.combinations(range(n_skills), k)]
+    return np.array(sorted(masks), dtype=np.uint32)
+
+
+class PredictionTable:
+    """Dense (mask, tier, cgpa step, mcq score) array of model predictions."""
+
+    def __init__(self, values, masks, tier_values, meta):
+        self.values = values
+        self.masks = masks
+        self.tier_values = tier_values
+        self.meta = meta
+        self._mask_weights = (np.uint32(1) << np.arange(meta['n_skills'], dtype=np.uint32))
+        self._cgpa_grid = (np.arange(CGPA_STEPS) / 10).astype(FEATURE_DTYPE)
+
+    def __repr__(self):
+        return f"PredictionTable({len(self.masks)} skill masks, {self.values.size:,} entries)"
+
+    # --- Build ---
+
+    @classmethod
+    def build(cls, model, schema, max_skills=2, config_hash=None, rows_per_call=200_000):
+        """Predicts every grid point with `model` (anything with `predict(X)`)."""
+        masks = skill_masks(max_skills, len(schema.skills))
+        tier_values = np.array(sorted(set(schema.tier_mapping.values())), dtype=FEATURE_DTYPE)
+        grid_shape = (len(tier_values), CGPA_STEPS, MAX_MCQ_SCORE + 1)
+        tiers, cgpa, mcq = (g.ravel() for g in np.meshgrid(
+            tier_values, (np.arange(CGPA_STEPS) / 10).astype(FEATURE_DTYPE),
+            np.arange(MAX_MCQ_SCORE + 1, dtype=FEATURE_DTYPE), indexing='ij'))
+        per_mask = len(tiers)
+        bits = ((masks[:, None] >> np.arange(len(schema.skills), dtype=np.uint32)) & 1).astype(FEATURE_DTYPE)
+
+        values = np.empty((len(masks),) + grid_shape, dtype=np.float32)
+        masks_per_call = max(1, rows_per_call // per_mask)
+        X = np.empty((masks_per_call * per_mask, schema.n_features), dtype=FEATURE_DTYPE)
+        for start in range(0, len(masks), masks_per_call):
+            block = bits[start:start + masks_per_call]
+            n = len(block) * per_mask
+            X[:n, CGPA_IDX] = np.tile(cgpa, len(block))
+            X[:n, TIER_IDX] = np.tile(tiers, len(block))
+            X[:n, MCQ_IDX] = np.tile(mcq, len(block))
+            X[:n, schema.skill_offset:] = np.repeat(block, per_mask, axis=0)
+            values[start:start + len(block)] = model.predict(X[:n]).reshape((len(block),) + grid_shape)
+
+        meta = {'version': TABLE_VERSION, 'config_hash': config_hash, 'max_skills': max_skills,
+                'n_skills': len(schema.skills), 'feature_schema': schema.to_dict()}
+        return cls(values, masks, tier_values, meta)
+
+    # --- Lookup ---
+
+    def lookup(self, X):
+        """(predictions, hit) for encoded rows X; predictions are only meaningful where `hit`."""
+        X = np.atleast_2d(np.asarray(X, dtype=FEATURE_DTYPE))
+        cgpa_idx = np.rint(X[:, CGPA_IDX] * 10).astype(np.intp)
+        mcq_idx = X[:, MCQ_IDX].astype(np.intp)
+        tier_idx = np.searchsorted(self.tier_values, X[:, TIER_IDX])
+        mask = X[:, -self.meta['n_skills']:].astype(np.uint32) @ self._mask_weights
+        mask_idx = np.searchsorted(self.masks, mask)
+
+        hit = (cgpa_idx >= 0) & (cgpa_idx < CGPA_STEPS) & (mcq_idx >= 0) & (mcq_idx <= MAX_MCQ_SCORE)
+        hit &= (tier_idx < len(self.tier_values)) & (mask_idx < len(self.masks))
+        cgpa_idx, mcq_idx, tier_idx, mask_idx = (np.where(hit, i, 0) for i in (cgpa_idx, mcq_idx, tier_idx, mask_idx))
+        # Exact grid points only, so a hit returns exactly what the model would
+        hit &= self._cgpa_grid[cgpa_idx] == X[:, CGPA_IDX]
+        hit &= mcq_idx == X[:, MCQ_IDX]
+        hit &= self.tier_values[tier_idx] == X[:, TIER_IDX]
+        hit &= self.masks[mask_idx] == mask
+        return self.values[mask_idx, tier_idx, cgpa_idx, mcq_idx].astype(np.float64), hit
+
+    # --- Persistence ---
+
+    def save(self, directory=TABLE_PATH):
+        """Publishes the table as a new version, never touching files that workers have mapped."""
+        publish_directory(self._write, directory)
+
+    def _write(self, directory):
+        os.makedirs(directory)
+        for name in ('values', 'masks', 'tier_values'):
+            np.save(os.path.join(directory, f"{name}.npy"), getattr(self, name))
+        meta = dict(self.meta, sha256=hashlib.sha256(self.values.tobytes()).hexdigest())
+        with open(os.path.join(directory, 'meta.json'), 'w', encoding='utf-8') as f: # Last: marks the table complete
+            json.dump(meta, f, indent=2)
+
+    @classmethod
+    def load(cls, directory=TABLE_PATH, config_hash=None, schema=None):
+        """Memory-maps a saved table; raises ArtifactError if it is stale or corrupt."""
+        directory = os.path.realpath(directory) # One version for the whole load
+        with open(os.path.join(directory, 'meta.json'), 'r', encoding='utf-8') as f:
+            meta = json.load(f)
+        if meta.get('version') != TABLE_VERSION:
+            raise ArtifactError(f"Unsupported prediction table version {meta.get('version')!r} in {directory}")
+        if config_hash is not None and meta.get('config_hash') != config_hash:
+            raise ArtifactError(f"Prediction table in {directory} was built for another model; rebuild it.")
+        if schema is not None and FeatureSchema.from_dict(meta['feature_schema']) != schema:
+            raise ArtifactError(f"Prediction table in {directory} uses a different feature schema; rebuild it.")
+        arrays = {name: np.load(os.path.join(directory, f"{name}.npy"), mmap_mode='r')
+                  for name in ('values', 'masks', 'tier_values')}
+        if hashlib.sha256(arrays['values'].tobytes()).hexdigest() != meta['sha256']:
+            raise ArtifactError(f"Checksum mismatch for the prediction table in {directory}; rebuild it.")
+        return cls(arrays['values'], np.asarray(arrays['masks']), np.asarray(arrays['tier_values']), meta)
+
+
+def main():
+    from predictor import MANIFEST_PATH, MODEL_PATH, load_model, trained_config_hash
+
+    parser = argparse.ArgumentParser(description="Build the precomputed prediction table from the trained model.")
+    parser.add_argument('--max-skills', type=int, default=2, help="Largest skill set stored exactly.")
+    parser.add_argument('--output', default=TABLE_PATH)
+    args = parser.parse_args()
+
+    model, schema = load_model()
+    if os.path.exists(MODEL_PATH):
+        import joblib
+
+        model = joblib.load(MODEL_PATH) # Same predictions; scikit-learn is faster on large batches
+    start = time.perf_counter()
+    table = PredictionTable.build(model, schema, args.max_skills, trained_config_hash(MANIFEST_PATH))
+    table.save(args.output)
+    print(f"{table} built in {time.perf_counter() - start:.1f}s -> {args.output} ({table.values.nbytes / 1e6:.1f} MB)")
+
+
+if __name__ == '__main__':
+    main()
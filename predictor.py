@@ -0,0 +1,104 @@
+# -*- coding: utf-8 -*-
+"""Model loading and prediction shared by the Streamlit app and the HTTP API."""
+
+import json
+import os
+
+import numpy as np
+
+import metrics
+from feature_schema import FEATURE_SCHEMA_PATH, FeatureSchema
+from model_artifact import ARTIFACT_PATH, ArtifactError, load_artifact
+from prediction_table import TABLE_PATH, PredictionTable
+
+MODEL_PATH = 'package_predictor_model.pkl'
+MANIFEST_PATH = 'training_manifest.json'
+
+
+def trained_config_hash(manifest_path=MANIFEST_PATH):
+    """Config hash of the last training run, used to reject a stale serving artifact."""
+    try:
+        with open(manifest_path, 'r', encoding='utf-8') as f:
+            return json.load(f).get('config_hash')
+    except (FileNotFoundError, json.JSONDecodeError):
+        return None
+
+
+def load_model(artifact_path=ARTIFACT_PATH, model_path=MODEL_PATH, schema_path=FEATURE_SCHEMA_PATH,
+               manifest_path=MANIFEST_PATH):
+    """(FlatForest, FeatureSchema): the memory-mapped artifact if present, else the flattened pickle.
+
+    Raises FileNotFoundError when neither exists (run prepare_model_data.py).
+    """
+    if os.path.exists(artifact_path):
+        # Memory-mapped tree arrays: shared across server processes, no unpickling
+        forest, schema, _ = load_artifact(artifact_path, config_hash=trained_config_hash(manifest_path))
+        return forest, schema
+
+    import joblib
+    from tree_engine import export_forest
+
+    model = joblib.load(model_path)
+    schema = FeatureSchema.load(schema_path)
+    if model.n_features_in_ != schema.n_features:
+        raise ValueError(f"model expects {model.n_features_in_} features but the schema defines "
+                         f"{schema.n_features}; re-run 'prepare_model_data.py'.")
+    # Single-row predictions walk the flattened trees instead of calling model.predict
+    return export_forest(model), schema
+
+
+def load_prediction_table(schema, table_path=TABLE_PATH, manifest_path=MANIFEST_PATH):
+    """The precomputed prediction table if one was built for the current model, else None.
+
+    The table is only an accelerator, so a missing or stale one just means every
+    prediction walks the model.
+    """
+    if not os.path.exists(table_path):
+        return None
+    try:
+        return PredictionTable.load(table_path, config_hash=trained_config_hash(manifest_path), schema=schema)
+    except (ArtifactError, OSError, ValueError) as e:
+        print(f"Ignoring prediction table: {e}")
+        return None
+
+
+class Predictor:
+    """Encodes students through the feature schema and predicts their package in LPA.
+
+    With a PredictionTable, students on its grid are answered by lookup and only
+    the rest reach the model.
+    """
+
+    def __init__(self, model, schema, table=None):
+        self.model = model
+        self.schema = schema
+        self.table = table
+
+    @classmethod
+    def load(cls, table_path=TABLE_PATH, **paths):
+        with metrics.span('predictor.load'):
+            model, schema = load_model(**paths)
+            manifest_path = paths.get('manifest_path', MANIFEST_PATH)
+            return cls(model, schema, load_prediction_table(schema, table_path, manifest_path))
+
+    def predict_rows(self, X):
+        """Predictions for encoded rows: table lookups, with the model for the misses."""
+        with metrics.span('predictor.predict_rows'):
+            if self.table is None:
+                return self.model.predict(X)
+            values, hit = self.table.lookup(X)
+            if not hit.all():
+                values[~hit] = self.model.predict(X[~hit])
+            return values
+
+    def predict(self, cgpa, college_tier, mcq_score, skills=()):
+        """Predicted package for one student, rounded to 2 decimals."""
+        row = self.schema.encode(cgpa, college_tier, mcq_score, skills)
+        return round(float(self.predict_rows(row)[0]), 2)
+
+    def predict_batch(self, students):
+        """Predicted packages for (cgpa, college_tier, mcq_score, skills) tuples, in one model call."""
+        X = np.zeros((len(students), self.schema.n_features), dtype=np.float32)
+        for i, (cgpa, college_tier, mcq_score, skills) in enumerate(students):
+            self.schema.encode(cgpa, college_tier, mcq_score, skills, out=X[i:i + 1])
+        return self.predict_rows(X).round(2)
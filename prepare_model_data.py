@@ -0,0 +1,269 @@
+# -*- coding: utf-8 -*-
+"""Prepare Dummy Data and Train Model (training CLI)
+
+Generates the synthetic placement dataset, trains the package predictor and saves
+the artifacts loaded by the Streamlit app
+(`streamlit run script_to_prepare_dummy_data_and_train_model.py`).
+
+The fit is skipped when the training config and generated data hash to the same
+values as the last run recorded in the manifest, so re-running is cheap:
+    python prepare_model_data.py            # train if anything changed
+    python prepare_model_data.py --force    # always retrain
+
+Data is generated in chunks into compact NumPy columns (`dataset_store`). With
+`--data-dir` the columns are memory-mapped .npy files, reused across runs, and
+datasets bigger than `--rows-per-shard` are trained out of core: the forest grows
+shard by shard with `warm_start`, each shard's trees fitted on one block of rows
+read from the memmap, so peak memory follows the shard size, not the dataset
+(sharded trees default to `--min-samples-leaf 50` so the forest itself stays small):
+    python prepare_model_data.py --num-samples 50000000 --data-dir data/synthetic
+
+Trees are built on every core (`--n-jobs`, default all), and `--add-trees N` grows
+the saved forest with N more trees fitted on a new batch instead of refitting:
+    python prepare_model_data.py --seed 43 --add-trees 20
+All randomness (data, sharding, the forest) derives from `--seed` through one
+`SeedSequence`, so runs are reproducible.
+"""
+
+import argparse
+import hashlib
+import json
+import os
+import sys
+import time
+
+import numpy as np
+
+from dataset_store import ColumnarDataset, generate_dataset, shard_rows
+from feature_schema import FEATURE_SCHEMA_PATH, FeatureSchema
+from model_artifact import ARTIFACT_PATH, save_artifact
+from prediction_table import TABLE_PATH, PredictionTable
+from synthetic_data import DEFAULT_CHUNK_SIZE, NUM_SAMPLES, COMMON_SKILLS
+
+MODEL_PATH = 'package_predictor_model.pkl'
+MANIFEST_PATH = 'training_manifest.json'
+DEFAULT_ROWS_PER_SHARD = 2_000_000 # ~180 MB of float32 features per shard
+EVAL_ROWS = 200_000 # Rows used for the training R^2 printout
+# Default leaf size once data is sharded: a fully grown tree on a 2M-row shard has
+# millions of nodes, so a forest of them would not fit in memory (or the artifact)
+SHARDED_MIN_SAMPLES_LEAF = 50
+
+
+def build_config(args, schema):
+    """Everything that influences the trained model, used for the config hash."""
+    return {
+        'num_samples': args.num_samples,
+        'seed': args.seed,
+        'n_estimators': args.n_estimators,
+        'max_depth': args.max_depth,
+        'min_samples_leaf': args.min_samples_leaf,
+        'random_state': args.random_state,
+        'chunk_size': args.chunk_size,
+        'rows_per_shard': args.rows_per_shard,
+        'feature_schema': schema.to_dict(),
+    }
+
+
+def hash_config(config):
+    return hashlib.sha256(json.dumps(config, sort_keys=True).encode('utf-8')).hexdigest()
+
+
+def load_manifest(path):
+    try:
+        with open(path, 'r', encoding='utf-8') as f:
+            return json.load(f)
+    except (FileNotFoundError, json.JSONDecodeError):
+        return None
+
+
+def is_up_to_date(manifest, config_hash, data_hash, artifact_paths):
+    if manifest is None:
+        return False
+    if manifest.get('config_hash') != config_hash or manifest.get('data_hash') != data_hash:
+        return False
+    return all(os.path.exists(p) for p in artifact_paths)
+
+
+def parse_args(argv=None):
+    parser = argparse.ArgumentParser(description="Generate dummy placement data and train the package predictor.")
+    parser.add_argument('--num-samples', type=int, default=NUM_SAMPLES, help="Number of synthetic data points.")
+    parser.add_argument('--seed', type=int, default=42, help="Seed for data generation, sharding and the forest.")
+    parser.add_argument('--n-estimators', type=int, default=100)
+    parser.add_argument('--max-depth', type=int, help="Tree depth limit (default: unlimited); see tune_model.py.")
+    parser.add_argument('--min-samples-leaf', type=int,
+                        help=f"Minimum rows per leaf (default: 1, or {SHARDED_MIN_SAMPLES_LEAF} when training "
+                             f"shard by shard).")
+    parser.add_argument('--random-state', type=int, help="RandomForest random_state (default: derived from --seed).")
+    parser.add_argument('--n-jobs', type=int, default=-1, help="Cores used to build trees (-1: all).")
+    parser.add_argument('--add-trees', type=int, default=0,
+                        help="Add this many trees to the saved model, fitted on all of this run's data "
+                             "(warm_start; with fewer trees than shards, shards are merged).")
+    parser.add_argument('--output-dir', default='.', help="Directory the artifacts are written to.")
+    parser.add_argument('--data-dir', help="Keep the generated dataset here as memory-mapped .npy columns "
+                                           "(reused while --num-samples/--seed/--chunk-size match).")
+    parser.add_argument('--chunk-size', type=int, default=DEFAULT_CHUNK_SIZE, help="Rows generated per chunk.")
+    parser.add_argument('--rows-per-shard', type=int, default=DEFAULT_ROWS_PER_SHARD,
+                        help="Larger datasets are trained shard by shard with warm_start.")
+    parser.add_argument('--prediction-table', type=int, metavar='MAX_SKILLS',
+                        help="Also precompute predictions for skill sets of up to MAX_SKILLS skills.")
+    parser.add_argument('--force', action='store_true', help="Retrain even if the data and config are unchanged.")
+    return parser.parse_args(argv)
+
+
+def seed_streams(seed):
+    """Independent generators for the data and the sharding, and an int forest seed, all from one seed."""
+    data, shards, forest = np.random.SeedSequence(seed).spawn(3)
+    return np.random.default_rng(data), np.random.default_rng(shards), int(forest.generate_state(1)[0])
+
+
+def load_dataset(args, schema, rng):
+    """Opens the dataset in `--data-dir` if it was generated with the same settings, else generates it."""
+    meta = {'num_samples': args.num_samples, 'seed': args.seed, 'chunk_size': args.chunk_size}
+    if args.data_dir:
+        try:
+            dataset = ColumnarDataset.open(args.data_dir)
+            if dataset.skills == schema.skills and all(dataset.meta.get(k) == v for k, v in meta.items()):
+                return dataset, True
+        except (OSError, ValueError, KeyError):
+            pass
+    dataset = generate_dataset(rng, args.num_samples, schema, args.data_dir, args.chunk_size, meta)
+    return dataset, False
+
+
+def grow_forest(model, dataset, schema, n_trees, rows_per_shard, rng):
+    """Adds `n_trees` trees to `model` with warm_start: all rows at once, or one shard at a time.
+
+    Every row trains at least one tree. With more shards than new trees, shards
+    are merged round-robin into `n_trees` larger ones (with a warning, since each
+    then needs more memory than `rows_per_shard`). An unfitted model with `n_trees`
+    == n_estimators fitted on a single shard is exactly a plain `fit`. Returns the
+    number of shards used.
+    """
+    if len(dataset) <= rows_per_shard:
+        shards = [slice(None)]
+        buffer = None
+    else:
+        shards = shard_rows(len(dataset), rows_per_shard, rng)
+        if len(shards) > n_trees:
+            shards = [np.sort(np.concatenate(shards[i::n_trees])) for i in range(n_trees)]
+            print(f"Warning: {len(dataset):,} rows make more shards than the {n_trees} trees being grown; "
+                  f"merged into {n_trees} shard(s) of up to {max(map(len, shards)):,} rows "
+                  f"(--rows-per-shard {rows_per_shard:,}). Grow more trees to keep shards small.",
+                  file=sys.stderr)
+        buffer = np.empty((max(len(rows) for rows in shards), schema.n_features), dtype=np.float32)
+    trees_per_shard = np.full(len(shards), n_trees // len(shards))
+    trees_per_shard[:n_trees % len(shards)] += 1
+
+    n_fitted = len(getattr(model, 'estimators_', ()))
+    model.set_params(warm_start=True)
+    for rows, k in zip(shards, trees_per_shard):
+        n_fitted += int(k)
+        model.set_params(n_estimators=n_fitted)
+        model.fit(dataset.features(schema, rows, out=buffer), dataset.target(rows))
+    model.set_params(warm_start=False)
+    return len(shards)
+
+
+def main(argv=None):
+    args = parse_args(argv)
+    model_path = os.path.join(args.output_dir, MODEL_PATH)
+    schema_path = os.path.join(args.output_dir, FEATURE_SCHEMA_PATH)
+    manifest_path = os.path.join(args.output_dir, MANIFEST_PATH)
+    artifact_path = os.path.join(args.output_dir, ARTIFACT_PATH)
+    table_path = os.path.join(args.output_dir, TABLE_PATH)
+    schema = FeatureSchema(COMMON_SKILLS)
+    data_rng, shard_rng, forest_seed = seed_streams(args.seed)
+    if args.random_state is None:
+        args.random_state = forest_seed
+    if args.min_samples_leaf is None:
+        args.min_samples_leaf = SHARDED_MIN_SAMPLES_LEAF if args.num_samples > args.rows_per_shard else 1
+
+    # --- Generate Synthetic Data ---
+    # Columns are stored compactly (float32 CGPA, int8 tier, uint8 MCQ/skills) and
+    # encoded into float32 features through the same schema the app predicts with
+    dataset, reused = load_dataset(args, schema, data_rng)
+    data_hash = dataset.content_hash()
+
+    import joblib
+
+    if args.add_trees:
+        # --- Grow the Saved Model on a New Batch ---
+        manifest = load_manifest(manifest_path)
+        if manifest is None or not os.path.exists(model_path):
+            raise SystemExit(f"--add-trees needs a trained model and manifest in {args.output_dir!r}.")
+        if FeatureSchema.load(schema_path) != schema:
+            raise SystemExit("--add-trees: the saved model was trained with a different feature schema.")
+        model = joblib.load(model_path)
+        model.set_params(n_jobs=args.n_jobs)
+        start = time.perf_counter()
+        n_shards = grow_forest(model, dataset, schema, args.add_trees, args.rows_per_shard, shard_rng)
+        train_secs = time.perf_counter() - start
+        config = dict(manifest['config'])
+        config['batches'] = config.get('batches', []) + [
+            {'seed': args.seed, 'num_samples': args.num_samples, 'data_hash': data_hash, 'trees': args.add_trees,
+             'rows_per_shard': args.rows_per_shard, 'shards': n_shards}]
+        config_hash = hash_config(config) # No longer matches a plain run, which retrains from scratch
+        data_hash = manifest['data_hash']
+        print(f"Added {args.add_trees} trees on all {len(dataset):,} new rows in {n_shards} shard(s) ({train_secs:.2f}s); "
+              f"forest now has {len(model.estimators_)} trees.")
+    else:
+        config = build_config(args, schema)
+        config_hash = hash_config(config)
+        if not args.force and is_up_to_date(load_manifest(manifest_path), config_hash, data_hash,
+                                            [model_path, schema_path, artifact_path]
+                                            + ([table_path] if args.prediction_table is not None else [])):
+            print(f"Training data and config unchanged (config {config_hash[:12]}, data {data_hash[:12]}); "
+                  f"skipping fit. Use --force to retrain.")
+            return
+
+        # --- Train Model ---
+        from sklearn.ensemble import RandomForestRegressor
+
+        model = RandomForestRegressor(n_estimators=args.n_estimators, max_depth=args.max_depth,
+                                      min_samples_leaf=args.min_samples_leaf, random_state=args.random_state,
+                                      n_jobs=args.n_jobs)
+        start = time.perf_counter()
+        n_shards = grow_forest(model, dataset, schema, args.n_estimators, args.rows_per_shard, shard_rng)
+        train_secs = time.perf_counter() - start
+    model.set_params(n_jobs=None) # Serving predicts a row at a time; don't spin up a pool per call
+
+    # --- Save Model and Feature Schema ---
+    from tree_engine import export_forest
+
+    os.makedirs(args.output_dir, exist_ok=True)
+    joblib.dump(model, model_path) # scikit-learn model, for --add-trees and batch scoring
+    schema.save(schema_path) # Feature order and skill/tier encoding the model was trained on
+    # Loaders check the artifact against the manifest's config hash, so the new manifest
+    # is written up front and swapped in right after the artifact
+    manifest_tmp = f"{manifest_path}.tmp"
+    with open(manifest_tmp, 'w', encoding='utf-8') as f:
+        json.dump({'config_hash': config_hash, 'data_hash': data_hash, 'config': config,
+                   'train_seconds': round(train_secs, 3), 'shards': n_shards, 'n_jobs': args.n_jobs}, f, indent=2)
+    try:
+        save_artifact(export_forest(model), schema, artifact_path, config_hash) # Memory-mapped by the app
+    except BaseException:
+        os.remove(manifest_tmp)
+        raise
+    os.replace(manifest_tmp, manifest_path)
+    if args.prediction_table is not None:
+        PredictionTable.build(model, schema, args.prediction_table, config_hash).save(table_path)
+
+    print("Dummy data generated, model trained, and saved successfully:")
+    print(f"  - Model: {model_path}")
+    print(f"  - Serving artifact: {artifact_path}")
+    if args.prediction_table is not None:
+        print(f"  - Prediction table: {table_path}")
+    print(f"  - Feature schema: {schema_path}")
+    print(f"  - Manifest: {manifest_path}")
+    if args.data_dir:
+        print(f"  - Dataset ({'reused' if reused else 'generated'}): {args.data_dir}")
+    print("\nSample of generated data:")
+    print(dataset.head_frame(schema))
+    print(f"\n{len(dataset):,} rows ({dataset.nbytes / 1e6:.1f} MB), trained in {train_secs:.2f}s "
+          f"over {n_shards} shard(s)")
+    eval_rows = slice(0, min(len(dataset), EVAL_ROWS))
+    print(f"Model R^2 score: {model.score(dataset.features(schema, eval_rows), dataset.target(eval_rows)):.2f}") # Evaluate on training data
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,87 @@
+# -*- coding: utf-8 -*-
+"""Immutable, precomputed MCQ question banks.
+
+Each question is an `MCQ` record with its options as a tuple and the correct
+answer stored as an option index. A `QuestionBank` keeps its answer key as an
+int8 array, so grading an answer vector (option indices, -1 for unanswered) is
+one vectorized comparison, and `score_batch` grades N submissions at once.
+"""
+
+import numpy as np
+
+UNANSWERED = -1
+
+
+class MCQ:
+    """One multiple-choice question with a precomputed option -> index map."""
+
+    __slots__ = ('question', 'options', 'correct_index', '_option_index')
+
+    def __init__(self, question, options, correct):
+        self.question = question
+        self.options = tuple(options)
+        self._option_index = {option: i for i, option in enumerate(self.options)}
+        self.correct_index = self._option_index[correct]
+
+    @property
+    def correct(self):
+        return self.options[self.correct_index]
+
+    def option_index(self, answer):
+        """Index of the chosen option text, or UNANSWERED for None / unknown text."""
+        return self._option_index.get(answer, UNANSWERED)
+
+    def __repr__(self):
+        return f"MCQ({self.question!r})"
+
+
+class QuestionBank:
+    """An immutable tuple of MCQs plus its int8 answer key."""
+
+    __slots__ = ('name', 'key', 'questions', 'correct')
+
+    def __init__(self, name, key, questions):
+        object.__setattr__(self, 'name', name)
+        object.__setattr__(self, 'key', key) # Session-state key suffix, e.g. 'domain'
+        object.__setattr__(self, 'questions', tuple(questions))
+        correct = np.array([q.correct_index for q in self.questions], dtype=np.int8)
+        correct.setflags(write=False)
+        object.__setattr__(self, 'correct', correct)
+
+    def __setattr__(self, name, value):
+        raise AttributeError(f"{type(self).__name__} is immutable")
+
+    @classmethod
+    def from_dicts(cls, name, key, mcqs):
+        """Builds a bank from {"question", "options", "correct"} dicts."""
+        return cls(name, key, (MCQ(m["question"], m["options"], m["correct"]) for m in mcqs))
+
+    def __len__(self):
+        return len(self.questions)
+
+    def __iter__(self):
+        return iter(self.questions)
+
+    def __getitem__(self, i):
+        return self.questions[i]
+
+    def __repr__(self):
+        return f"QuestionBank({self.name!r}, {len(self)} questions)"
+
+    def empty_answers(self):
+        return np.full(len(self), UNANSWERED, dtype=np.int8)
+
+    def encode_answers(self, answer_texts):
+        """Option texts (None for unanswered) -> int8 answer vector."""
+        return np.fromiter((q.option_index(a) for q, a in zip(self.questions, answer_texts)),
+                           dtype=np.int8, count=len(self))
+
+    def score(self, answers):
+        """Number of correct answers in one int answer vector."""
+        return int(np.count_nonzero(np.asarray(answers) == self.correct))
+
+    def score_batch(self, answers):
+        """Correct-answer counts for an (N, len(bank)) matrix of answer vectors."""
+        return np.count_nonzero(np.asarray(answers) == self.correct, axis=1)
+
+
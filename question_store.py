@@ -0,0 +1,141 @@
+# -*- coding: utf-8 -*-
+"""Indexed, lazily loaded question-bank store.
+
+Questions live in a JSONL file, one record per line:
+    {"stream": ..., "category": "domain" | "coding_dsa", "question": ..., "options": [...], "correct": ...}
+On first use the store builds an index of byte offsets per (stream, category) and
+saves it next to the file (`<file>.idx.json`, rebuilt when the file changes).
+Loading a stream then seeks straight to its lines, so adding thousands of
+questions for other streams costs neither import time nor memory. Loaded banks
+are cached for the life of the store.
+"""
+
+import json
+import os
+import threading
+
+import numpy as np
+
+from question_bank import QuestionBank
+
+QUESTIONS_PATH = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'data', 'questions.jsonl')
+INDEX_VERSION = 1
+MCQS_PER_CATEGORY = 10 # Questions sampled per category for each attempt
+
+CATEGORY_TITLES = {
+    'domain': "Domain Specific MCQs",
+    'coding_dsa': "Coding & DSA Basic MCQs",
+}
+
+
+class QuestionStore:
+    """Per-(stream, category) access to a JSONL question file."""
+
+    def __init__(self, path=QUESTIONS_PATH):
+        self.path = path
+        self.index_path = path + '.idx.json'
+        self._index = None # (stream, category) -> [byte offsets]
+        self._banks = {}
+        self._lock = threading.Lock()
+
+    # --- Index ---
+
+    def _file_signature(self):
+        st = os.stat(self.path)
+        return [st.st_size, st.st_mtime_ns]
+
+    def _build_index(self):
+        index = {}
+        with open(self.path, 'rb') as f:
+            offset = 0
+            for line in f:
+                if line.strip():
+                    record = json.loads(line)
+                    index.setdefault((record['stream'], record['category']), []).append(offset)
+                offset += len(line)
+        return index
+
+    def _load_index(self):
+        signature = self._file_signature()
+        try:
+            with open(self.index_path, 'r', encoding='utf-8') as f:
+                saved = json.load(f)
+            if saved.get('version') == INDEX_VERSION and saved.get('signature') == signature:
+                return {tuple(k.split('\t')): v for k, v in saved['offsets'].items()}
+        except (OSError, ValueError):
+            pass
+        index = self._build_index()
+        try:
+            with open(self.index_path, 'w', encoding='utf-8') as f:
+                json.dump({'version': INDEX_VERSION, 'signature': signature,
+                           'offsets': {'\t'.join(k): v for k, v in index.items()}}, f)
+        except OSError:
+            pass # Read-only deployment: keep the in-memory index
+        return index
+
+    @property
+    def index(self):
+        if self._index is None:
+            with self._lock:
+                if self._index is None:
+                    self._index = self._load_index()
+        return self._index
+
+    def streams(self):
+        """Streams that have at least one question, in file order."""
+        return list(dict.fromkeys(stream for stream, _ in self.index))
+
+    def categories(self, stream):
+        return [category for s, category in self.index if s == stream]
+
+    def count(self, stream, category):
+        return len(self.index.get((stream, category), ()))
+
+    # --- Loading ---
+
+    def _read_records(self, offsets):
+        records = []
+        with open(self.path, 'rb') as f:
+            for offset in offsets:
+                f.seek(offset)
+                records.append(json.loads(f.readline()))
+        return records
+
+    def load(self, stream, category):
+        """The full QuestionBank for one stream and category (loaded on first use, then cached)."""
+        key = (stream, category)
+        bank = self._banks.get(key)
+        if bank is None:
+            offsets = self.index.get(key)
+            if not offsets:
+                raise KeyError(f"No {category!r} questions for stream {stream!r}")
+            title = CATEGORY_TITLES.get(category, category)
+            bank = QuestionBank.from_dicts(title, category, self._read_records(offsets))
+            with self._lock:
+                bank = self._banks.setdefault(key, bank)
+        return bank
+
+    def sample(self, stream, category, k, seed):
+        """A seeded random subset of at most `k` questions, in random order."""
+        bank = self.load(stream, category)
+        order = np.random.default_rng(seed).permutation(len(bank))[:k]
+        return QuestionBank(bank.name, bank.key, (bank[i] for i in order))
+
+    def assessment(self, stream, k, seed):
+        """The seeded samples one attempt answers, {category: QuestionBank}; category i uses `seed + i`."""
+        return {category: self.sample(stream, category, k, seed + i)
+                for i, category in enumerate(CATEGORY_TITLES) if self.count(stream, category)}
+
+
+def score_answer_texts(banks, answers):
+    """Total correct answers for {category: [option text or None, ...]} against `assessment` banks.
+
+    Lists shorter than a bank count the rest as unanswered; unknown categories raise KeyError.
+    """
+    total = 0
+    for category, texts in answers.items():
+        bank = banks[category]
+        texts = list(texts)[:len(bank)]
+        texts += [None] * (len(bank) - len(texts))
+        total += bank.score(bank.encode_answers(texts))
+    return total
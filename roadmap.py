@@ -0,0 +1,169 @@
+# -*- coding: utf-8 -*-
+"""Career roadmap prompt and the offline (simulated) roadmap template.
+
+Shared by the Streamlit app and anything else that generates roadmaps, so the
+Gemini prompt and the offline response stay in one place.
+"""
+
+import os
+import re
+import textwrap
+
+import metrics
+from llm_client import GeminiBackend, LLMClient, SimulatedBackend
+
+ROADMAP_ARGS = ('stream', 'mcq_score', 'total_questions', 'strengths_input_str', 'expected_package_lpa',
+                'target_package_lpa', 'time_left_months')
+
+
+def build_roadmap_prompt(stream, mcq_score, total_questions, strengths_input_str, expected_package_lpa,
+                         target_package_lpa, time_left_months):
+    """The Gemini prompt for a personalized career roadmap."""
+    return textwrap.dedent(f"""
+        Generate a personalized career roadmap for a student in {stream}.
+        The student's combined basic technical understanding (based on MCQs) is {mcq_score}/{total_questions}.
+        Their self-identified strengths/skills include: {strengths_input_str if strengths_input_str else 'None explicitly mentioned'}.
+        Their estimated current package is {expected_package_lpa} LPA.
+        Their target package is approximately {target_package_lpa} Lakhs per Annum (LPA) within the next {time_left_months} months.
+
+        The roadmap should be structured into these sections:
+        1.  **Core Technical Skill Development:** Specific to their stream and aimed at improving their current basic understanding. Focus heavily on DSA and programming fundamentals given the MCQ score.
+        2.  **Advanced / Niche Skill Acquisition:** Based on their target package, suggesting specialized skills relevant to high-paying roles in {stream}.
+        3.  **Project Work & Portfolio Building:** Types of projects to undertake to showcase skills.
+        4.  **Soft Skills & Communication:** Importance and how to develop for professional growth.
+        5.  **Interview Preparation Strategy:** What to focus on for cracking interviews (Technical and HR).
+        6.  **Networking & Job Search:** Tips for finding and securing opportunities.
+
+        Provide actionable, specific advice for each section, considering the time constraint. Ensure the advice is practical and progressive. Format the output as Markdown.
+    """)
+
+
+def simulated_roadmap(stream, mcq_score, total_questions, strengths_input_str, expected_package_lpa,
+                      target_package_lpa, time_left_months):
+    """Offline roadmap used when no LLM backend is configured (Canvas / local development)."""
+    return textwrap.dedent(f"""
+        **Comprehensive Roadmap for a {stream} Student to Achieve {target_package_lpa} LPA in {time_left_months} Months:**
+
+        Your current MCQ score of **{mcq_score}/{total_questions}** indicates a foundation that needs strengthening, particularly in core DSA and programming fundamentals. Your self-identified strengths like **"{strengths_input_str}"** are a good starting point. This roadmap will guide you from your current estimated package of **{expected_package_lpa} LPA** to your target of **{target_package_lpa} LPA**.
+
+        1.  **Core Technical Skill Development (Months 1-{min(time_left_months, 4)}):**
+            * **Data Structures & Algorithms (DSA):** This is paramount. Dedicate 2-3 hours daily.
+                * **Concepts:** Master Arrays, Linked Lists, Stacks, Queues, Trees (BSTs, Heaps), Graphs (BFS, DFS), Hash Maps.
+                * **Algorithms:** Sorting (Merge, Quick), Searching (Binary Search), Recursion, Dynamic Programming (basic problems), Greedy algorithms.
+                * **Practice:** Solve at least 100-150 problems on platforms like LeetCode (Easy & Medium), HackerRank, or GeeksforGeeks. Prioritize frequently asked interview questions.
+            * **Programming Language Proficiency:** Deepen your expertise in **Python/Java/C++** (whichever you prefer for coding interviews). Understand its standard library, nuances, and Object-Oriented Programming (OOP) concepts thoroughly.
+            * **Core CS Fundamentals:** Revise key concepts from Operating Systems (Process Management, Memory Management), Database Management Systems (SQL queries, normalization, ACID properties), and Computer Networks (OSI/TCP-IP model, common protocols). Aim for conceptual clarity.
+
+        2.  **Advanced / Niche Skill Acquisition (Months {min(time_left_months, 5)}-{min(time_left_months, 10)}):**
+            * To reach {target_package_lpa} LPA, specialization is key. Based on typical high-paying CSE roles, consider:
+                * **Full-Stack Web Development:** (If you enjoy building applications) Choose a modern stack (e.g., MERN: MongoDB, Express.js, React, Node.js; or Django/Flask with React/Vue). Build at least 2 complex web apps.
+                * **Machine Learning/AI:** (If you have a strong math/stats background) Learn Python libraries (NumPy, Pandas, Scikit-learn, TensorFlow/PyTorch). Focus on supervised/unsupervised learning, deep learning basics. Complete 1-2 ML projects end-to-end.
+                * **Cloud Computing:** (Highly in-demand) Get a foundational certification like AWS Cloud Practitioner or Azure Fundamentals. Understand cloud services (compute, storage, networking, databases).
+                * **DevOps/SRE:** (If interested in infrastructure) Learn Docker, Kubernetes, CI/CD tools (Jenkins/GitLab CI), and scripting (Bash/Python).
+            * **Deep Dive:** Select **one** primary area and become proficient. Don't try to learn everything at once.
+
+        3.  **Project Work & Portfolio Building (Concurrent with skill acquisition):**
+            * **Minimum 3 Strong Projects:** Build projects that showcase your core and advanced skills.
+            * **Variety:** Aim for projects that solve real-world problems or demonstrate complex functionalities (e.g., a full-stack e-commerce site, an ML-powered recommendation system, a cloud-deployed microservice).
+            * **GitHub Portfolio:** Maintain a well-organized GitHub profile. Each project should have a clear README, screenshots/demos, and instructions for setup.
+            * **Personal Website/Blog:** (Optional, but recommended) Create a simple website to host your projects and write about your learning journey.
+
+        4.  **Soft Skills & Communication (Ongoing):**
+            * **Problem Solving:** Actively practice critical thinking for coding and design problems.
+            * **Communication:** Work on articulating technical concepts clearly. Practice explaining project architectures.
+            * **Teamwork:** Participate in group projects, hackathons. Be a good collaborator.
+            * **Active Listening:** Essential for understanding requirements and feedback.
+
+        5.  **Interview Preparation Strategy (Months {time_left_months - 3}-{time_left_months}):**
+            * **Company-Specific Prep:** Research companies you're targeting (values, culture, common interview questions).
+            * **Technical Rounds:**
+                * **DSA:** Practice solving problems under timed conditions.
+                * **Core CS:** Be ready for questions on OS, DBMS, Networks, OOPs, etc.
+                * **System Design:** For higher packages, understand basic system design principles (scalability, reliability, databases, APIs).
+            * **Behavioral/HR Rounds:** Prepare common HR questions like "Tell me about yourself," "Why this company?", "Strengths/Weaknesses," "Conflict resolution." Have STAR (Situation, Task, Action, Result) stories ready.
+                * **Mock Interviews:** Conduct mock interviews with peers, seniors, or professional services. Get constructive feedback.
+
+        6.  **Networking & Job Search (Months {time_left_months - 2}-{time_left_months}):**
+            * **LinkedIn:** Optimize your profile with keywords, showcase projects, and connect with recruiters and professionals in your target companies/industries.
+            * **Job Boards:** Actively apply on platforms like LinkedIn Jobs, Indeed, Naukri, Glassdoor, and company career pages.
+            * **Referrals:** Reach out to your alumni network, professors, or industry contacts for referrals. Referrals significantly boost chances.
+            * **Career Fairs:** Attend campus or virtual career fairs.
+            * **Tailor Applications:** Customize your resume and cover letter for each job application.
+
+        **Market Trends (General Guidance):**
+        Currently, the market values strong problem-solvers with practical project experience and specialization in areas like AI/ML, Cloud, and advanced Web/Mobile development. Adaptability and continuous learning are key.
+
+        Remember, consistency is key. Even small, daily efforts accumulate into significant progress over time. Good luck with your placements!
+    """)
+
+
+# Top-level lines that open a new roadmap section ("1.  **Core ...", "**Market Trends ...")
+SECTION_START = re.compile(r'^(?:\d+\.\s|\*\*)')
+
+
+def split_roadmap_sections(markdown):
+    """Splits a roadmap into its heading/intro, numbered sections and closing notes."""
+    sections, current = [], []
+    for line in markdown.strip('\n').split('\n'):
+        if SECTION_START.match(line) and any(l.strip() for l in current):
+            sections.append('\n'.join(current).strip('\n') + '\n\n')
+            current = []
+        current.append(line)
+    if current:
+        sections.append('\n'.join(current).strip('\n') + '\n')
+    return sections
+
+
+def simulated_roadmap_sections(**roadmap_args):
+    """The offline roadmap yielded one section at a time."""
+    yield from split_roadmap_sections(simulated_roadmap(**roadmap_args))
+
+
+# --- LLM Client ---
+
+def roadmap_client_from_env():
+    """LLMClient for roadmaps, configured from the environment.
+
+    ROADMAP_BACKEND selects 'simulated' (default, offline template) or 'gemini';
+    the Gemini backend reads GEMINI_API_KEY, GEMINI_MODEL and LLM_BASE_URL (e.g. a
+    local llm_stub_server.py), and the client LLM_TIMEOUT_SECONDS, LLM_MAX_RETRIES
+    and LLM_MAX_CONCURRENCY.
+    """
+    backend_name = os.environ.get('ROADMAP_BACKEND', 'simulated')
+    if backend_name == 'gemini':
+        backend = GeminiBackend(
+            api_key=os.environ.get('GEMINI_API_KEY', ''),
+            model=os.environ.get('GEMINI_MODEL', GeminiBackend.DEFAULT_MODEL),
+            base_url=os.environ.get('LLM_BASE_URL', GeminiBackend.DEFAULT_BASE_URL),
+            pool_size=int(os.environ.get('LLM_MAX_CONCURRENCY', 8)),
+        )
+    elif backend_name == 'simulated':
+        backend = SimulatedBackend(lambda prompt, context: simulated_roadmap(**context),
+                                   lambda prompt, context: simulated_roadmap_sections(**context))
+    else:
+        raise ValueError(f"Unknown ROADMAP_BACKEND {backend_name!r}; use 'simulated' or 'gemini'")
+    return LLMClient(
+        backend,
+        timeout=float(os.environ.get('LLM_TIMEOUT_SECONDS', 30)),
+        max_retries=int(os.environ.get('LLM_MAX_RETRIES', 3)),
+        max_concurrency=int(os.environ.get('LLM_MAX_CONCURRENCY', 8)),
+    )
+
+
+def roadmap_args_for(request):
+    """ROADMAP_ARGS for a normalized `roadmap_cache.RoadmapRequest`."""
+    return dict(stream=request.stream, mcq_score=request.mcq_score, total_questions=request.total_questions,
+                strengths_input_str=request.strengths_input_str, expected_package_lpa=request.expected_package_lpa,
+                target_package_lpa=request.target_package_lpa, time_left_months=request.time_left_months)
+
+
+def generate_roadmap(client, **roadmap_args):
+    """Generates the roadmap for `roadmap_args` (see ROADMAP_ARGS) through `client`."""
+    with metrics.span('roadmap.generate'):
+        return client.generate(build_roadmap_prompt(**roadmap_args), context=roadmap_args)
+
+
+def stream_roadmap(client, **roadmap_args):
+    """Yields the roadmap for `roadmap_args` incrementally (sections offline, text pieces from Gemini)."""
+    with metrics.span('roadmap.stream'): # Until the last piece is yielded
+        yield from client.stream(build_roadmap_prompt(**roadmap_args), context=roadmap_args)
@@ -0,0 +1,263 @@
+# -*- coding: utf-8 -*-
+"""Bounded roadmap cache with normalized keys, LRU/TTL eviction and an optional SQLite backend.
+
+Roadmap inputs are normalized before they become a cache key: skills are reduced
+to a sorted, case-insensitive set, the estimated package is bucketed into bands
+and the months left are rounded down to a planning horizon. Near-identical
+requests therefore share one entry. The roadmap itself is generated from the
+normalized inputs, so a cached entry is correct for every request mapping to it.
+
+With a `path`, entries live in SQLite and survive restarts and are shared by all
+Streamlit worker processes; a small in-process LRU sits in front of it.
+"""
+
+import math
+import os
+import threading
+import time
+from collections import OrderedDict
+from contextlib import contextmanager
+
+PACKAGE_BAND_LPA = 2.0 # Width of an estimated-package band, e.g. 8-10 LPA
+MONTHS_BUCKETS = (1, 2, 3, 4, 5, 6, 9, 12, 18, 24, 36, 48) # Planning horizons, rounded down
+DEFAULT_MAX_ENTRIES = 1024
+DEFAULT_TTL_SECONDS = 7 * 24 * 3600
+DEFAULT_TOTAL_QUESTIONS = 20 # 10 domain + 10 coding/DSA questions per attempt
+
+
+# --- Key Normalization ---
+
+def canonical_skills(strengths_input_str):
+    """Sorted, case-insensitively de-duplicated skills; keeps the first spelling seen."""
+    seen = {}
+    for skill in (strengths_input_str or '').split(','):
+        skill = ' '.join(skill.split())
+        if skill and skill.casefold() not in seen:
+            seen[skill.casefold()] = skill
+    return tuple(seen[k] for k in sorted(seen))
+
+
+def package_band(expected_package_lpa, width=PACKAGE_BAND_LPA):
+    low = math.floor(float(expected_package_lpa) / width) * width
+    return low, low + width
+
+
+def months_bucket(time_left_months):
+    """Largest planning horizon not exceeding `time_left_months` (so the plan still fits)."""
+    months = int(time_left_months)
+    bucket = MONTHS_BUCKETS[0]
+    for b in MONTHS_BUCKETS:
+        if b <= months:
+            bucket = b
+    return bucket
+
+
+class RoadmapRequest:
+    """Normalized roadmap inputs; equal requests share a cache entry."""
+
+    __slots__ = ('stream', 'mcq_score', 'total_questions', 'skills', 'package_band', 'target_package_lpa',
+                 'time_left_months')
+
+    def __init__(self, stream, mcq_score, strengths_input_str, expected_package_lpa, target_package_lpa,
+                 time_left_months, total_questions=DEFAULT_TOTAL_QUESTIONS):
+        self.stream = stream
+        self.mcq_score = int(mcq_score)
+        self.total_questions = int(total_questions) # The prompt says "score/total", so it is part of the key
+        self.skills = canonical_skills(strengths_input_str)
+        self.package_band = package_band(expected_package_lpa)
+        self.target_package_lpa = round(float(target_package_lpa), 1)
+        self.time_left_months = months_bucket(time_left_months)
+
+    @property
+    def strengths_input_str(self):
+        return ', '.join(self.skills)
+
+    @property
+    def expected_package_lpa(self):
+        low, high = self.package_band
+        return f"{low:g}-{high:g}"
+
+    def cache_key(self):
+        return '|'.join([
+            self.stream,
+            f"{self.mcq_score}/{self.total_questions}",
+            ','.join(s.casefold() for s in self.skills),
+            self.expected_package_lpa,
+            f"{self.target_package_lpa:g}",
+            str(self.time_left_months),
+        ])
+
+    def __repr__(self):
+        return f"RoadmapRequest({self.cache_key()!r})"
+
+
+# --- Cache ---
+
+class RoadmapCache:
+    """LRU + TTL cache of generated roadmaps, optionally persisted to SQLite."""
+
+    def __init__(self, max_entries=DEFAULT_MAX_ENTRIES, ttl_seconds=DEFAULT_TTL_SECONDS, path=None,
+                 memory_entries=128):
+        self.max_entries = max_entries
+        self.ttl_seconds = ttl_seconds
+        self.path = path
+        self.memory_entries = memory_entries if path else max_entries
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self._memory = OrderedDict() # key -> (expires_at, value)
+        self._lock = threading.Lock()
+        if path:
+            with self._connect() as conn:
+                conn.execute('PRAGMA journal_mode=WAL')
+                conn.execute(
+                    'CREATE TABLE IF NOT EXISTS roadmap_cache ('
+                    ' key TEXT PRIMARY KEY, value TEXT NOT NULL,'
+                    ' expires_at REAL NOT NULL, last_access REAL NOT NULL)'
+                )
+                conn.execute('CREATE INDEX IF NOT EXISTS roadmap_cache_last_access ON roadmap_cache (last_access)')
+
+    @contextmanager
+    def _connect(self):
+        import sqlite3 # Only the shared on-disk cache needs it
+
+        # One short-lived connection per operation keeps this safe across threads and processes
+        conn = sqlite3.connect(self.path, timeout=10.0)
+        try:
+            with conn: # Commits on success, rolls back on error
+                yield conn
+        finally:
+            conn.close()
+
+    # --- Memory tier ---
+
+    def _memory_get(self, key, now):
+        entry = self._memory.get(key)
+        if entry is None:
+            return None
+        expires_at, value = entry
+        if expires_at <= now:
+            del self._memory[key]
+            self.evictions += 1
+            return None
+        self._memory.move_to_end(key)
+        return value
+
+    def _memory_set(self, key, value, expires_at):
+        self._memory[key] = (expires_at, value)
+        self._memory.move_to_end(key)
+        while len(self._memory) > self.memory_entries:
+            self._memory.popitem(last=False)
+            if not self.path:
+                self.evictions += 1
+
+    # --- SQLite tier ---
+
+    def _disk_get(self, key, now):
+        with self._connect() as conn:
+            row = conn.execute('SELECT value, expires_at FROM roadmap_cache WHERE key = ?', (key,)).fetchone()
+            if row is None:
+                return None, None
+            value, expires_at = row
+            if expires_at <= now:
+                conn.execute('DELETE FROM roadmap_cache WHERE key = ?', (key,))
+                self.evictions += 1
+                return None, None
+            conn.execute('UPDATE roadmap_cache SET last_access = ? WHERE key = ?', (now, key))
+            return value, expires_at
+
+    def _disk_set(self, key, value, expires_at, now):
+        with self._connect() as conn:
+            conn.execute('INSERT OR REPLACE INTO roadmap_cache VALUES (?, ?, ?, ?)', (key, value, expires_at, now))
+            expired = conn.execute('DELETE FROM roadmap_cache WHERE expires_at <= ?', (now,)).rowcount
+            overflow = conn.execute(
+                'DELETE FROM roadmap_cache WHERE key IN ('
+                ' SELECT key FROM roadmap_cache ORDER BY last_access DESC LIMIT -1 OFFSET ?)',
+                (self.max_entries,),
+            ).rowcount
+            self.evictions += expired + overflow
+
+    # --- Public API ---
+
+    def get(self, key):
+        """Cached roadmap for `key` (a RoadmapRequest or its cache_key()), or None."""
+        key = key.cache_key() if isinstance(key, RoadmapRequest) else key
+        now = time.time()
+        with self._lock:
+            value = self._memory_get(key, now)
+            if value is None and self.path:
+                value, expires_at = self._disk_get(key, now)
+                if value is not None:
+                    self._memory_set(key, value, expires_at)
+            if value is None:
+                self.misses += 1
+            else:
+                self.hits += 1
+            return value
+
+    def set(self, key, value):
+        key = key.cache_key() if isinstance(key, RoadmapRequest) else key
+        now = time.time()
+        expires_at = now + self.ttl_seconds
+        with self._lock:
+            self._memory_set(key, value, expires_at)
+            if self.path:
+                self._disk_set(key, value, expires_at, now)
+
+    def get_or_create(self, request, factory):
+        """Returns the cached roadmap for `request`, calling `factory(request)` on a miss."""
+        value = self.get(request)
+        if value is None:
+            value = factory(request)
+            if value is not None:
+                self.set(request, value)
+        return value
+
+    def stream_or_create(self, request, stream_factory):
+        """Streaming `get_or_create`: yields the cached roadmap, or the pieces of `stream_factory(request)`.
+
+        A streamed roadmap is cached only once it has been produced completely.
+        """
+        value = self.get(request)
+        if value is not None:
+            yield value
+            return
+        pieces = []
+        for piece in stream_factory(request):
+            pieces.append(piece)
+            yield piece
+        if pieces:
+            self.set(request, ''.join(pieces))
+
+    def clear(self):
+        with self._lock:
+            self._memory.clear()
+            if self.path:
+                with self._connect() as conn:
+                    conn.execute('DELETE FROM roadmap_cache')
+
+    def __len__(self):
+        if self.path:
+            with self._connect() as conn:
+                return conn.execute('SELECT COUNT(*) FROM roadmap_cache').fetchone()[0]
+        return len(self._memory)
+
+    def stats(self):
+        lookups = self.hits + self.misses
+        return {
+            'hits': self.hits,
+            'misses': self.misses,
+            'hit_rate': self.hits / lookups if lookups else 0.0,
+            'evictions': self.evictions,
+            'entries': len(self),
+            'backend': 'sqlite' if self.path else 'memory',
+        }
+
+
+def cache_from_env():
+    """RoadmapCache configured from ROADMAP_CACHE_PATH / _MAX_ENTRIES / _TTL_SECONDS."""
+    return RoadmapCache(
+        max_entries=int(os.environ.get('ROADMAP_CACHE_MAX_ENTRIES', DEFAULT_MAX_ENTRIES)),
+        ttl_seconds=float(os.environ.get('ROADMAP_CACHE_TTL_SECONDS', DEFAULT_TTL_SECONDS)),
+        path=os.environ.get('ROADMAP_CACHE_PATH') or None,
+    )
@@ -0,0 +1,177 @@
+# -*- coding: utf-8 -*-
+"""Skill normalization: free-text skill names -> the model's skill list.
+
+Every skill and its aliases ("py", "DS&A", "ML", "web dev", ...) are compiled
+into one dict keyed by a compact form of the name (case-folded, with spaces and
+punctuation other than '+', '#' and '&' dropped), so exact and alias matches are
+a single lookup. Misspellings fall back to fuzzy matching: character trigrams
+of the compact form select candidates through an inverted index, and a
+candidate is accepted when its trigram (Dice) similarity reaches
+`min_similarity`, or when the token is one edit away and no longer than it.
+Keys shorter than MIN_FUZZY_LENGTH are exact-match only: "web3" shares most
+trigrams with "web" but is not Web Development. Results are memoized per raw token,
+so batch inputs only pay for their distinct tokens.
+
+The compiled index is part of the feature schema, so it is saved with the model
+artifact and serving parses skills exactly as the artifact was built with.
+"""
+
+import re
+import threading
+
+SKILL_PARSER_VERSION = 1
+MIN_SIMILARITY = 0.6
+MIN_FUZZY_LENGTH = 4 # Shorter tokens ("c", "r", "go") are too ambiguous to fuzz
+MEMO_SIZE = 100_000
+
+# Canonical skill -> extra spellings people type; the skill name itself is always included
+SKILL_ALIASES = {
+    "Python": ["py", "python3", "python 3"],
+    "Java": ["core java", "java se", "j2ee", "java ee"],
+    "C++": ["cpp", "c plus plus", "cplusplus"],
+    "DSA": ["data structures", "data structure", "data structures and algorithms",
+            "data structures & algorithms", "ds&a", "ds and algo", "ds & algo", "ds algo"],
+    "Algorithms": ["algorithm", "algo", "algos", "algorithm design"],
+    "Web Development": ["web dev", "webdev", "web", "web developer", "full stack", "fullstack",
+                        "javascript", "js", "typescript", "html", "css"],
+    "Frontend": ["front end", "frontend development", "front end development", "react", "reactjs",
+                 "angular", "vue", "vuejs", "ui development"],
+    "Backend": ["back end", "backend development", "back end development", "node", "nodejs", "node.js",
+                "django", "flask", "spring", "spring boot", "rest api", "rest apis"],
+    "Machine Learning": ["ml", "machine learning engineering", "deep learning", "dl", "scikit-learn",
+                         "sklearn", "tensorflow", "pytorch"],
+    "AI": ["artificial intelligence", "gen ai", "genai", "generative ai", "llm", "llms", "nlp"],
+    "Cloud Computing": ["cloud", "gcp", "google cloud", "azure", "microsoft azure"],
+    "AWS": ["amazon web services", "ec2", "s3"],
+    "SQL": ["mysql", "postgresql", "postgres", "sqlite", "pl/sql", "plsql", "t-sql"],
+    "Database Management": ["dbms", "database", "databases", "rdbms", "database management systems",
+                            "mongodb", "nosql"],
+    "Operating Systems": ["os", "operating system", "linux", "unix"],
+    "Computer Networks": ["cn", "networking", "networks", "computer networking", "network"],
+    "Cybersecurity": ["cyber security", "security", "infosec", "information security", "ethical hacking",
+                      "network security"],
+    "DevOps": ["dev ops", "ci/cd", "cicd", "docker", "kubernetes", "k8s", "jenkins"],
+    "Competitive Programming": ["cp", "competitive coding", "codeforces", "codechef", "leetcode"],
+}
+
+_DROP = re.compile(r"[^0-9a-z+#&]")
+
+
+def compact(token):
+    """Case-folded token without spaces and punctuation ('Web-Dev' -> 'webdev', 'DS & A' -> 'ds&a')."""
+    return _DROP.sub('', token.casefold())
+
+
+def trigrams(key):
+    padded = f"  {key} "
+    return {padded[i:i + 3] for i in range(len(padded) - 2)}
+
+
+def within_one_edit(a, b):
+    """True if `a` and `b` differ by at most one insertion, deletion, substitution or transposition."""
+    if a == b:
+        return True
+    if abs(len(a) - len(b)) > 1:
+        return False
+    i = 0
+    while i < min(len(a), len(b)) and a[i] == b[i]:
+        i += 1
+    if len(a) == len(b):
+        return a[i + 1:] == b[i + 1:] or (a[i:i + 2] == b[i:i + 2][::-1] and a[i + 2:] == b[i + 2:])
+    return a[i:] == b[i + 1:] if len(a) < len(b) else a[i + 1:] == b[i:]
+
+
+class SkillParser:
+    """Resolves skill tokens to positions in `skills` (None if unknown)."""
+
+    def __init__(self, skills, aliases=SKILL_ALIASES, min_similarity=MIN_SIMILARITY, index=None):
+        self.skills = tuple(skills)
+        self.min_similarity = float(min_similarity)
+        if index is None:
+            index = {}
+            for position, skill in enumerate(self.skills):
+                for name in [skill, *aliases.get(skill, ())]:
+                    index.setdefault(compact(name), position)
+        self.index = dict(index) # compact key -> skill position
+
+        # Trigram -> keys containing it, for fuzzy candidate lookup
+        self._grams = {key: trigrams(key) for key in self.index if len(key) >= MIN_FUZZY_LENGTH}
+        self._postings = {}
+        for key, grams in self._grams.items():
+            for gram in grams:
+                self._postings.setdefault(gram, []).append(key)
+        self._memo = {}
+        self._lock = threading.Lock()
+
+    def __repr__(self):
+        return f"SkillParser({len(self.skills)} skills, {len(self.index)} keys)"
+
+    # --- Resolution ---
+
+    def _fuzzy(self, key):
+        grams = trigrams(key)
+        shared = {}
+        for gram in grams:
+            for candidate in self._postings.get(gram, ()):
+                shared[candidate] = shared.get(candidate, 0) + 1
+        best, best_score = None, 0.0
+        for candidate, count in shared.items():
+            score = 2.0 * count / (len(grams) + len(self._grams[candidate]))
+            if score < self.min_similarity and not (len(key) <= len(candidate) and within_one_edit(key, candidate)):
+                continue
+            if score > best_score:
+                best, best_score = candidate, score
+        return None if best is None else self.index[best]
+
+    def _resolve(self, token):
+        key = compact(token)
+        if not key:
+            return None
+        position = self.index.get(key)
+        if position is None and len(key) >= MIN_FUZZY_LENGTH:
+            position = self._fuzzy(key)
+        return position
+
+    def resolve(self, token):
+        """Skill position for one token, memoized."""
+        try:
+            return self._memo[token]
+        except KeyError:
+            pass
+        position = self._resolve(token)
+        with self._lock:
+            if len(self._memo) >= MEMO_SIZE:
+                self._memo.clear()
+            self._memo[token] = position
+        return position
+
+    def resolve_many(self, tokens):
+        """Positions for an iterable of tokens (-1 for unknown), resolving each distinct token once."""
+        resolve = self.resolve
+        return [-1 if position is None else position for position in map(resolve, tokens)]
+
+    def parse(self, text):
+        """Comma-separated skills -> (sorted known positions, unknown tokens)."""
+        known, unknown = set(), []
+        for token in text.split(',') if text else ():
+            token = token.strip()
+            if not token:
+                continue
+            position = self.resolve(token)
+            if position is None:
+                unknown.append(token)
+            else:
+                known.add(position)
+        return sorted(known), unknown
+
+    # --- Persistence ---
+
+    def to_dict(self):
+        return {'version': SKILL_PARSER_VERSION, 'min_similarity': self.min_similarity,
+                'index': dict(sorted(self.index.items()))}
+
+    @classmethod
+    def from_dict(cls, skills, data):
+        if data.get('version') != SKILL_PARSER_VERSION:
+            raise ValueError(f"Unsupported skill parser version: {data.get('version')!r}")
+        return cls(skills, min_similarity=data['min_similarity'], index=data['index'])
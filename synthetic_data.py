@@ -0,0 +1,143 @@
+# -*- coding: utf-8 -*-
+"""Synthetic placement data generation.
+
+Holds the dummy-data configuration and two generators with the same semantics:
+the original row-wise `generate_package` (kept for reference and benchmarking)
+and a NumPy-vectorized generator that emits the dataset in chunks.
+"""
+
+import numpy as np
+
+# --- Configuration for Dummy Data Generation ---
+
+NUM_SAMPLES = 1000 # Number of synthetic data points
+COMMON_SKILLS = [
+    "Python", "Java", "C++", "DSA", "Algorithms", "Web Development", "Frontend", "Backend",
+    "Machine Learning", "AI", "Cloud Computing", "AWS", "SQL", "Database Management",
+    "Operating Systems", "Computer Networks", "Cybersecurity", "DevOps", "Competitive Programming"
+]
+COLLEGE_TIERS = ["Tier 1", "Tier 2", "Tier 3"]
+COLLEGE_TIER_PROBS = [0.3, 0.4, 0.3]
+MIN_CGPA = 6.0
+MAX_CGPA = 10.0
+MIN_MCQ_SCORE = 0
+MAX_MCQ_SCORE = 20 # 10 domain + 10 coding/DSA
+BASE_PACKAGE_RANGE = (4.0, 25.0) # LPA in Lakhs per Annum
+
+# Package multiplier per tier, in COLLEGE_TIERS order
+TIER_MULTIPLIERS = np.array([1.5, 1.2, 1.0])
+MAX_PACKAGE = BASE_PACKAGE_RANGE[1] + 10.0 # Cap at max base + 10 LPA
+
+DEFAULT_CHUNK_SIZE = 1_000_000
+
+
+def skill_column(skill):
+    """Column name used for a skill in the training data (e.g. 'Web Development' -> 'web_development')."""
+    return skill.replace(" ", "_").lower()
+
+
+SKILL_COLUMNS = [skill_column(s) for s in COMMON_SKILLS]
+
+
+# --- Row-wise Package Generation Logic (Original) ---
+def generate_package(row):
+    package = np.random.uniform(BASE_PACKAGE_RANGE[0], BASE_PACKAGE_RANGE[1]) # Base random package
+
+    # Adjust based on CGPA
+    package += (row['CGPA'] - MIN_CGPA) * 0.8 # Higher CGPA, higher package
+
+    # Adjust based on College Tier
+    if row['College_Tier'] == 'Tier 1':
+        package *= 1.5 # Tier 1 gets significant boost
+    elif row['College_Tier'] == 'Tier 2':
+        package *= 1.2 # Tier 2 gets moderate boost
+    else: # Tier 3
+        package *= 1.0 # Base for Tier 3
+
+    # Adjust based on MCQ Score
+    package += (row['MCQ_Score'] / MAX_MCQ_SCORE) * 3.0 # Higher MCQ score, higher package
+
+    # Adjust based on skills (more skills = higher package)
+    skill_count = sum(row[skill_column(skill)] for skill in COMMON_SKILLS)
+    package += skill_count * 0.5 # Each skill adds 0.5 LPA
+
+    # Add some noise
+    package += np.random.normal(0, 0.5)
+
+    # Ensure package is within a reasonable range
+    package = max(BASE_PACKAGE_RANGE[0], min(package, MAX_PACKAGE))
+
+    return round(package, 2)
+
+
+def generate_dataframe_rowwise(num_samples=NUM_SAMPLES):
+    """Builds the dummy dataset the original way: global np.random plus a per-row `apply`."""
+    import pandas as pd
+
+    data = {
+        'CGPA': np.random.uniform(MIN_CGPA, MAX_CGPA, num_samples).round(1),
+        'College_Tier': np.random.choice(COLLEGE_TIERS, num_samples, p=COLLEGE_TIER_PROBS),
+        'MCQ_Score': np.random.randint(MIN_MCQ_SCORE, MAX_MCQ_SCORE + 1, num_samples),
+    }
+    for skill in COMMON_SKILLS:
+        data[skill_column(skill)] = np.random.randint(0, 2, num_samples)
+    df = pd.DataFrame(data)
+    df['Package_LPA'] = df.apply(generate_package, axis=1)
+    return df
+
+
+# --- Vectorized Generation ---
+def package_from_features(rng, cgpa, tier_idx, mcq_score, skill_count):
+    """Vectorized equivalent of `generate_package` over whole columns."""
+    n = len(cgpa)
+    package = rng.uniform(BASE_PACKAGE_RANGE[0], BASE_PACKAGE_RANGE[1], n)
+    package += (cgpa - MIN_CGPA) * 0.8
+    package *= TIER_MULTIPLIERS[tier_idx]
+    package += (mcq_score / MAX_MCQ_SCORE) * 3.0
+    package += skill_count * 0.5
+    package += rng.normal(0, 0.5, n)
+    np.clip(package, BASE_PACKAGE_RANGE[0], MAX_PACKAGE, out=package)
+    return package.round(2)
+
+
+def generate_chunk(rng, num_rows):
+    """Generates `num_rows` synthetic rows as a dict of NumPy columns.
+
+    Columns match the original dummy DataFrame ('CGPA', 'College_Tier', 'MCQ_Score',
+    one 0/1 column per skill, 'Package_LPA'), plus 'College_Tier_Idx', the index of
+    the tier in COLLEGE_TIERS.
+    """
+    cgpa = rng.uniform(MIN_CGPA, MAX_CGPA, num_rows).round(1)
+    tier_idx = rng.choice(len(COLLEGE_TIERS), num_rows, p=COLLEGE_TIER_PROBS).astype(np.int8)
+    mcq_score = rng.integers(MIN_MCQ_SCORE, MAX_MCQ_SCORE + 1, num_rows, dtype=np.int8)
+    skills = rng.integers(0, 2, (num_rows, len(COMMON_SKILLS)), dtype=np.uint8)
+    skill_count = skills.sum(axis=1, dtype=np.int16)
+
+    chunk = {
+        'CGPA': cgpa,
+        'College_Tier': np.asarray(COLLEGE_TIERS)[tier_idx],
+        'College_Tier_Idx': tier_idx,
+        'MCQ_Score': mcq_score,
+    }
+    for j, column in enumerate(SKILL_COLUMNS):
+        chunk[column] = skills[:, j]
+    chunk['Package_LPA'] = package_from_features(rng, cgpa, tier_idx, mcq_score, skill_count)
+    return chunk
+
+
+def iter_synthetic_chunks(rng, num_samples, chunk_size=DEFAULT_CHUNK_SIZE):
+    """Yields `generate_chunk` dicts until `num_samples` rows have been produced."""
+    remaining = num_samples
+    while remaining > 0:
+        n = min(chunk_size, remaining)
+        yield generate_chunk(rng, n)
+        remaining -= n
+
+
+def generate_dataframe(rng, num_samples=NUM_SAMPLES, chunk_size=DEFAULT_CHUNK_SIZE):
+    """Builds the dummy dataset as one DataFrame using the vectorized generator."""
+    import pandas as pd
+
+    frames = [pd.DataFrame(chunk) for chunk in iter_synthetic_chunks(rng, num_samples, chunk_size)]
+    df = pd.concat(frames, ignore_index=True) if len(frames) > 1 else frames[0]
+    return df.drop(columns='College_Tier_Idx')
@@ -0,0 +1,44 @@
+# -*- coding: utf-8 -*-
+"""Shared fixtures: a tiny forest trained on synthetic rows, so no test needs trained artifacts."""
+
+import os
+import sys
+
+import numpy as np
+import pytest
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from feature_schema import FeatureSchema  # noqa: E402
+from synthetic_data import generate_chunk  # noqa: E402
+
+
+def encoded_rows(schema, rng, n):
+    chunk = generate_chunk(rng, n)
+    X = schema.encode_batch(chunk['CGPA'], schema.tier_values(chunk['College_Tier']), chunk['MCQ_Score'],
+                            np.column_stack([chunk[c] for c in schema.skill_columns]))
+    return X, chunk['Package_LPA']
+
+
+@pytest.fixture(scope='session')
+def schema():
+    return FeatureSchema()
+
+
+@pytest.fixture(scope='session')
+def tiny_model(schema):
+    """(RandomForestRegressor, X_test) trained on 1,000 synthetic students."""
+    from sklearn.ensemble import RandomForestRegressor
+
+    rng = np.random.default_rng(0)
+    X_train, y_train = encoded_rows(schema, rng, 1_000)
+    X_test, _ = encoded_rows(schema, rng, 300)
+    model = RandomForestRegressor(n_estimators=5, random_state=0).fit(X_train, y_train)
+    return model, np.concatenate([X_test, X_train[:100]])
+
+
+@pytest.fixture(scope='session')
+def tiny_forest(tiny_model):
+    from tree_engine import export_forest
+
+    return export_forest(tiny_model[0])
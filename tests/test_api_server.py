@@ -0,0 +1,98 @@
+# -*- coding: utf-8 -*-
+"""Request validation of the HTTP API, against an in-process server with a tiny model."""
+
+import json
+import threading
+import urllib.error
+import urllib.request
+from http.server import ThreadingHTTPServer
+
+import pytest
+
+from api_server import ApiHandler, ApiServices
+from predictor import Predictor
+
+STREAM = 'Computer Science Engineering (CSE)'
+STUDENT = {'cgpa': 8.0, 'college_tier': 'Tier 2', 'skills': 'Python, SQL'}
+
+
+@pytest.fixture(scope='module')
+def api(tiny_forest, schema):
+    """Base URL of a server whose services hold the tiny forest (no LLM, no roadmap cache)."""
+    services = ApiServices()
+    services.predictor = Predictor(tiny_forest, schema)
+    services.ready.set()
+    server = ThreadingHTTPServer(('127.0.0.1', 0), ApiHandler)
+    server.daemon_threads = True
+    server.access_log = False
+    server.services = services
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    yield f"http://127.0.0.1:{server.server_address[1]}"
+    server.shutdown()
+    server.server_close()
+
+
+def call(api, path, body=None):
+    """(status, JSON body); POSTs `body` when given."""
+    data = None if body is None else json.dumps(body).encode('utf-8')
+    request = urllib.request.Request(api + path, data=data, headers={'Content-Type': 'application/json'})
+    try:
+        with urllib.request.urlopen(request, timeout=10) as response:
+            return response.status, json.load(response)
+    except urllib.error.HTTPError as e:
+        return e.code, json.load(e)
+
+
+def test_predict(api):
+    status, body = call(api, '/predict', dict(STUDENT, mcq_score=12))
+    assert status == 200
+    assert body['mcq_score'] == 12 and body['expected_package_lpa'] > 0
+
+
+@pytest.mark.parametrize('student, message', [
+    (dict(STUDENT, mcq_score=12, cgpa=11), 'cgpa'),
+    (dict(STUDENT, mcq_score=12, college_tier='Tier 9'), 'college_tier'),
+    (dict(STUDENT, mcq_score=21), 'mcq_score'),
+    (dict(STUDENT, mcq_score=-1), 'mcq_score'),
+    (dict(STUDENT, mcq_score=3, total_questions=0), 'total_questions'),
+    (dict(STUDENT, mcq_answers=[]), 'mcq_answers'),
+    (dict(STUDENT, mcq_answers={'stream': STREAM, 'seed': 1, 'answers': {'domain': 'A'}}), 'mcq_answers'),
+    (dict(STUDENT, mcq_answers={'stream': STREAM, 'seed': 1, 'answers': {'history': []}}), 'history'),
+    (dict(STUDENT), 'mcq_score'),
+])
+def test_predict_rejects_bad_input(api, student, message):
+    status, body = call(api, '/predict', student)
+    assert status == 400
+    assert message in body['error']
+
+
+def test_unknown_stream_is_404(api):
+    for answers in ({}, {'domain': []}):
+        status, body = call(api, '/predict', dict(STUDENT, mcq_answers={'stream': 'Nope', 'seed': 1,
+                                                                         'answers': answers}))
+        assert status == 404, body
+        assert 'no questions' in body['error']
+    status, _ = call(api, '/questions?stream=Nope')
+    assert status == 404
+
+
+def test_answers_score_like_plain_score(api):
+    status, assessment = call(api, '/questions?stream=' + urllib.request.quote(STREAM) + '&seed=7')
+    assert status == 200
+    answers = {category: [None] * len(questions) for category, questions in assessment['questions'].items()}
+    status, body = call(api, '/predict', dict(STUDENT, mcq_answers={'stream': STREAM, 'seed': 7, 'answers': answers}))
+    assert status == 200 and body['mcq_score'] == 0
+    assert body['expected_package_lpa'] == call(api, '/predict', dict(STUDENT, mcq_score=0))[1]['expected_package_lpa']
+
+
+def test_plain_score_is_rescaled(api):
+    _, out_of_20 = call(api, '/predict', dict(STUDENT, mcq_score=10))
+    _, out_of_10 = call(api, '/predict', dict(STUDENT, mcq_score=5, total_questions=10))
+    assert out_of_10['mcq_score'] == 5
+    assert out_of_10['expected_package_lpa'] == out_of_20['expected_package_lpa']
+
+
+def test_batch_reports_the_failing_student(api):
+    status, body = call(api, '/predict/batch', {'students': [dict(STUDENT, mcq_score=3), dict(STUDENT, mcq_score=30)]})
+    assert status == 400
+    assert body['error'].startswith('students[1]:')
@@ -0,0 +1,138 @@
+# -*- coding: utf-8 -*-
+"""LLM client: coalescing, the concurrency limit, retries and streaming, against the local stub server."""
+
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+import pytest
+
+from llm_client import GeminiBackend, LLMClient, LLMError, SimulatedBackend
+from llm_stub_server import start_stub_server
+
+
+@pytest.fixture
+def stub():
+    """Starts a stub server per test; call it with the server's options."""
+    servers = []
+
+    def start(**options):
+        servers.append(start_stub_server(**options))
+        return servers[-1]
+    yield start
+    for server in servers:
+        server.shutdown()
+        server.server_close()
+
+
+def make_client(server, **kwargs):
+    kwargs.setdefault('max_concurrency', 4)
+    return LLMClient(GeminiBackend(base_url=server.url, pool_size=kwargs['max_concurrency']),
+                     timeout=5.0, backoff_base=0.01, **kwargs)
+
+
+def test_identical_prompts_share_one_request(stub):
+    server = stub(delay=0.3)
+    client = make_client(server)
+    with ThreadPoolExecutor(10) as sessions:
+        results = list(sessions.map(lambda _: client.generate("same prompt"), range(10)))
+    assert len(set(results)) == 1 and 'same prompt' in results[0]
+    assert server.request_count == client.upstream_calls == 1
+    assert client.coalesced == 9 and client.stats()['inflight'] == 0
+
+
+def test_distinct_prompts_keep_their_order(stub):
+    client = make_client(stub())
+    prompts = [f"prompt {i}" for i in range(6)]
+    assert [f"prompt {i}" in text for i, text in enumerate(client.generate_many(prompts))] == [True] * 6
+
+
+def test_concurrency_is_bounded(stub):
+    server = stub(delay=0.1)
+    client = make_client(server, max_concurrency=2)
+    active, peak, lock = [0], [0], threading.Lock()
+    complete = client.backend.complete
+
+    def counting(*args):
+        with lock:
+            active[0] += 1
+            peak[0] = max(peak[0], active[0])
+        try:
+            return complete(*args)
+        finally:
+            with lock:
+                active[0] -= 1
+    client.backend.complete = counting
+    client.generate_many([f"prompt {i}" for i in range(6)])
+    assert peak[0] == 2
+
+
+def test_retries_transient_failures(stub):
+    server = stub(fail_first=2)
+    client = make_client(server, max_retries=3)
+    assert 'hello' in client.generate("hello")
+    assert client.upstream_calls == server.request_count == 3
+
+
+def test_gives_up_after_max_retries(stub):
+    server = stub(fail_first=10)
+    client = make_client(server, max_retries=1)
+    with pytest.raises(LLMError, match='503') as e:
+        client.generate("hello")
+    assert e.value.retryable and server.request_count == 2
+
+
+# --- Streaming ---
+
+def test_stream_yields_sections_in_order(stub):
+    client = make_client(stub())
+    pieces = list(client.stream("hello"))
+    assert len(pieces) > 1 and ''.join(pieces).rstrip() == client.generate("hello").rstrip()
+
+
+def test_stream_retries_before_the_first_piece(stub):
+    server = stub(fail_first=1)
+    client = make_client(server)
+    assert ''.join(client.stream("hello")).startswith('**Stub Roadmap**')
+    assert server.request_count == 2
+
+
+def test_stream_is_not_retried_once_started():
+    def render_stream(prompt, context):
+        yield 'first'
+        raise LLMError('connection dropped', retryable=True)
+    client = LLMClient(SimulatedBackend(None, render_stream), backoff_base=0.01)
+    stream = client.stream("hello")
+    assert next(stream) == 'first'
+    with pytest.raises(LLMError, match='dropped'):
+        next(stream)
+    assert client.upstream_calls == 1
+
+
+def test_closing_a_stream_stops_upstream_and_frees_the_worker(stub):
+    server = stub(chunk_delay=0.5)
+    client = make_client(server, max_concurrency=1)
+    stream = client.stream("hello")
+    next(stream)
+    stream.close()
+    start = time.perf_counter()
+    next(client.stream("again")) # Needs the only worker
+    assert time.perf_counter() - start < 1.5 # A full stub stream takes 3s
+    assert server.request_count == 2
+
+
+def test_closing_a_stream_closes_the_backend_stream():
+    closed, release = threading.Event(), threading.Event()
+
+    def render_stream(prompt, context):
+        try:
+            for i in range(100):
+                yield f"piece {i}"
+                release.wait(0.05)
+        finally:
+            closed.set()
+    client = LLMClient(SimulatedBackend(None, render_stream), max_concurrency=1)
+    stream = client.stream("hello")
+    assert next(stream) == 'piece 0'
+    stream.close()
+    assert closed.wait(2)
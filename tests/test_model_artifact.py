@@ -0,0 +1,70 @@
+# -*- coding: utf-8 -*-
+"""Serving artifact: round trip, rejection of corrupt or stale artifacts, and versioned publishing."""
+
+import json
+import os
+
+import numpy as np
+import pytest
+
+from model_artifact import ARTIFACT_META, ArtifactError, load_artifact, save_artifact
+
+
+def hidden_versions(tmp_path):
+    return sorted(entry for entry in os.listdir(tmp_path) if entry.startswith('.artifact.'))
+
+
+def test_round_trip(tmp_path, tiny_forest, tiny_model, schema):
+    save_artifact(tiny_forest, schema, tmp_path / 'artifact', config_hash='abc')
+    forest, loaded_schema, meta = load_artifact(tmp_path / 'artifact', config_hash='abc')
+    X = tiny_model[1]
+    assert np.array_equal(forest.predict_trees(X), tiny_forest.predict_trees(X))
+    assert loaded_schema == schema and meta['n_trees'] == tiny_forest.n_trees
+
+
+def test_rejects_a_stale_artifact(tmp_path, tiny_forest, schema):
+    save_artifact(tiny_forest, schema, tmp_path / 'artifact', config_hash='old')
+    with pytest.raises(ArtifactError, match='Stale'):
+        load_artifact(tmp_path / 'artifact', config_hash='new')
+
+
+def test_rejects_a_corrupt_array(tmp_path, tiny_forest, schema):
+    save_artifact(tiny_forest, schema, tmp_path / 'artifact')
+    path = os.path.join(os.path.realpath(tmp_path / 'artifact'), 'threshold.npy')
+    with open(path, 'r+b') as f:
+        f.seek(-8, os.SEEK_END)
+        f.write(np.float64(12345.0).tobytes())
+    with pytest.raises(ArtifactError, match='Checksum'):
+        load_artifact(tmp_path / 'artifact')
+    load_artifact(tmp_path / 'artifact', verify=False) # Only the checksum catches it
+
+
+def test_rejects_another_format_version(tmp_path, tiny_forest, schema):
+    save_artifact(tiny_forest, schema, tmp_path / 'artifact')
+    meta_path = tmp_path / 'artifact' / ARTIFACT_META
+    meta = json.loads(meta_path.read_text())
+    meta_path.write_text(json.dumps(dict(meta, version=meta['version'] + 1)))
+    with pytest.raises(ArtifactError, match='Unsupported'):
+        load_artifact(tmp_path / 'artifact')
+
+
+def test_publish_keeps_the_replaced_version_for_readers(tmp_path, tiny_forest, tiny_model, schema):
+    save_artifact(tiny_forest, schema, tmp_path / 'artifact')
+    resolved_before_swap = os.path.realpath(tmp_path / 'artifact')
+    save_artifact(tiny_forest, schema, tmp_path / 'artifact')
+    forest, _, _ = load_artifact(resolved_before_swap) # A reader that resolved the link before the swap
+    assert np.array_equal(forest.predict(tiny_model[1]), tiny_forest.predict(tiny_model[1]))
+    assert len(hidden_versions(tmp_path)) == 2
+
+    save_artifact(tiny_forest, schema, tmp_path / 'artifact')
+    assert len(hidden_versions(tmp_path)) == 2 # Older versions are removed on the next publish
+    assert not os.path.exists(resolved_before_swap)
+
+
+def test_publish_replaces_a_plain_directory(tmp_path, tiny_forest, schema):
+    (tmp_path / 'artifact').mkdir()
+    (tmp_path / 'artifact' / 'stale.npy').write_bytes(b'')
+    save_artifact(tiny_forest, schema, tmp_path / 'artifact')
+    assert os.path.islink(tmp_path / 'artifact')
+    assert not os.path.exists(tmp_path / 'artifact' / 'stale.npy')
+    load_artifact(tmp_path / 'artifact')
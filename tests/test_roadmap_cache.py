@@ -0,0 +1,86 @@
+# -*- coding: utf-8 -*-
+"""Roadmap cache: key normalization and LRU/TTL eviction, in memory and in SQLite."""
+
+import types
+
+import pytest
+
+import roadmap_cache
+from roadmap_cache import RoadmapCache, RoadmapRequest
+
+
+@pytest.fixture
+def clock(monkeypatch):
+    """A manual clock for the cache module; advance it with `clock.now += seconds`."""
+    clock = types.SimpleNamespace(now=1_000_000.0)
+    clock.time = lambda: clock.now
+    monkeypatch.setattr(roadmap_cache, 'time', clock)
+    return clock
+
+
+@pytest.fixture(params=['memory', 'sqlite'])
+def make_cache(request, tmp_path):
+    def make(**kwargs):
+        if request.param == 'sqlite':
+            kwargs.setdefault('memory_entries', 1) # Lookups mostly go to disk
+            return RoadmapCache(path=str(tmp_path / 'roadmaps.sqlite'), **kwargs)
+        return RoadmapCache(**kwargs)
+    return make
+
+
+def request(skills='Python, SQL', expected=8.4, months=7, mcq=12, total=20):
+    return RoadmapRequest('CSE', mcq, skills, expected, 15, months, total)
+
+
+def test_near_identical_requests_share_a_key():
+    assert request('Python, SQL', 8.4, 7).cache_key() == request(' sql ,python,PYTHON', 9.9, 8).cache_key()
+    assert request(expected=10.1).cache_key() != request(expected=9.9).cache_key()
+    assert request(mcq=5, total=10).cache_key() != request(mcq=5, total=20).cache_key()
+
+
+def test_least_recently_used_entry_is_evicted(make_cache, clock):
+    cache = make_cache(max_entries=2)
+    for key in 'ab':
+        cache.set(key, key.upper())
+        clock.now += 1
+    assert cache.get('a') == 'A' # 'b' is now the least recently used
+    clock.now += 1
+    cache.set('c', 'C')
+    assert cache.get('b') is None
+    assert cache.get('a') == 'A' and cache.get('c') == 'C'
+    assert len(cache) == 2 and cache.stats()['evictions'] == 1
+
+
+def test_entries_expire(make_cache, clock):
+    cache = make_cache(ttl_seconds=60)
+    cache.set('a', 'A')
+    clock.now += 59
+    assert cache.get('a') == 'A'
+    clock.now += 2
+    assert cache.get('a') is None
+    assert cache.stats()['evictions'] >= 1
+
+
+def test_get_or_create_calls_the_factory_once(make_cache):
+    cache = make_cache()
+    calls = []
+    factory = lambda r: calls.append(r) or f"roadmap for {r.strengths_input_str}"  # noqa: E731
+    assert cache.get_or_create(request('Python, SQL'), factory) == 'roadmap for Python, SQL'
+    assert cache.get_or_create(request('sql, python'), factory) == 'roadmap for Python, SQL'
+    assert len(calls) == 1 and cache.stats()['hits'] == 1
+
+
+def test_a_stream_is_cached_only_when_complete(make_cache):
+    cache = make_cache()
+    stream = cache.stream_or_create(request(), lambda r: iter(['one ', 'two']))
+    assert next(stream) == 'one '
+    stream.close() # Abandoned halfway
+    assert cache.get(request()) is None
+    assert ''.join(cache.stream_or_create(request(), lambda r: iter(['one ', 'two']))) == 'one two'
+    assert list(cache.stream_or_create(request(), None)) == ['one two']
+
+
+def test_sqlite_entries_are_shared(tmp_path):
+    path = str(tmp_path / 'roadmaps.sqlite')
+    RoadmapCache(path=path).set('a', 'A')
+    assert RoadmapCache(path=path).get('a') == 'A'
@@ -0,0 +1,24 @@
+# -*- coding: utf-8 -*-
+"""Skill parsing: aliases and typos resolve, near-miss names of other things don't."""
+
+import pytest
+
+
+@pytest.mark.parametrize('token, skill', [
+    ('python', 'Python'), ('py', 'Python'), ('Pyhton', 'Python'), ('Pythn', 'Python'),
+    ('web dev', 'Web Development'), ('Web-Dev', 'Web Development'), ('DS & A', 'DSA'),
+    ('Javs', 'Java'), ('Machine Lerning', 'Machine Learning'), ('kubernets', 'DevOps'),
+])
+def test_resolves(schema, token, skill):
+    assert schema.skills[schema.skill_parser.resolve(token)] == skill
+
+
+@pytest.mark.parametrize('token', ['Web3', 'Sqll', 'Rust', 'Go', 'Excel', 'C#', 'Git', ''])
+def test_stays_unknown(schema, token):
+    assert schema.skill_parser.resolve(token) is None
+
+
+def test_parse_splits_known_and_unknown(schema):
+    known, unknown = schema.skill_parser.parse('Python, Web3, , sql')
+    assert [schema.skills[p] for p in known] == sorted(['Python', 'SQL'], key=schema.skills.index)
+    assert unknown == ['Web3']
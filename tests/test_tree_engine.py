@@ -0,0 +1,37 @@
+# -*- coding: utf-8 -*-
+"""FlatForest gives exactly what scikit-learn gives, for every tree and every row."""
+
+import numpy as np
+import pytest
+
+from tree_engine import export_forest
+
+
+def test_predict_matches_sklearn(tiny_model, tiny_forest):
+    model, X = tiny_model
+    assert np.allclose(tiny_forest.predict(X), model.predict(X), rtol=1e-9, atol=1e-9)
+
+
+def test_predict_trees_matches_each_estimator(tiny_model, tiny_forest):
+    model, X = tiny_model
+    expected = np.column_stack([est.predict(X) for est in model.estimators_])
+    assert np.allclose(tiny_forest.predict_trees(X), expected, rtol=1e-9, atol=1e-9)
+
+
+def test_single_rows(tiny_model, tiny_forest):
+    model, X = tiny_model
+    for i in range(0, len(X), 37):
+        assert np.allclose(tiny_forest.predict(X[i]), model.predict(X[i:i + 1]), rtol=1e-9, atol=1e-9)
+
+
+@pytest.mark.parametrize('max_depth, min_samples_leaf', [(3, 1), (None, 25)])
+def test_shallow_and_coarse_trees(tiny_model, max_depth, min_samples_leaf):
+    from sklearn.ensemble import RandomForestRegressor
+
+    _, X = tiny_model
+    y = X[:, 0] * 2 + X[:, 2] # Any target; only the tree shapes matter here
+    model = RandomForestRegressor(n_estimators=4, max_depth=max_depth, min_samples_leaf=min_samples_leaf,
+                                  random_state=0).fit(X, y)
+    forest = export_forest(model)
+    assert forest.n_trees == 4
+    assert np.allclose(forest.predict(X), model.predict(X), rtol=1e-9, atol=1e-9)
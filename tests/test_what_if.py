@@ -0,0 +1,32 @@
+# -*- coding: utf-8 -*-
+"""What-if grid: MCQ rescaling and the scenarios it emits."""
+
+import numpy as np
+
+from feature_schema import CGPA_IDX, MCQ_IDX
+from what_if import scenario_grid, what_if
+
+
+def test_scores_are_rescaled_like_the_api(schema):
+    X, kinds, labels = scenario_grid(schema, 7.0, 'Tier 2', 5, max_mcq_score=10)
+    assert X[0, MCQ_IDX] == schema.model_mcq_score(5, 10) == 10
+    mcq = [(label, row[MCQ_IDX]) for kind, label, row in zip(kinds, labels, X) if kind == 'mcq']
+    assert mcq == [('MCQ score 1/10 (-4)', 2), ('MCQ score 3/10 (-2)', 6),
+                   ('MCQ score 7/10 (+2)', 14), ('MCQ score 9/10 (+4)', 18)]
+
+
+def test_same_student_same_estimate_for_any_bank_size(tiny_forest, schema):
+    out_of_20 = what_if(tiny_forest, schema, 7.0, 'Tier 2', 10, ['Python'])
+    out_of_10 = what_if(tiny_forest, schema, 7.0, 'Tier 2', 5, ['Python'], max_mcq_score=10)
+    assert out_of_10.mean[0] == out_of_20.mean[0]
+
+
+def test_clipped_steps_are_emitted_once_with_their_real_change(schema):
+    X, kinds, labels = scenario_grid(schema, 9.8, 'Tier 1', 19)
+    cgpa = [label for kind, label in zip(kinds, labels) if kind == 'cgpa']
+    mcq = [label for kind, label in zip(kinds, labels) if kind == 'mcq']
+    assert cgpa == ['CGPA 8.8 (-1.0)', 'CGPA 9.3 (-0.5)', 'CGPA 10.0 (+0.2)']
+    assert mcq == ['MCQ score 15/20 (-4)', 'MCQ score 17/20 (-2)', 'MCQ score 20/20 (+1)']
+    rows = [tuple(row) for row in X]
+    assert len(set(rows)) == len(rows)
+    assert np.isclose(X[1:, CGPA_IDX], 9.8).sum() == len(X) - 1 - len(cgpa)
@@ -0,0 +1,117 @@
+# -*- coding: utf-8 -*-
+"""Flattened tree-ensemble inference for the package predictor.
+
+`export_forest` copies every tree of a fitted RandomForestRegressor into five
+contiguous NumPy arrays (feature, threshold, left, right, value) indexed by a
+global node id. `FlatForest.predict` then walks all trees for a whole batch of
+rows at once, one vectorized step per tree level, without scikit-learn's
+per-call validation or its Python loop over estimators.
+"""
+
+import numpy as np
+
+FEATURE_DTYPE = np.float32 # scikit-learn casts X to float32 before walking its trees
+BLOCK_ROWS = 4096 # Rows walked together; bounds the (rows x trees) working set
+
+
+class FlatForest:
+    """A tree ensemble stored as flat node arrays.
+
+    Both children of node n are interleaved in `children` at 2n (left) and 2n + 1
+    (right), so a walk step is a single gather. Leaves point to themselves, so
+    every row can be advanced `max_depth` times without masking out rows that
+    already reached a leaf. Arrays already in this layout (e.g. memory-mapped
+    from a model artifact) are used as-is, without copying.
+    """
+
+    def __init__(self, feature, threshold, children, value, roots, max_depth):
+        # intp indices: no cast inside np.take
+        self.feature = np.ascontiguousarray(feature, dtype=np.intp)
+        self.threshold = np.ascontiguousarray(threshold, dtype=np.float64)
+        self.children = np.ascontiguousarray(children, dtype=np.intp)
+        self.value = np.ascontiguousarray(value, dtype=np.float64)
+        self.roots = np.ascontiguousarray(roots, dtype=np.intp)
+        self.max_depth = int(max_depth)
+
+    @classmethod
+    def from_children(cls, feature, threshold, left, right, value, roots, max_depth):
+        children = np.stack([left, right], axis=1).ravel()
+        return cls(feature, threshold, children, value, roots, max_depth)
+
+    @property
+    def left(self):
+        return self.children[0::2]
+
+    @property
+    def right(self):
+        return self.children[1::2]
+
+    @property
+    def n_trees(self):
+        return len(self.roots)
+
+    @property
+    def n_nodes(self):
+        return len(self.feature)
+
+    def __repr__(self):
+        return f"FlatForest({self.n_trees} trees, {self.n_nodes} nodes, max_depth={self.max_depth})"
+
+    def apply(self, X):
+        """Leaf node id reached in every tree, shape (n_rows, n_trees)."""
+        X = np.ascontiguousarray(X, dtype=FEATURE_DTYPE)
+        if X.ndim == 1:
+            X = X.reshape(1, -1)
+        leaves = np.empty((X.shape[0], self.n_trees), dtype=np.int32)
+        for start in range(0, X.shape[0], BLOCK_ROWS):
+            block = X[start:start + BLOCK_ROWS]
+            leaves[start:start + len(block)] = self._walk(block)
+        return leaves
+
+    def _walk(self, X):
+        n_rows, n_features = X.shape
+        flat_X = X.ravel()
+        row_base = (np.arange(n_rows, dtype=np.intp) * n_features)[:, None]
+        nodes = np.broadcast_to(self.roots, (n_rows, self.n_trees)).copy()
+        for _ in range(self.max_depth):
+            x = np.take(flat_X, row_base + np.take(self.feature, nodes))
+            go_right = x > np.take(self.threshold, nodes)
+            nodes = np.take(self.children, 2 * nodes + go_right)
+        return nodes
+
+    def predict_trees(self, X):
+        """Per-tree predictions, shape (n_rows, n_trees)."""
+        return np.take(self.value, self.apply(X))
+
+    def predict(self, X):
+        """Forest prediction (mean over trees), matching RandomForestRegressor.predict."""
+        return self.predict_trees(X).mean(axis=1)
+
+
+def export_forest(model):
+    """Flattens a fitted single-output RandomForestRegressor into a FlatForest."""
+    estimators = model.estimators_
+    sizes = [est.tree_.node_count for est in estimators]
+    roots = np.concatenate(([0], np.cumsum(sizes)[:-1])).astype(np.int32)
+    total = int(sum(sizes))
+
+    feature = np.empty(total, dtype=np.int32)
+    threshold = np.empty(total, dtype=np.float64)
+    left = np.empty(total, dtype=np.int32)
+    right = np.empty(total, dtype=np.int32)
+    value = np.empty(total, dtype=np.float64)
+
+    for est, offset, size in zip(estimators, roots, sizes):
+        tree = est.tree_
+        span = slice(offset, offset + size)
+        node_ids = np.arange(offset, offset + size, dtype=np.int32)
+        is_leaf = tree.children_left == -1
+
+        feature[span] = np.where(is_leaf, 0, tree.feature)
+        threshold[span] = np.where(is_leaf, np.inf, tree.threshold)
+        left[span] = np.where(is_leaf, node_ids, tree.children_left + offset)
+        right[span] = np.where(is_leaf, node_ids, tree.children_right + offset)
+        value[span] = tree.value[:, 0, 0]
+
+    max_depth = max(est.tree_.max_depth for est in estimators)
+    return FlatForest.from_children(feature, threshold, left, right, value, roots, max_depth)
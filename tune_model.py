@@ -0,0 +1,153 @@
+# -*- coding: utf-8 -*-
+"""Accuracy vs. serving-cost sweep for the package predictor.
+
+Trains one forest per combination of `--n-estimators`, `--max-depth` and
+`--min-samples-leaf` on a train split of the synthetic data and, for each,
+records held-out R^2 and MAE, the serving artifact's size and load time, and
+p50/p99 single-row predict latency through the flat-forest engine the app uses.
+The recommendation is the smallest artifact whose held-out R^2 is within
+`--tolerance` of the best one, printed as a `prepare_model_data.py` command for
+the same `--num-samples` and `--seed`:
+    python tune_model.py --num-samples 20000 --max-depth none,8,12 --tolerance 0.01
+    python tune_model.py --results tuning.json
+"""
+
+import argparse
+import itertools
+import json
+import os
+import tempfile
+import time
+
+import numpy as np
+
+from dataset_store import generate_dataset
+from feature_schema import FeatureSchema
+from model_artifact import load_artifact, save_artifact
+from prepare_model_data import seed_streams
+from synthetic_data import COMMON_SKILLS
+from tree_engine import export_forest
+
+
+def int_list(text):
+    """'25,50,none' -> [25, 50, None]."""
+    return [None if item.strip().lower() == 'none' else int(item) for item in text.split(',')]
+
+
+def directory_size(directory):
+    return sum(entry.stat().st_size for entry in os.scandir(directory))
+
+
+def single_row_latencies(forest, X, calls):
+    """Seconds per `forest.predict` call on one row, cycling through X."""
+    latencies = np.empty(calls)
+    for i in range(calls):
+        row = X[i % len(X):i % len(X) + 1]
+        start = time.perf_counter()
+        forest.predict(row)
+        latencies[i] = time.perf_counter() - start
+    return latencies
+
+
+def evaluate(params, X_train, y_train, X_test, y_test, schema, args):
+    """Fits one configuration and measures it; returns a result dict."""
+    from sklearn.ensemble import RandomForestRegressor
+    from sklearn.metrics import mean_absolute_error, r2_score
+
+    model = RandomForestRegressor(random_state=args.random_state, n_jobs=args.n_jobs, **params)
+    start = time.perf_counter()
+    model.fit(X_train, y_train)
+    train_secs = time.perf_counter() - start
+
+    with tempfile.TemporaryDirectory() as tmp:
+        directory = os.path.join(tmp, 'artifact') # Published as a symlink to a versioned sibling
+        save_artifact(export_forest(model), schema, directory)
+        size = directory_size(directory)
+        load_secs = []
+        for _ in range(args.load_runs):
+            start = time.perf_counter()
+            forest, _, _ = load_artifact(directory)
+            load_secs.append(time.perf_counter() - start)
+        predictions = forest.predict(X_test)
+        latencies = single_row_latencies(forest, X_test, args.latency_calls)
+        n_nodes = forest.n_nodes
+        del forest # Release the mapped files before the directory is removed
+
+    return dict(params,
+                r2=float(r2_score(y_test, predictions)),
+                mae=float(mean_absolute_error(y_test, predictions)),
+                artifact_bytes=size,
+                n_nodes=n_nodes,
+                load_ms=float(np.median(load_secs) * 1e3),
+                p50_us=float(np.percentile(latencies, 50) * 1e6),
+                p99_us=float(np.percentile(latencies, 99) * 1e6),
+                train_seconds=round(train_secs, 3))
+
+
+def pick_smallest(results, tolerance):
+    """Smallest artifact (then fastest p50) whose R^2 is within `tolerance` of the best."""
+    best_r2 = max(r['r2'] for r in results)
+    eligible = [r for r in results if r['r2'] >= best_r2 - tolerance]
+    return min(eligible, key=lambda r: (r['artifact_bytes'], r['p50_us']))
+
+
+def parse_args(argv=None):
+    parser = argparse.ArgumentParser(description="Sweep forest size against held-out accuracy and serving cost.")
+    parser.add_argument('--num-samples', type=int, default=20_000)
+    parser.add_argument('--seed', type=int, default=42, help="Seed for the data, the split and the forests.")
+    parser.add_argument('--random-state', type=int, help="RandomForest random_state (default: derived from --seed).")
+    parser.add_argument('--test-size', type=float, default=0.2)
+    parser.add_argument('--n-estimators', type=int_list, default='25,50,100')
+    parser.add_argument('--max-depth', type=int_list, default='none,8,12,16')
+    parser.add_argument('--min-samples-leaf', type=int_list, default='1,5,20')
+    parser.add_argument('--tolerance', type=float, default=0.01, help="Allowed held-out R^2 drop from the best.")
+    parser.add_argument('--latency-calls', type=int, default=300, help="Single-row predictions timed per config.")
+    parser.add_argument('--load-runs', type=int, default=5)
+    parser.add_argument('--n-jobs', type=int, default=-1)
+    parser.add_argument('--results', help="Write all results and the pick to this JSON file.")
+    return parser.parse_args(argv)
+
+
+def main(argv=None):
+    args = parse_args(argv)
+    from sklearn.model_selection import train_test_split
+
+    schema = FeatureSchema(COMMON_SKILLS)
+    data_rng, _, forest_seed = seed_streams(args.seed)
+    if args.random_state is None:
+        args.random_state = forest_seed
+    dataset = generate_dataset(data_rng, args.num_samples, schema)
+    X_train, X_test, y_train, y_test = train_test_split(
+        dataset.features(schema), dataset.target(), test_size=args.test_size, random_state=args.random_state)
+
+    grid = [dict(n_estimators=n, max_depth=d, min_samples_leaf=leaf)
+            for n, d, leaf in itertools.product(args.n_estimators, args.max_depth, args.min_samples_leaf)]
+    print(f"{len(grid)} configurations, {len(X_train):,} train / {len(X_test):,} held-out rows\n")
+    print(f"{'trees':>5} {'depth':>5} {'leaf':>4} | {'R^2':>6} {'MAE':>6} | {'size MB':>8} {'load ms':>8} "
+          f"{'p50 us':>8} {'p99 us':>8}")
+    results = []
+    for params in grid:
+        r = evaluate(params, X_train, y_train, X_test, y_test, schema, args)
+        results.append(r)
+        print(f"{r['n_estimators']:>5} {str(r['max_depth']):>5} {r['min_samples_leaf']:>4} | "
+              f"{r['r2']:6.3f} {r['mae']:6.2f} | {r['artifact_bytes'] / 1e6:8.2f} {r['load_ms']:8.2f} "
+              f"{r['p50_us']:8.0f} {r['p99_us']:8.0f}")
+
+    pick = pick_smallest(results, args.tolerance)
+    best = max(results, key=lambda r: r['r2'])
+    print(f"\nBest held-out R^2 {best['r2']:.3f}; smallest model within {args.tolerance}: "
+          f"R^2 {pick['r2']:.3f}, {pick['artifact_bytes'] / 1e6:.2f} MB, p50 {pick['p50_us']:.0f} us")
+    # Same data size and seed as the sweep: the best depth and leaf size depend on the row count
+    command = f"python prepare_model_data.py --num-samples {args.num_samples} --seed {args.seed} " \
+              f"--n-estimators {pick['n_estimators']} --min-samples-leaf {pick['min_samples_leaf']}"
+    if pick['max_depth'] is not None:
+        command += f" --max-depth {pick['max_depth']}"
+    print(f"Train it with: {command}")
+
+    if args.results:
+        with open(args.results, 'w', encoding='utf-8') as f:
+            json.dump({'args': vars(args), 'results': results, 'pick': pick}, f, indent=2)
+
+
+if __name__ == '__main__':
+    main()
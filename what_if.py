@@ -0,0 +1,100 @@
+# -*- coding: utf-8 -*-
+"""What-if scenarios and a prediction range for one student, in one forest pass.
+
+`what_if` encodes the student's row and every single-change variant of it
+(each skill they don't list yet, CGPA and MCQ score a few steps up or down, the
+other college tiers) into one feature matrix, walks all trees over it once
+(`FlatForest.predict_trees`) and returns, per row, the forest's estimate (the
+mean over trees) and a percentile band over the individual trees' predictions.
+The band is the spread of the forest, not a calibrated interval.
+"""
+
+import numpy as np
+
+import metrics
+from feature_schema import CGPA_IDX, MCQ_IDX, TIER_IDX
+
+CGPA_STEPS = (-1.0, -0.5, 0.5, 1.0)
+MCQ_STEPS = (-4, -2, 2, 4)
+BAND_PERCENTILES = (10, 90)
+
+
+class WhatIfResult:
+    """Estimates for the student (row 0) and each scenario, with per-tree percentile bands."""
+
+    __slots__ = ('kinds', 'labels', 'mean', 'low', 'high')
+
+    def __init__(self, kinds, labels, mean, low, high):
+        self.kinds = kinds # 'current', 'skill', 'cgpa', 'mcq' or 'tier'
+        self.labels = labels
+        self.mean = mean
+        self.low = low
+        self.high = high
+
+    def __len__(self):
+        return len(self.labels)
+
+    @property
+    def delta(self):
+        """Change of each estimate against the student's current one."""
+        return self.mean - self.mean[0]
+
+    def scenarios(self, kind=None, top=None):
+        """(label, estimate, delta, low, high) per scenario, largest gain first."""
+        rows = [i for i in range(1, len(self)) if kind is None or self.kinds[i] == kind]
+        rows.sort(key=lambda i: -self.delta[i])
+        return [(self.labels[i], self.mean[i], self.delta[i], self.low[i], self.high[i]) for i in rows[:top]]
+
+
+def scenario_grid(schema, cgpa, college_tier, mcq_score, skills=(), max_mcq_score=20):
+    """(X, kinds, labels): the student's encoded row followed by one row per single change.
+
+    `mcq_score` is out of `max_mcq_score` questions; labels keep that scale and the
+    rows are rescaled to the model's (`FeatureSchema.model_mcq_score`).
+    """
+    base = schema.encode(cgpa, college_tier, schema.model_mcq_score(mcq_score, max_mcq_score), skills)
+    kinds, labels, changes = ['current'], ["Current inputs"], [None]
+
+    for position, skill in enumerate(schema.skills):
+        column = schema.skill_offset + position
+        if not base[0, column]:
+            kinds.append('skill')
+            labels.append(f"Add {skill}")
+            changes.append((column, 1))
+    current, seen = round(float(cgpa), 1), set()
+    for step in CGPA_STEPS:
+        value = round(min(max(current + step, 0.0), 10.0), 1)
+        if value != current and value not in seen: # Steps clipped at 0 or 10 land on the same value
+            seen.add(value)
+            kinds.append('cgpa')
+            labels.append(f"CGPA {value:.1f} ({value - current:+.1f})")
+            changes.append((CGPA_IDX, value))
+    current, seen = int(mcq_score), set()
+    for step in MCQ_STEPS:
+        value = min(max(current + step, 0), max_mcq_score)
+        if value != current and value not in seen:
+            seen.add(value)
+            kinds.append('mcq')
+            labels.append(f"MCQ score {value}/{max_mcq_score} ({value - current:+d})")
+            changes.append((MCQ_IDX, schema.model_mcq_score(value, max_mcq_score)))
+    for tier, value in schema.tier_mapping.items():
+        if value != base[0, TIER_IDX]:
+            kinds.append('tier')
+            labels.append(f"{tier} college")
+            changes.append((TIER_IDX, value))
+
+    X = np.repeat(base, len(changes), axis=0)
+    for row, change in enumerate(changes[1:], start=1):
+        column, value = change
+        X[row, column] = value
+    return X, kinds, labels
+
+
+def what_if(forest, schema, cgpa, college_tier, mcq_score, skills=(), max_mcq_score=20,
+            percentiles=BAND_PERCENTILES):
+    """Scores the student and every scenario of `scenario_grid` with one `predict_trees` call."""
+    X, kinds, labels = scenario_grid(schema, cgpa, college_tier, mcq_score, skills, max_mcq_score)
+    with metrics.span('what_if.predict_trees'):
+        per_tree = forest.predict_trees(X) # (rows, trees)
+    low, high = np.percentile(per_tree, percentiles, axis=1)
+    return WhatIfResult(kinds, labels, per_tree.mean(axis=1), low, high)